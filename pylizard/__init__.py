@@ -0,0 +1,22 @@
+"""
+PyLizard — mouse follow karne wali realistic lizard (Tkinter).
+
+Modules:
+    config    settings + quality presets
+    util      math / color helpers
+    palette   skin colors, per-segment palette tables
+    sim       Lizard physics, swarm, scheduler, input trace, latency
+    geometry  spine geometry kernel, head mesh
+    threads   simulation worker thread
+    scene     retained scene, dirty tracking, display list
+    render    LizardRenderer, background, LOD
+    backends  null / SVG / recording canvas
+    raster    NumPy rasterizer + PhotoImage backend
+    atlas     pre-rendered stamps (feet, eye, spots, shadows)
+    bench     headless benchmark
+    export    offline PNG / SVG export
+    app       Tk window (tkinter sirf yahan load hota hai)
+    cli       command line (`python -m pylizard`)
+
+Package import halka hai — submodules zarurat pe import karo.
+"""
@@ -0,0 +1,466 @@
+"""Tk window wali App — tkinter sirf yahin (aur Tk backend mein) import hota hai."""
+
+import math
+import random
+import time
+
+from . import config
+from .atlas import StampAtlas
+from .backends import NullBackend
+from .compat import HAS_NUMPY
+from .config import BG_COLOR, FPS, HEIGHT, IDLE_FPS, SIM_DT, SWARM_SEED, WIDTH
+from .metrics import MetricsDump, MetricsRegistry
+from .raster import RasterBackend
+from .render import LOD_LEVELS, Background, LODController, LizardRenderer
+from .scene import DisplayList, Scene
+from .sim import (
+    FrameScheduler,
+    IdleDetector,
+    InputTrace,
+    LatencyHistogram,
+    Lizard,
+    LizardSwarm,
+    PointerPredictor,
+    TracePlayer,
+)
+from .threads import SimulationThread
+from .util import polar_to_xy
+
+# ─────────────────────────────────────────
+#  MAIN APPLICATION
+# ─────────────────────────────────────────
+
+class App:
+    def __init__(self, canvas=None, seed=None, record=None, replay=None,
+                 backend=None, size=None, threaded=None, predict=None,
+                 metrics_out=None, metrics_every=None):
+        """
+        canvas diya to headless (benchmark) — window/mainloop nahi banta.
+        record: trace file jisme input likhna hai; replay: InputTrace
+        jo mouse ki jagah chalega (seed bhi trace ka).
+        backend: "canvas" / "raster" (default BACKEND); size: raster
+        device resolution (w, h), default window size.
+        threaded: physics + geometry SimulationThread pe (default SIM_THREAD).
+        predict: pointer prediction horizon ms (default PREDICT_MS).
+        metrics_out: .csv / .jsonl file — har metrics_every sec pe metrics row.
+        """
+        self.root = None
+        if canvas is None:
+            import tkinter as tk     # sirf window ke liye — headless mein Tk load nahi hota
+
+            # Window
+            self.root = tk.Tk()
+            self.root.title("🦎 Realistic Lizard — Mouse Follow")
+            self.root.configure(bg=BG_COLOR)
+
+            # Canvas
+            canvas = tk.Canvas(
+                self.root,
+                width=WIDTH, height=HEIGHT,
+                bg=BG_COLOR,
+                highlightthickness=0,
+                cursor="none"   # Mouse cursor hide
+            )
+            canvas.pack(fill="both", expand=True)
+            self.root.resizable(True, True)
+        self.canvas = canvas
+
+        # Logical size (simulation isi mein) — window size sirf view badalta hai
+        self.width, self.height = WIDTH, HEIGHT
+        self.view = (1.0, 0.0, 0.0)      # logical → device (k, ox, oy)
+
+        # Mouse tracking
+        self.mouse = (WIDTH // 2, HEIGHT // 2)   # (x, y) ek hi store — sim thread ek saath padhe
+        self.mouse_t = None          # newest input sample ka timestamp
+        self.input_t = None          # sim mein use hua newest sample
+        self.shown_input_t = None    # draw hue frame ka input sample
+        self.latency = LatencyHistogram()
+        self.predictor = PointerPredictor(config.PREDICT_MS if predict is None else predict)
+
+        if self.root is not None:
+            self.canvas.bind("<Configure>", self.on_resize)
+            self.canvas.bind("<Motion>", self.on_mouse_move)
+            self.root.bind("<Escape>", lambda e: self.close())
+            self.root.bind("<KeyPress-m>", self.toggle_metrics)
+            self.root.bind("<KeyPress-M>", self.toggle_metrics)     # Shift / Caps Lock
+            self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Input record / replay
+        if replay is not None:
+            seed = replay.seed
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+        self.seed = seed
+        self.sim_step = 0
+        self.start_time = time.perf_counter()
+        self.record_path = record
+        self.trace = InputTrace(seed) if record else None
+        self.player = TracePlayer(replay) if replay is not None else None
+        self.recorded = self.mouse   # trace mein aakhri likha position
+        if self.trace is not None:
+            self.trace.add(0.0, 0, *self.mouse)
+
+        # Render backend — renderer DisplayList mein emit karta hai, backend
+        # (target) use apply karta hai. Raster mein shapes framebuffer mein,
+        # sirf UI text (overlay) Tk canvas pe; null kuch draw nahi karta.
+        backend = backend or config.BACKEND
+        if backend == "raster" and not HAS_NUMPY:
+            print("   Raster backend ke liye NumPy chahiye — canvas backend chalega")
+            backend = "canvas"
+        self.backend = None
+        if backend == "raster":
+            scale = size[0] / WIDTH if size else 1.0
+            self.backend = RasterBackend(self.canvas if self.root else None,
+                                         WIDTH, HEIGHT, scale, config.RENDER_SCALE)
+            self.scene = Scene(self.backend.raster)
+            self.overlay = Scene(self.canvas)
+            self.background = self.backend.background
+        else:
+            self.scene = Scene(self.canvas)
+            self.overlay = self.scene
+            self.background = Background(self.canvas)
+        self.backend_name = backend
+        self.target = NullBackend() if backend == "null" else self.scene
+        self.dl = DisplayList()
+        self.dl.supports_alpha = self.backend is not None
+        self.dl.px_scale = self.backend.raster.scale if self.backend is not None else 1.0
+
+        # Stamp atlas — feet/eye/spots/shadows pre-rendered images. Tk canvas
+        # pe PhotoImage (window ho tab), raster pe framebuffer blend.
+        self.atlas = None
+        if config.STAMPS and HAS_NUMPY and backend != "null":
+            master = self.canvas if self.root is not None and self.backend is None else None
+            self.atlas = StampAtlas(self.dl.px_scale, master)
+            self.atlas.prebuild(LOD_LEVELS[config.LOD_START])
+            if self.backend is not None:
+                self.backend.raster.stamps = self.atlas.stamps
+            self.dl.atlas = self.atlas
+
+        # Lizard
+        self.lizard = Lizard(WIDTH // 2, HEIGHT // 2, rng=random.Random(seed))
+        self.renderer = LizardRenderer(self.dl, self.lizard)
+
+        # Swarm (optional) — har lizard mouse ke around apni jagah follow kare
+        self.swarm = None
+        if config.SWARM_SIZE > 0:
+            self.swarm = LizardSwarm(config.SWARM_SIZE, WIDTH // 2, HEIGHT // 2, seed=SWARM_SEED)
+            rng = random.Random(SWARM_SEED)
+            self.swarm_offsets = [
+                polar_to_xy(0, 0, rng.uniform(0, 2 * math.pi), rng.uniform(40, 400))
+                for _ in range(config.SWARM_SIZE)
+            ]
+            self.swarm_renderers = {}
+
+        # Adaptive detail
+        self.lod = LODController()
+        if config.LOD_START:
+            self.lod.set_level(config.LOD_START)
+            self.lod.changes = 0
+
+        # FPS tracking
+        self.scheduler = FrameScheduler()
+        self.last_time = time.perf_counter()
+        self.frame_count = 0
+        self.fps_display = 0
+        self.items_created = 0
+        self.items_updated = 0
+        self.dirty_pct = 0.0
+
+        # Metrics registry — overlay (M key) aur/ya periodic dump
+        self.metrics = MetricsRegistry()
+        self.renderer.metrics = self.metrics
+        self.show_metrics = False
+        self.metrics_text = []
+        self.metrics_dump = None
+        if metrics_out:
+            self.metrics_dump = MetricsDump(self.metrics, metrics_out, metrics_every)
+
+        # Idle throttle — settled lizard pe kam FPS (swarm mein nahi: heads
+        # apni jagah pe chal rahe hote hain, pointer ruka hone pe bhi)
+        self.idle = IdleDetector() if config.IDLE_THROTTLE and self.swarm is None else None
+        self.throttled = False
+        self.pending = None          # agla `after` id (wake pe cancel)
+
+        # Simulation thread (optional) — swarm abhi main thread pe hi
+        self.sim_thread = None
+        if threaded is None:
+            threaded = config.SIM_THREAD
+        if threaded and self.swarm is not None:
+            print("   Swarm mode mein sim thread nahi — main thread pe chalega")
+            threaded = False
+
+        # Start loop
+        if self.root is not None:
+            if threaded:
+                self.start_simulation()
+            self.loop()
+            self.root.mainloop()
+
+    def on_mouse_move(self, event):
+        if self.player is not None:
+            return                # replay chal raha hai — asli mouse ignore
+        # Device → logical (resized / letterboxed window)
+        k, ox, oy = self.view
+        self.mouse = ((event.x - ox) / k, (event.y - oy) / k)
+        self.mouse_t = time.perf_counter()
+        if self.idle is not None and self.idle.wake(self.mouse_t):
+            self.wake()
+
+    def wake(self):
+        """Idle se full rate — soya hua `after` cancel karke frame abhi"""
+        self.throttled = False
+        self.scheduler.set_rate(FPS, time.perf_counter())
+        if self.sim_thread is not None:
+            self.sim_thread.wake()
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+        self.pending = self.root.after(0, self.loop)
+
+    def start_simulation(self, record_ticks=False):
+        """Physics worker thread shuru — renderer ab published frames padhega"""
+        self.sim_thread = SimulationThread(self, record_ticks=record_ticks)
+        self.renderer.compute_geometry = False
+        self.sim_thread.start()
+
+    def toggle_metrics(self, event=None):
+        """M key — metrics overlay on/off (band ho aur dump na ho to counting bhi band)"""
+        self.show_metrics = not self.show_metrics
+        self.metrics.active = self.show_metrics or self.metrics_dump is not None
+        self.metrics_text = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """ESC / window close — worker join, trace save karke band (dobara call safe)"""
+        if self.sim_thread is not None:
+            self.sim_thread.stop()
+        if self.metrics_dump is not None:
+            self.metrics_dump.write()
+            print(f"   Metrics saved: {self.metrics_dump.path}")
+            self.metrics_dump = None
+        self.metrics.close()
+        if self.trace is not None:
+            self.trace.save(self.record_path)
+            print(f"   Input trace saved: {self.record_path}")
+            self.trace = None
+        if self.root is not None:
+            self.root.destroy()
+            self.root = None
+
+    def on_resize(self, event):
+        """Window resize — scene logical hi rehta hai, sirf device mapping (letterbox)"""
+        k = min(event.width / WIDTH, event.height / HEIGHT)
+        view = (k, (event.width - WIDTH * k) / 2, (event.height - HEIGHT * k) / 2)
+        if view == self.view or k <= 0:
+            return
+        self.view = view
+        if self.backend is not None:
+            self.backend.set_view(k, view[1:])
+            self.overlay.set_view(*view)
+            self.dl.px_scale = self.backend.raster.scale
+        else:
+            self.scene.set_view(*view)
+            self.background.set_view(view)
+            self.dl.px_scale = k         # curves isi detail pe tessellate
+        if self.atlas is not None:
+            self.atlas.set_scale(self.dl.px_scale)
+
+    def draw_background(self):
+        """Ground layer — cached hai, sirf size/seed badalne pe rebuild"""
+        target = self.backend if self.backend is not None else self.background
+        if target.build(self.width, self.height):
+            self.scene.mark_dirty((0, 0, self.width, self.height))
+
+    def draw_swarm(self):
+        """Sirf screen pe dikhne wali lizards draw karo"""
+        for k in self.swarm.visible(0, 0, self.width, self.height):
+            renderer = self.swarm_renderers.get(k)
+            if renderer is None:
+                renderer = LizardRenderer(self.dl, None, ns=k)
+                renderer.metrics = self.metrics
+                self.swarm_renderers[k] = renderer
+            renderer.liz = self.swarm.view(k)
+            renderer.render()
+
+    def draw_cursor(self):
+        """Custom cursor (small red dot)"""
+        cx, cy = self.mouse
+        s = self.dl
+        s.oval("cursor", cx-4, cy-4, cx+4, cy+4, fill="#cc3322", outline="#ff5544", width=1)
+        s.line("cursor_h", cx-8, cy, cx+8, cy, fill="#cc3322", width=1)
+        s.line("cursor_v", cx, cy-8, cx, cy+8, fill="#cc3322", width=1)
+
+    def draw_ui(self):
+        """FPS + info text"""
+        s = self.overlay
+        s.text(
+            "fps",
+            20, 20,
+            text=f"FPS: {self.fps_display}",
+            fill="#3a5020", font=("Courier", 14, "bold"),
+            anchor="nw"
+        )
+        # Pichhle frame ke item counters (created / updated)
+        s.text(
+            "items",
+            20, 42,
+            text=(f"ITEMS: +{self.items_created} ~{self.items_updated}  LOD: {self.lod.level}"
+                  f"  DIRTY: {self.dirty_pct:.1f}%{'  IDLE' if self.throttled else ''}"),
+            fill="#3a5020", font=("Courier", 11),
+            anchor="nw"
+        )
+        self.draw_latency(20, 62)
+        if self.show_metrics:
+            self.draw_metrics(self.width - 20, 20)
+        s.text(
+            "help",
+            self.width // 2, self.height - 30,
+            text="MOUSE HILAO — LIZARD PEECHE AAYEGA  •  M = METRICS  •  ESC = BAND KARO",
+            fill="#2a3a15", font=("Courier", 11)
+        )
+
+    def draw_latency(self, x, y):
+        """Input → present latency: p50/p95 + chhota histogram"""
+        s = self.overlay
+        lat = self.latency
+        pred = f"  PRED: {self.predictor.horizon * 1000:.0f}ms" if self.predictor.horizon else ""
+        s.text(
+            "latency",
+            x, y,
+            text=f"LAT p50/p95: {lat.percentile(50):.0f}/{lat.percentile(95):.0f} ms{pred}",
+            fill="#3a5020", font=("Courier", 11),
+            anchor="nw"
+        )
+        counts = lat.counts[:24]
+        peak = max(counts) or 1
+        for i, c in enumerate(counts):
+            h = 20 * c / peak
+            s.rectangle(
+                ("lat_bar", i),
+                x + i * 6, y + 40 - h, x + i * 6 + 5, y + 40,
+                fill="#3a5020", outline=""
+            )
+
+    def draw_metrics(self, x, y):
+        """Metrics overlay — text har 15 frames pe refresh (har frame string churn nahi)"""
+        if not self.metrics_text or self.frame_count % 15 == 0:
+            self.metrics_text = self.metrics.lines()
+        for i, line in enumerate(self.metrics_text):
+            self.overlay.text(
+                ("metrics", i),
+                x, y + i * 16,
+                text=line,
+                fill="#3a5020", font=("Courier", 10),
+                anchor="ne"
+            )
+
+    def loop(self):
+        """Main game loop — fixed sim steps, interpolated render"""
+        now = time.perf_counter()
+        dt = now - self.last_time
+        self.last_time = now
+
+        # FPS — rolling median interval se (metrics registry)
+        self.frame_count += 1
+        if self.frame_count % 30 == 0:
+            self.fps_display = round(self.metrics.fps())
+        self.metrics.begin_frame()
+
+        # Update physics (fixed SIM_DT steps) — ya sim thread ka latest frame
+        steps, alpha = self.scheduler.advance(now)
+        if self.sim_thread is not None:
+            frame = self.sim_thread.buffer.read()
+            if frame is None:
+                self.pending = self.root.after(1, self.loop)    # pehla frame abhi publish nahi hua
+                return
+            self.renderer.liz = frame.snap
+            self.renderer.geo = frame.geo
+            self.shown_input_t = frame.input_t
+        else:
+            for _ in range(steps):
+                self.step_simulation(SIM_DT)
+            if self.swarm is None:
+                self.renderer.liz = self.lizard.interpolated(alpha)
+            self.shown_input_t = self.input_t
+
+        # Draw frame (retained items — sirf changed values update)
+        self.draw_frame()
+        # Canvas mode mein Tk idle pe paint karta hai — yeh uske theek pehle tak
+        self.latency.frame(self.shown_input_t, time.perf_counter())
+
+        # Frame cost → LOD (budget se upar = kam detail) + metrics
+        cost = (time.perf_counter() - now) * 1000
+        self.lod.observe(cost)
+        self.metrics.end_frame(cost, dt * 1000)
+        if self.metrics_dump is not None:
+            self.metrics_dump.poll(now)
+
+        # Idle check — pointer ruka + spine settle = kam FPS
+        if self.idle is not None:
+            idle = self.idle.observe(*self.mouse, self.renderer.liz.pts, now)
+            if idle != self.throttled:
+                self.throttled = idle
+                self.scheduler.set_rate(IDLE_FPS if idle else FPS, now)
+
+        # Schedule next frame (render cost ke hisaab se)
+        delay = self.scheduler.next_delay(time.perf_counter())
+        self.pending = self.root.after(delay, self.loop)
+
+    def step_simulation(self, dt):
+        """Ek fixed simulation step"""
+        if self.player is not None:
+            self.mouse = self.player.at(self.sim_step)
+        mouse = self.mouse           # ek read — x aur y hamesha same event ke
+        mx, my = mouse
+        self.input_t = self.mouse_t
+        if self.trace is not None and mouse != self.recorded:
+            # Jo step ne sach mein use kiya wahi likho — replay bilkul yahi path
+            self.recorded = mouse
+            self.trace.add(time.perf_counter() - self.start_time, self.sim_step, mx, my)
+        sim_t = self.sim_step * SIM_DT
+        self.sim_step += 1
+        if self.swarm is None:
+            self.predictor.add(sim_t, mx, my)
+            self.lizard.update(*self.predictor.predict(sim_t), dt)
+        else:
+            tx = [mx + ox for ox, oy in self.swarm_offsets]
+            ty = [my + oy for ox, oy in self.swarm_offsets]
+            self.swarm.step(tx, ty, dt)
+
+    def draw_frame(self):
+        self.renderer.lod = self.lod.settings
+        for renderer in getattr(self, "swarm_renderers", {}).values():
+            renderer.lod = self.lod.settings
+        self.scene.begin()
+        self.draw_background()
+        self.dl.begin()
+        if self.swarm is None:
+            self.renderer.render()
+        else:
+            self.draw_swarm()
+        start = self.dl.cur.n
+        self.draw_cursor()
+        self.metrics.span("cursor", start, self.dl.cur.n)
+        self.dl.end()
+        self.metrics.count_ops(self.dl)
+        self.target.apply(self.dl)
+        if self.overlay is not self.scene:
+            self.overlay.begin()
+        self.draw_ui()
+        self.scene.end()
+        if self.backend is not None:
+            self.overlay.end()
+            self.backend.present(self.scene.dirty.rects())
+        self.items_created = self.scene.created
+        self.items_updated = self.scene.updated
+        self.dirty_pct = self.repaint_pct()
+
+    def repaint_pct(self):
+        """Frame ka repaint % — raster pe sach mein repaint hua area, warna scene ke dirty tiles"""
+        if self.backend is not None:
+            return self.backend.repainted * 100
+        return self.scene.dirty_fraction(self.width, self.height) * 100
@@ -0,0 +1,124 @@
+"""StampAtlas — chhote repeated elements (feet, eye, spots, shadows) ki pre-rendered images."""
+
+import base64
+import math
+
+from . import config
+from .compat import np
+from .raster import RasterCanvas, encode_png
+from .render import FOOT_RADIUS, LOD_LEVELS, foot_items
+from .scene import IMAGE_EXTENT, Scene
+
+# ─────────────────────────────────────────
+#  STAMP ATLAS
+# ─────────────────────────────────────────
+
+class Stamp:
+    """Ek pre-rendered image — premultiplied color + alpha (device pixels)"""
+
+    __slots__ = ("name", "premul", "alpha", "rgba")
+
+    def __init__(self, name, premul, alpha, rgba):
+        self.name = name
+        self.premul = premul     # (h, w, 3) float32, color * alpha
+        self.alpha = alpha       # (h, w, 1) float32
+        self.rgba = rgba         # (h, w, 4) uint8 — PhotoImage / PNG ke liye
+
+class StampAtlas:
+    """
+    Har stamp ek baar RasterCanvas pe render hota hai (wahi shape functions
+    jo vector path use karta hai), current device scale pe. Renderer phir
+    ek `image` op emit karta hai — ek foot 11 items ki jagah 1.
+
+    Foot rotation STAMP_ANGLES bins mein quantize hoti hai. Tk master diya
+    ho to har stamp ka PhotoImage (same naam) banta hai; resize pe same
+    naam se rebuild, isliye canvas items ko kuch nahi karna padta.
+    Raster backend `stamps` dict seedha padhta hai.
+    """
+
+    def __init__(self, scale=1.0, master=None, angles=None):
+        self.scale = scale
+        self.master = master
+        self.angles = angles or config.STAMP_ANGLES
+        self.stamps = {}         # naam → Stamp
+        self.photos = {}         # naam → tk.PhotoImage (reference rakhna zaroori)
+        self.recipes = {}        # naam → (radius, draw, args, opts) — rebuild ke liye
+        self.foot_names = {}     # (toes, claws) → har angle bin ka naam (har frame f-string nahi)
+
+    def get(self, name, radius, draw, *args, **opts):
+        """Stamp ka naam — pehli baar `draw(s, key, x, y, *args, **opts)` se render"""
+        if name not in self.stamps:
+            self.recipes[name] = (radius, draw, args, opts)
+            self.build(name)
+        return name
+
+    def foot(self, ang, toes, claws):
+        """Foot stamp — angle nearest bin pe"""
+        b = round(ang * self.angles / math.tau) % self.angles
+        names = self.foot_names.get((toes, claws))
+        if names is None:
+            c = "c" if claws else ""
+            names = self.foot_names[toes, claws] = tuple(
+                f"foot{toes}{c}_{i}" for i in range(self.angles)
+            )
+        name = names[b]
+        if name in self.stamps:
+            return name
+        return self.get(name, FOOT_RADIUS, foot_items, b * math.tau / self.angles, toes, claws)
+
+    def prebuild(self, lod=None):
+        """Startup pe ek LOD ke saare foot angles (pehle frames mein hitch na ho)"""
+        lod = lod or LOD_LEVELS[0]
+        for b in range(self.angles):
+            self.foot(b * math.tau / self.angles, lod["toes"], lod["claws"])
+
+    def set_scale(self, scale):
+        """Device scale badla — saare stamps same naam se dobara"""
+        if scale == self.scale:
+            return
+        self.scale = scale
+        for name in self.recipes:
+            self.build(name)
+
+    def build(self, name):
+        radius, draw, args, opts = self.recipes[name]
+        k = self.scale
+        half = math.ceil(radius * k) + 1
+        size = 2 * half + 1
+        c = (half + 0.5) / k                 # center pixel ka center (logical)
+
+        # Black aur white base pe render → alpha aur color dono nikalte hain
+        canvas = RasterCanvas(size, size, k)
+        s = Scene(canvas)
+        draw(s, "stamp", c, c, *args, **opts)
+        black = canvas.render(np.zeros((size, size, 3), np.uint8)).astype(np.float32)
+        white = canvas.render(np.full((size, size, 3), 255, np.uint8)).astype(np.float32)
+        alpha = np.clip(1.0 - (white - black).mean(axis=2, keepdims=True) / 255.0, 0.0, 1.0)
+
+        # Center ke around symmetric crop — khaali kinare blend mein na aayein
+        # (shadow ellipse chaudi aur chapti hai, square mein zyada khaali)
+        ys, xs = np.nonzero(alpha[:, :, 0] > 1.0 / 512)
+        hx = int(np.abs(xs - half).max()) if len(xs) else 0
+        hy = int(np.abs(ys - half).max()) if len(ys) else 0
+        crop = (slice(half - hy, half + hy + 1), slice(half - hx, half + hx + 1))
+        black, alpha = black[crop], alpha[crop]
+
+        color = np.where(alpha > 0, black / np.maximum(alpha, 1e-6), 0.0)
+        rgba = np.concatenate((color, alpha * 255.0), axis=2)
+        rgba = np.clip(rgba + 0.5, 0, 255).astype(np.uint8)
+
+        self.stamps[name] = Stamp(name, black, alpha, rgba)
+        IMAGE_EXTENT[name] = ((hx + 1) / k, (hy + 1) / k)
+        if self.master is not None:
+            self.photo(name, rgba)
+
+    def photo(self, name, rgba):
+        """Tk PhotoImage (PNG data) — existing naam ho to usi image mein naya data"""
+        import tkinter as tk
+        data = base64.b64encode(encode_png(rgba))
+        photo = self.photos.get(name)
+        if photo is None:
+            self.photos[name] = tk.PhotoImage(name=name, master=self.master, data=data, format="png")
+        else:
+            photo.blank()
+            photo.configure(width=0, height=0, data=data, format="png")
@@ -0,0 +1,183 @@
+"""Display list consumers jo Tk nahi chahte — null, SVG, recording canvas."""
+
+from .config import BG_COLOR, HEIGHT, WIDTH
+from .geometry import bspline_flatten
+from .raster import STIPPLE_ALPHA
+
+# ─────────────────────────────────────────
+#  NULL / SVG BACKENDS
+# ─────────────────────────────────────────
+
+class NullBackend:
+    """Display list consume karke kuch draw nahi karta — sirf counters"""
+
+    def __init__(self):
+        self.ops = 0
+        self.applied = 0
+
+    def apply(self, dl):
+        f = dl.cur
+        self.ops += f.n
+        for i in range(f.n):
+            if f.changed[i]:
+                self.applied += 1
+
+def svg_color(color):
+    return color if color else "none"
+
+def svg_element(kind, coords, opts):
+    """Ek canvas-style item → SVG element string"""
+    alpha = opts.get("alpha", STIPPLE_ALPHA.get(opts.get("stipple"), 1.0))
+    extra = f' opacity="{alpha:g}"' if alpha < 1.0 else ""
+    width = opts.get("width", 1)
+    if kind in ("polygon", "line"):
+        pts = list(coords)
+        if opts.get("smooth"):
+            pts = bspline_flatten(pts, closed=kind == "polygon", steps=6)
+        points = " ".join(f"{x:.2f},{y:.2f}" for x, y in zip(pts[0::2], pts[1::2]))
+        if kind == "polygon":
+            outline = opts.get("outline", "")
+            return (f'<polygon points="{points}" fill="{svg_color(opts.get("fill", "#000000"))}" '
+                    f'stroke="{svg_color(outline)}" stroke-width="{width:g}" '
+                    f'stroke-linejoin="round"{extra}/>')
+        cap = "round" if opts.get("capstyle") == "round" else "butt"
+        return (f'<polyline points="{points}" fill="none" '
+                f'stroke="{svg_color(opts.get("fill", "#000000"))}" stroke-width="{width:g}" '
+                f'stroke-linecap="{cap}"{extra}/>')
+    if kind == "text":
+        font = opts.get("font", ("Courier", 12))
+        anchor = opts.get("anchor", "center")
+        h = "start" if "w" in anchor else "end" if "e" in anchor else "middle"
+        v = "hanging" if "n" in anchor else "text-after-edge" if "s" in anchor else "central"
+        weight = ' font-weight="bold"' if "bold" in font[2:] else ""
+        text = (opts.get("text", "").replace("&", "&amp;").replace("<", "&lt;")
+                .replace(">", "&gt;"))
+        return (f'<text x="{coords[0]:.2f}" y="{coords[1]:.2f}" fill="{svg_color(opts.get("fill"))}" '
+                f'font-family="{font[0]}" font-size="{font[1]}"{weight} '
+                f'text-anchor="{h}" dominant-baseline="{v}">{text}</text>')
+    x0, y0, x1, y1 = coords[:4]
+    paint = (f'fill="{svg_color(opts.get("fill", ""))}" '
+             f'stroke="{svg_color(opts.get("outline", "#000000"))}" stroke-width="{width:g}"{extra}')
+    if kind == "oval":
+        return (f'<ellipse cx="{(x0 + x1) / 2:.2f}" cy="{(y0 + y1) / 2:.2f}" '
+                f'rx="{abs(x1 - x0) / 2:.2f}" ry="{abs(y1 - y0) / 2:.2f}" {paint}/>')
+    return (f'<rect x="{min(x0, x1):.2f}" y="{min(y0, y1):.2f}" '
+            f'width="{abs(x1 - x0):.2f}" height="{abs(y1 - y0):.2f}" {paint}/>')
+
+class SvgBackend:
+    """
+    Display list → SVG document. Har key ka element string cache hai,
+    sirf changed ops dobara serialize hote hain. Background ke liye
+    canvas ki tarah bhi kaam karta hai (create_* static layer mein).
+    """
+
+    supports_alpha = True
+
+    def __init__(self, width=WIDTH, height=HEIGHT, bg=BG_COLOR):
+        self.width = width
+        self.height = height
+        self.bg = bg
+        self.static = []         # background elements
+        self.elements = {}       # key → element string
+        self.order = []
+        self.serialized = 0
+
+    # ── canvas subset (Background ke liye) ──
+    def _create(self, kind):
+        def create(*coords, **opts):
+            opts.pop("tags", None)
+            self.static.append(svg_element(kind, coords, opts))
+            return len(self.static)
+        return create
+
+    def __getattr__(self, name):
+        if name.startswith("create_"):
+            return self._create(name[7:])
+        raise AttributeError(name)
+
+    def delete(self, *args):
+        self.static = []
+
+    def tag_lower(self, *args):
+        pass
+
+    # ── display list ─────────────────────
+    def apply(self, dl):
+        f = dl.cur
+        elements = self.elements
+        order = self.order
+        del order[:]
+        for i in range(f.n):
+            key = dl.keys[f.kid[i]]
+            el = elements.get(key)
+            if el is None or f.changed[i]:
+                kind, key, coords, opts = dl.op(i)
+                el = elements[key] = svg_element(kind, coords, opts)
+                self.serialized += 1
+            order.append(el)
+        for key in dl.removed():
+            elements.pop(key, None)
+
+    def document(self, width=None, height=None):
+        """Poora SVG text (width/height = output size, viewBox logical)"""
+        return "\n".join([
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width or self.width}" '
+            f'height="{height or self.height}" viewBox="0 0 {self.width} {self.height}">',
+            f'<rect width="100%" height="100%" fill="{self.bg}"/>',
+            *self.static,
+            *self.order,
+            "</svg>",
+        ])
+
+# ─────────────────────────────────────────
+#  RECORDING CANVAS (headless tk.Canvas stub)
+# ─────────────────────────────────────────
+
+class RecordingCanvas:
+    """
+    tk.Canvas ka stub — Tk/display ke bina draw calls record karta hai.
+    Sirf wahi methods jo Scene / Background use karte hain.
+    """
+
+    def __init__(self):
+        self.next_id = 0
+        self.calls = {}
+
+    def _record(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def _create(self, kind):
+        def create(*coords, **opts):
+            self._record("create_" + kind)
+            self.next_id += 1
+            return self.next_id
+        return create
+
+    def __getattr__(self, name):
+        if name.startswith("create_"):
+            return self._create(name[7:])
+        raise AttributeError(name)
+
+    def coords(self, item, *coords):
+        self._record("coords")
+
+    def itemconfigure(self, item, **opts):
+        self._record("itemconfigure")
+
+    def tag_raise(self, *args):
+        self._record("tag_raise")
+
+    def tag_lower(self, *args):
+        self._record("tag_lower")
+
+    def scale(self, *args):
+        self._record("scale")
+
+    def move(self, *args):
+        self._record("move")
+
+    def delete(self, *args):
+        self._record("delete")
+
+    def bind(self, *args):
+        pass
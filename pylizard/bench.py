@@ -0,0 +1,187 @@
+"""Headless benchmark — fixed trajectory pe har stage ka time aur items."""
+
+import math
+import time
+
+from . import config
+from .app import App
+from .backends import RecordingCanvas
+from .compat import HAS_NUMPY
+from .config import FPS, HEIGHT, SIM_DT, WIDTH
+from .util import percentile
+
+# ─────────────────────────────────────────
+#  HEADLESS BENCHMARK
+# ─────────────────────────────────────────
+
+def bench_mouse(frame):
+    """Fixed mouse trajectory — Lissajous curve (har run same)"""
+    t = frame * SIM_DT
+    return (
+        WIDTH / 2 + math.sin(t * 1.3) * WIDTH * 0.35,
+        HEIGHT / 2 + math.sin(t * 1.9 + 0.7) * HEIGHT * 0.35,
+    )
+
+def summarize(samples):
+    """ms samples → mean/p50/p95/p99"""
+    vals = sorted(samples)
+    return {
+        "mean_ms": round(sum(vals) / len(vals), 4) if vals else 0.0,
+        "p50_ms": round(percentile(vals, 50), 4),
+        "p95_ms": round(percentile(vals, 95), 4),
+        "p99_ms": round(percentile(vals, 99), 4),
+    }
+
+def run_benchmark(frames=600, warmup=60, seed=0, path=None, lod=None,
+                  backend="canvas", size=None, threaded=False, paced=None, predict=0):
+    """
+    Headless benchmark: fixed trajectory pe Lizard.update + render,
+    har stage ka time aur items. JSON-serializable dict return karta hai.
+    path diya (e.g. recorded trace se) to wahi mouse motion chalega.
+    lod diya to woh level fixed, warna LODController adaptive chalega.
+    backend="raster" mein "present" stage = rasterize + PPM blit data
+    (size = device resolution, e.g. (3840, 2160)).
+    threaded=True: update + geometry SimulationThread pe, main thread
+    sirf draw karta hai. paced (default = threaded): frames FPS pe sleep
+    karke — real-time jaisa (aur threaded se fair comparison).
+    predict: pointer prediction horizon (ms); report mein cursor_lag_px
+    (head se asli mouse ki doori) se before/after compare karo.
+    """
+    if paced is None:
+        paced = threaded
+    canvas = RecordingCanvas()
+    # `with` — App.close() metrics ka gc callback hatata hai (warna har run pe jama)
+    with App(canvas=canvas, seed=seed, backend=backend, size=size, predict=predict) as app:
+        if threaded:
+            app.start_simulation(record_ticks=True)
+        if lod is not None:
+            app.lod.set_level(lod)
+            app.lod.changes = 0
+        scene = app.scene
+        dl = app.dl
+        renderer = app.renderer
+        dt = SIM_DT
+        clock = time.perf_counter
+
+        times = {}
+        items = {}
+
+        def timed(name, fn):
+            # items = emit kiye ops (renderer stages) ya apply hue ops (apply)
+            d0, c0, u0 = dl.drawn + scene.drawn, scene.created, scene.updated
+            t0 = clock()
+            fn()
+            ms = (clock() - t0) * 1000
+            if record:
+                times.setdefault(name, []).append(ms)
+                st = items.setdefault(name, [0, 0, 0])
+                st[0] += dl.drawn + scene.drawn - d0
+                st[1] += scene.created - c0
+                st[2] += scene.updated - u0
+            return ms
+
+        frame_ms = []
+        frame_cpu = []               # sirf main thread ka CPU time (GIL wait nahi)
+        dirty = []
+        lag = []
+        for f in range(warmup + frames):
+            record = f >= warmup
+            cpu0 = time.thread_time()
+            if path:
+                app.mouse = path[min(f, len(path) - 1)]
+            else:
+                app.mouse = bench_mouse(f)
+            app.mouse_t = clock()
+
+            if threaded:
+                frame = app.sim_thread.buffer.read()
+                while frame is None:
+                    time.sleep(0.001)
+                    frame = app.sim_thread.buffer.read()
+                renderer.liz = frame.snap
+                renderer.geo = frame.geo
+                app.shown_input_t = frame.input_t
+                total = 0.0
+            else:
+                total = timed("update", lambda: app.step_simulation(dt))
+                renderer.liz = app.lizard
+                app.shown_input_t = app.input_t
+            renderer.lod = app.lod.settings
+            scene.begin()
+            total += timed("background", app.draw_background)
+            dl.begin()
+            total += timed("geometry", renderer.prepare)
+            for name, draw in renderer.stages():
+                total += timed(name, draw)
+            renderer.finish()
+            total += timed("cursor", app.draw_cursor)
+            total += timed("diff", dl.end)
+            total += timed("apply", lambda: app.target.apply(dl))
+            if app.overlay is not scene:
+                app.overlay.begin()
+            total += timed("ui", app.draw_ui)
+            scene.end()
+            if app.backend is not None:
+                app.overlay.end()
+                total += timed("present", lambda: app.backend.present(scene.dirty.rects()))
+            app.latency.frame(app.shown_input_t, clock())
+            app.items_created = scene.created
+            app.items_updated = scene.updated
+            app.dirty_pct = app.repaint_pct()
+            if record:
+                frame_ms.append(total)
+                frame_cpu.append((time.thread_time() - cpu0) * 1000)
+                dirty.append(app.dirty_pct)
+                head = renderer.liz.pts
+                lag.append(math.hypot(app.mouse[0] - head[0], app.mouse[1] - head[1]))
+            if lod is None:
+                app.lod.observe(total)
+            if paced:
+                # Real-time jaisa pacing — worker ko apna tick rate mile
+                time.sleep(max(0.0, 1.0 / FPS - total / 1000))
+
+        sim = None
+        if threaded:
+            app.close()
+            ticks = app.sim_thread.tick_ms
+            sim = {"ticks": len(ticks), "published": app.sim_thread.buffer.published,
+                   "tick": summarize(ticks[warmup:] or ticks)}
+
+        stages = {}
+        for name, samples in times.items():
+            st = summarize(samples)
+            drawn, created, updated = items[name]
+            st["items"] = round(drawn / frames, 2)
+            st["created"] = round(created / frames, 2)
+            st["updated"] = round(updated / frames, 2)
+            stages[name] = st
+
+        return {
+            "version": 1,
+            "frames": frames,
+            "warmup": warmup,
+            "seed": seed,
+            "trajectory": "recorded" if path else "lissajous",
+            "preset": config.PRESET,
+            "segs": config.SEGS,
+            "body": config.BODY_MODE,
+            "backend": app.backend_name,
+            "resolution": list(app.backend.device) if app.backend is not None else [WIDTH, HEIGHT],
+            "render_resolution": ([app.backend.raster.width, app.backend.raster.height]
+                                  if app.backend is not None else [WIDTH, HEIGHT]),
+            "numpy": HAS_NUMPY,
+            "stages": stages,
+            "frame": summarize(frame_ms),
+            "frame_cpu": summarize(frame_cpu),
+            "dirty_pct": {k.replace("_ms", ""): v for k, v in summarize(dirty).items()},
+            "lod": {"level": app.lod.level, "fixed": lod is not None,
+                    "changes": app.lod.changes, "budget_ms": round(app.lod.budget_ms, 3)},
+            "threaded": threaded,
+            "stamps": app.atlas is not None,
+            "paced": paced,
+            "predict_ms": predict,
+            "latency": app.latency.summary(),
+            "cursor_lag_px": {k.replace("_ms", ""): v for k, v in summarize(lag).items()},
+            "sim_thread": sim,
+            "canvas_calls": dict(sorted(canvas.calls.items())),
+        }
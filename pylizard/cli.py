@@ -0,0 +1,135 @@
+"""Command line entry point (`python -m pylizard` / `python lizard.py`)."""
+
+from . import config
+from .app import App
+from .bench import run_benchmark
+from .config import HEIGHT, PRESETS, WIDTH, apply_preset
+from .export import export_svg, export_video
+from .sim import InputTrace, TRACE_MAGIC
+
+# ─────────────────────────────────────────
+#  ENTRY POINT
+# ─────────────────────────────────────────
+
+def main(argv=None):
+    import argparse
+    import json
+    import sys
+
+    parser = argparse.ArgumentParser(description="Realistic Lizard (Tkinter)")
+    parser.add_argument("--bench", action="store_true",
+                        help="headless benchmark chalao aur JSON report do")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--preset", choices=tuple(PRESETS), default=config.PRESET,
+                        help="quality preset (render scale, SEGS, detail)")
+    parser.add_argument("--render-scale", type=float, default=None,
+                        help="raster internal resolution scale (preset override)")
+    parser.add_argument("--body", choices=("silhouette", "quads"), default=None,
+                        help="body rendering mode (preset override)")
+    parser.add_argument("--stamps", action=argparse.BooleanOptionalAction, default=None,
+                        help="feet/eye/spots/shadows pre-rendered images se (default config.STAMPS)")
+    parser.add_argument("--lod", type=int, default=None, help="benchmark mein fixed LOD level")
+    parser.add_argument("--out", help="JSON report file (default: stdout)")
+    parser.add_argument("--export", metavar="DIR",
+                        help="offline render: frames DIR mein PNG (ya --encode se mp4)")
+    parser.add_argument("--size", default=None,
+                        help="export (default 3840x2160) / raster backend resolution WxH")
+    parser.add_argument("--backend", choices=("canvas", "raster", "null"), default=config.BACKEND,
+                        help="canvas items, NumPy raster + PhotoImage, ya null (sirf display list)")
+    parser.add_argument("--threaded", action="store_true", default=config.SIM_THREAD,
+                        help="physics + geometry alag thread pe")
+    parser.add_argument("--predict", type=float, default=config.PREDICT_MS, metavar="MS",
+                        help="pointer prediction horizon (0 = off)")
+    parser.add_argument("--paced", action="store_true", default=None,
+                        help="benchmark frames FPS pe pace karo (--threaded mein default)")
+    parser.add_argument("--format", choices=("png", "svg"), default="png",
+                        help="export format")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--path", help="target path: JSON [[x, y], ...] ya recorded .trace")
+    parser.add_argument("--record", metavar="FILE", help="live input ko binary trace mein record karo")
+    parser.add_argument("--replay", metavar="FILE", help="recorded trace window mein replay karo")
+    parser.add_argument("--encode", action="store_true",
+                        help="ffmpeg installed ho to seedha mp4 mein pipe karo")
+    parser.add_argument("--import-budget", type=float, nargs="?", const=config.IMPORT_BUDGET_MS,
+                        default=None, metavar="MS",
+                        help="headless modules ka import time check karo (budget fail = exit 1)")
+    parser.add_argument("--perf-check", nargs="?", const="", default=None,
+                        metavar="BASELINE",
+                        help="items/update/allocation budgets baseline se compare karo (regression = exit 1)")
+    parser.add_argument("--perf-update", action="store_true",
+                        help="--perf-check ke saath: naye numbers baseline mein likho")
+    parser.add_argument("--metrics-out", metavar="FILE",
+                        help="window run mein metrics periodically dump (.csv ya JSON lines)")
+    parser.add_argument("--metrics-every", type=float, default=None, metavar="SEC",
+                        help="metrics dump interval (default config.METRICS_DUMP_S)")
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help="perf budget tolerance (fraction, default config.PERF_TOLERANCE)")
+    args = parser.parse_args(argv)
+    apply_preset(args.preset, args.render_scale)
+    if args.body:
+        config.BODY_MODE = args.body
+    if args.stamps is not None:
+        config.STAMPS = args.stamps
+
+    if args.import_budget is not None:
+        from .importtime import check_import_budget
+        result = check_import_budget(args.import_budget)
+        print(json.dumps(result, indent=2))
+        sys.exit(0 if result["ok"] else 1)
+
+    if args.perf_check is not None:
+        from .perf import perf_check
+        result = perf_check(args.perf_check, args.tolerance, args.perf_update)
+        print(json.dumps(result, indent=2))
+        sys.exit(0 if result["ok"] else 1)
+
+    # Target path: JSON list ya recorded trace (trace ka seed bhi)
+    path = None
+    seed = args.seed
+    if args.path:
+        with open(args.path, "rb") as f:
+            is_trace = f.read(4) == TRACE_MAGIC
+        if is_trace:
+            trace = InputTrace.load(args.path)
+            path = trace.mouse_path()
+            seed = trace.seed
+        else:
+            with open(args.path) as f:
+                path = [tuple(p) for p in json.load(f)]
+
+    size = None
+    if args.size:
+        size = tuple(int(v) for v in args.size.lower().split("x"))
+
+    if args.export and args.format == "svg":
+        w, h = size or (WIDTH, HEIGHT)
+        print(json.dumps(export_svg(args.export, args.frames, w, h, seed, path)))
+        return
+
+    if args.export:
+        w, h = size or (3840, 2160)
+        stats = export_video(args.export, args.frames, w, h, seed,
+                             path, args.workers, args.encode)
+        print(json.dumps(stats))
+        return
+
+    if args.bench:
+        report = run_benchmark(args.frames, args.warmup, seed, path, args.lod,
+                               args.backend, size, args.threaded, args.paced, args.predict)
+        text = json.dumps(report, indent=2)
+        if args.out:
+            with open(args.out, "w") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+        return
+
+    print("🦎 Realistic Lizard starting...")
+    print("   Mouse hilao — lizard peeche aayega!")
+    print("   ESC dabao band karne ke liye.\n")
+    replay = InputTrace.load(args.replay) if args.replay else None
+    App(record=args.record, replay=replay, backend=args.backend, size=size,
+        threaded=args.threaded, predict=args.predict,
+        metrics_out=args.metrics_out, metrics_every=args.metrics_every)
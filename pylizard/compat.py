@@ -0,0 +1,8 @@
+"""Optional dependencies — NumPy na ho to pure-Python fallback chalta hai."""
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:      # NumPy optional hai — pure-Python fallback chalega
+    np = None
+    HAS_NUMPY = False
@@ -0,0 +1,59 @@
+"""Saari settings — resolution, timing, SEGS, backend, quality presets."""
+
+# ─────────────────────────────────────────
+#  CONFIG
+# ─────────────────────────────────────────
+WIDTH, HEIGHT = 1920, 1080        # 4K ke liye: 3840, 2160 (slow ho sakta hai)
+BG_COLOR = "#12100a"
+FPS = 60
+SIM_HZ = 60                        # fixed simulation step (render rate se alag)
+SIM_DT = 1.0 / SIM_HZ
+MAX_CATCHUP = 5                    # ek frame mein max itne sim steps
+SEGS = 60                          # spine ke segments (zyada = zyada smooth)
+SEGS_REF = 60                      # body profile / legs / spots isi SEGS pe tuned — baaki SEGS pe scale
+BG_SEED = 1337                     # floor tiles ka seed (same seed = same floor)
+BG_TILE_SHADES = ["#141008", "#111006", "#131007"]
+BODY_MODE = "silhouette"           # "silhouette" (~dozen items) ya "quads" (purana per-segment)
+BODY_BANDS = 8                     # silhouette mode mein skin gradient ke color bands
+SWARM_SIZE = 0                     # 0 = ek lizard; >0 = LizardSwarm mode
+SWARM_SEED = 7
+SIM_THREAD = False                 # True = physics + geometry alag worker thread pe
+PREDICT_MS = 0                     # pointer prediction horizon (0 = off)
+RENDER_SCALE = 1.0                 # raster backend: internal resolution / window resolution
+LOD_START = 0                      # shuruaati detail level (LODController phir adapt karta hai)
+
+# Quality presets — render scale, spine SEGS, shuruaati LOD, body mode
+PRESETS = {
+    "low":    {"render_scale": 0.5,  "segs": 30, "lod": 2, "body": "silhouette"},
+    "medium": {"render_scale": 0.75, "segs": 45, "lod": 1, "body": "silhouette"},
+    "high":   {"render_scale": 1.0,  "segs": 60, "lod": 0, "body": "silhouette"},
+    "ultra":  {"render_scale": 1.0,  "segs": 90, "lod": 0, "body": "quads"},
+}
+PRESET = "high"
+BACKEND = "canvas"                 # "canvas" (Tk items) ya "raster" (NumPy framebuffer + PhotoImage)
+IMPORT_BUDGET_MS = 40              # headless module import (NumPy chhodke) isse zyada slow na ho
+PERF_BASELINE = "perf_baseline.json"   # --perf-check ka baseline (repo root)
+PERF_TOLERANCE = 0.25              # baseline se itna (fraction) zyada = regression
+METRICS_WINDOW = 240               # frame-time percentiles itne frames pe (rolling)
+METRICS_ALLOC_EVERY = 60           # har itne frames mein ek frame ki allocations (tracemalloc)
+METRICS_DUMP_S = 10.0              # --metrics-out: itne seconds pe ek row
+SPLINE_TOL_PX = 0.25               # curve tessellation: max flattening error (device px)
+SPLINE_MAX_STEPS = 12              # ek span ke max segments (Tk ka default splinesteps)
+STAMPS = True                      # feet/eye/spots/shadows pre-rendered images se (NumPy chahiye)
+STAMP_ANGLES = 64                  # foot stamp rotation bins
+IDLE_THROTTLE = True               # settled lizard pe kam FPS (kiosk pe CPU bachao)
+IDLE_FPS = 15                      # idle mein render rate (sim phir bhi SIM_HZ pe)
+IDLE_AFTER_S = 1.0                 # pointer itni der ruka rahe tab idle
+IDLE_MOVE_PX = 1.5                 # per-frame spine displacement isse kam = settled (idle wave ~0.85px)
+
+def apply_preset(name, render_scale=None):
+    """Preset ke config globals set karo (App / Lizard banne se pehle)"""
+    global SEGS, BODY_MODE, LOD_START, RENDER_SCALE, PRESET
+    p = PRESETS[name]
+    PRESET = name
+    SEGS = p["segs"]
+    BODY_MODE = p["body"]
+    LOD_START = p["lod"]
+    RENDER_SCALE = p["render_scale"] if render_scale is None else render_scale
+    from .palette import invalidate_palette     # palette khud config padhta hai
+    invalidate_palette()
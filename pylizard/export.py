@@ -0,0 +1,154 @@
+"""Deterministic offline export — PNG (multi-process) ya SVG frames."""
+
+import random
+import time
+
+from . import config
+from .backends import SvgBackend
+from .bench import bench_mouse
+from .config import HEIGHT, SIM_DT, SIM_HZ, WIDTH, apply_preset
+from .raster import RasterCanvas, encode_png
+from .render import Background, LizardRenderer
+from .scene import DisplayList, Scene
+from .sim import Lizard
+
+# ─────────────────────────────────────────
+#  OFFLINE EXPORT (multi-process)
+# ─────────────────────────────────────────
+
+def simulate_path(frames, seed=0, path=None):
+    """
+    Seeded simulation — har frame ka LizardSnapshot.
+    path: [(x, y), ...] recorded target (chhota ho to aakhri point hold),
+    warna bench_mouse wala scripted Lissajous.
+    """
+    liz = Lizard(WIDTH // 2, HEIGHT // 2, rng=random.Random(seed))
+    out = []
+    for f in range(frames):
+        if path:
+            mx, my = path[min(f, len(path) - 1)]
+        else:
+            mx, my = bench_mouse(f)
+        liz.update(mx, my, SIM_DT)
+        out.append(liz.snapshot())
+    return out
+
+_EXPORT = {}
+
+def _export_init(width, height, preset=None, body=None):
+    """
+    Worker setup — parent ka preset / body mode (spawn / forkserver mein
+    config fresh import hota hai), phir background ek baar rasterize.
+    """
+    if preset is not None:
+        apply_preset(preset)
+    if body is not None:
+        config.BODY_MODE = body
+    scale = width / WIDTH
+    canvas = RasterCanvas(width, height, scale)
+    Background(canvas).build(WIDTH, HEIGHT)
+    _EXPORT["size"] = (width, height, scale)
+    _EXPORT["bg"] = canvas.render()
+
+def _export_frame(job):
+    """Ek frame rasterize karo — (index, bytes)"""
+    index, snap, raw = job
+    width, height, scale = _EXPORT["size"]
+    canvas = RasterCanvas(width, height, scale)
+    dl = DisplayList()
+    dl.supports_alpha = True
+    dl.px_scale = scale
+    dl.begin()
+    LizardRenderer(dl, snap).render()
+    dl.end()
+    scene = Scene(canvas)
+    scene.begin()
+    scene.apply(dl)
+    scene.end()
+    rgb = canvas.render(_EXPORT["bg"])
+    return index, (rgb.tobytes() if raw else encode_png(rgb))
+
+def export_svg(out_dir, frames=600, width=WIDTH, height=HEIGHT, seed=0, path=None):
+    """
+    Same deterministic frames, SVG files ke roop mein (NumPy nahi chahiye).
+    Display list ke diff se sirf badle elements dobara serialize hote hain.
+    """
+    import os
+
+    os.makedirs(out_dir, exist_ok=True)
+    svg = SvgBackend()
+    Background(svg).build(WIDTH, HEIGHT)
+    dl = DisplayList()
+    dl.supports_alpha = True
+    dl.px_scale = max(width / WIDTH, height / HEIGHT)    # viewBox ke upar scale (vector)
+    renderer = LizardRenderer(dl, None)
+    t0 = time.perf_counter()
+    for index, snap in enumerate(simulate_path(frames, seed, path)):
+        renderer.liz = snap
+        dl.begin()
+        renderer.render()
+        dl.end()
+        svg.apply(dl)
+        with open(os.path.join(out_dir, f"frame_{index:05d}.svg"), "w") as f:
+            f.write(svg.document(width, height))
+    elapsed = time.perf_counter() - t0
+    return {"frames": frames, "format": "svg", "serialized": svg.serialized,
+            "seconds": round(elapsed, 3),
+            "fps": round(frames / elapsed, 2) if elapsed else 0.0}
+
+def export_video(out_dir, frames=600, width=3840, height=2160, seed=0,
+                 path=None, workers=None, encode=False):
+    """
+    Deterministic offline render: frames process pool mein rasterize,
+    order mein PNG sequence likho (ya ffmpeg ho to pipe karke mp4).
+    Same seed + path = bit-identical output.
+    """
+    import multiprocessing
+    import os
+    import shutil
+    import subprocess
+
+    os.makedirs(out_dir, exist_ok=True)
+    snaps = simulate_path(frames, seed, path)
+
+    encoder = shutil.which("ffmpeg") if encode else None
+    if encode and encoder is None:
+        print("ffmpeg nahi mila — PNG sequence likh rahe hain")
+    proc = None
+    if encoder:
+        proc = subprocess.Popen(
+            [encoder, "-y", "-loglevel", "error",
+             "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}",
+             "-r", str(SIM_HZ), "-i", "-",
+             "-c:v", "libx264", "-pix_fmt", "yuv420p",
+             os.path.join(out_dir, "lizard.mp4")],
+            stdin=subprocess.PIPE,
+        )
+
+    jobs = [(i, snap, proc is not None) for i, snap in enumerate(snaps)]
+    workers = workers or os.cpu_count() or 1
+    t0 = time.perf_counter()
+
+    def sink(results):
+        for index, data in results:
+            if proc is not None:
+                proc.stdin.write(data)
+            else:
+                with open(os.path.join(out_dir, f"frame_{index:05d}.png"), "wb") as f:
+                    f.write(data)
+
+    if workers == 1:
+        _export_init(width, height)
+        sink(map(_export_frame, jobs))
+    else:
+        init = (width, height, config.PRESET, config.BODY_MODE)
+        with multiprocessing.Pool(workers, _export_init, init) as pool:
+            sink(pool.imap(_export_frame, jobs, chunksize=2))
+
+    if proc is not None:
+        proc.stdin.close()
+        proc.wait()
+
+    elapsed = time.perf_counter() - t0
+    return {"frames": frames, "workers": workers, "seconds": round(elapsed, 3),
+            "fps": round(frames / elapsed, 2) if elapsed else 0.0}
@@ -0,0 +1,467 @@
+"""Batched spine geometry aur head mesh (NumPy ho to vectorized)."""
+
+import math
+from array import array
+
+from . import config
+from .compat import HAS_NUMPY, np
+from .util import body_width, seg_at
+
+# ─────────────────────────────────────────
+#  GEOMETRY KERNEL (batched spine math)
+# ─────────────────────────────────────────
+
+def width_table(segs=None):
+    """body_width ki precomputed list (har segment ke liye ek baar)"""
+    segs = config.SEGS if segs is None else segs
+    return [body_width(i) for i in range(segs)]
+
+EDGE_FIELDS = ("nx", "ny", "tx", "ty", "lx", "ly", "rx", "ry")
+SCALE_FIELDS = ("scale_tip_x", "scale_tip_y", "scale_bl_x", "scale_bl_y", "scale_br_x", "scale_br_y")
+HIP_FIELDS = ("hip_x", "hip_y", "hip_ang")
+
+class SpineGeometry:
+    """
+    Ek frame ki saari spine geometry ek hi pass mein:
+    tangents, normals, left/right edges, dorsal scale points, leg hips.
+    NumPy ho to vectorized, warna pure-Python fallback (same results).
+    Outputs preallocated array('d') buffers hain (EDGE/SCALE/HIP_FIELDS) —
+    har frame in-place bharte hain, renderer seedha index karta hai.
+    """
+
+    def __init__(self, use_numpy=None):
+        self.use_numpy = HAS_NUMPY if use_numpy is None else (use_numpy and HAS_NUMPY)
+        self.segs = None
+        self.legs = None
+        self.ensure()
+
+    def ensure(self, legs=4):
+        """SEGS (ya legs ki ginti) badla ho to width table, index lists aur buffers dobara banao"""
+        if self.segs == config.SEGS and self.legs == legs:
+            return
+        n = self.segs = config.SEGS
+        self.legs = legs
+        self.widths = width_table(n)
+        self.scale_idx = list(range(seg_at(6), n - seg_at(12), max(1, seg_at(3))))
+        m = len(self.scale_idx)
+        for names, size in ((EDGE_FIELDS, n), (SCALE_FIELDS, m), (HIP_FIELDS, legs)):
+            for name in names:
+                setattr(self, name, array("d", bytes(8 * size)))
+        if self.use_numpy:
+            self.w_arr = np.array(self.widths)
+            self.scale_arr = np.array(self.scale_idx, dtype=np.intp)
+            self.scale_w = self.w_arr[self.scale_arr]
+            self.scale_fx = 2 * self.scale_arr          # flat (x, y, ...) spine mein x / y index
+            self.scale_fy = self.scale_fx + 1
+            # Output buffers pe zero-copy views + scratch (ufuncs `out=` se likhte hain)
+            self.views = {name: np.frombuffer(getattr(self, name))
+                          for name in EDGE_FIELDS + SCALE_FIELDS}
+            self.d = np.empty((n, 2))
+            self.length = np.empty(n)
+            self.safe = np.empty(n)
+            self.degenerate = np.empty(n, dtype=bool)
+            self.tmp = np.empty(n)
+            self.gather = np.empty((4, m))
+            self.stmp = np.empty(m)
+
+    def compute(self, liz):
+        """Spine (flat x, y) se saare buffers fill karo"""
+        self.ensure(len(liz.leg_seg))
+        if self.use_numpy:
+            self._compute_numpy(liz)
+        else:
+            self._compute_python(liz)
+        self._compute_hips(liz)
+
+    def _compute_numpy(self, liz):
+        flat = np.frombuffer(liz.pts, dtype=float)
+        P = flat.reshape(-1, 2)
+        W = self.w_arr
+        v = self.views
+
+        # Forward difference (last segment: backward)
+        d = self.d
+        np.subtract(P[1:], P[:-1], out=d[:-1])
+        np.subtract(P[-1], P[-2], out=d[-1])
+        dx, dy = d[:, 0], d[:, 1]
+        length = np.hypot(dx, dy, out=self.length)
+        degenerate = np.equal(length, 0.0, out=self.degenerate)
+        safe = self.safe                                     # zero-length pe 1
+        np.copyto(safe, length)
+        np.copyto(safe, 1.0, where=degenerate)              # bool + float add cast buffer leta hai
+
+        # Normal (zero-length pe 0 — get_normals jaisa)
+        nx, ny, tx, ty = v["nx"], v["ny"], v["tx"], v["ty"]
+        np.negative(np.divide(dy, safe, out=nx), out=nx)
+        np.divide(dx, safe, out=ny)
+        # Tangent (zero-length pe angle 0 → (1, 0), atan2 jaisa)
+        np.divide(dx, safe, out=tx)
+        np.copyto(tx, 1.0, where=degenerate)
+        np.divide(dy, safe, out=ty)
+
+        px, py = P[:, 0], P[:, 1]
+        tmp = self.tmp
+        np.multiply(nx, W, out=tmp)
+        np.add(px, tmp, out=v["lx"])
+        np.subtract(px, tmp, out=v["rx"])
+        np.multiply(ny, W, out=tmp)
+        np.add(py, tmp, out=v["ly"])
+        np.subtract(py, tmp, out=v["ry"])
+
+        # Dorsal scales: tip perpendicular, base along the spine
+        g = self.gather
+        k = self.scale_arr
+        pxk, pyk, txk, tyk = g[0], g[1], g[2], g[3]
+        # mode="clip": indices valid hain, aur default "raise" `out` ko buffer karta hai
+        np.take(flat, self.scale_fx, out=pxk, mode="clip")
+        np.take(flat, self.scale_fy, out=pyk, mode="clip")
+        np.take(tx, k, out=txk, mode="clip")
+        np.take(ty, k, out=tyk, mode="clip")
+        wk = self.scale_w
+        t = self.stmp
+        np.multiply(np.multiply(tyk, wk, out=t), 0.8, out=t)
+        np.add(pxk, t, out=v["scale_tip_x"])
+        np.multiply(np.multiply(txk, wk, out=t), 0.8, out=t)
+        np.subtract(pyk, t, out=v["scale_tip_y"])
+        np.multiply(np.multiply(txk, wk, out=t), 0.3, out=t)
+        np.add(pxk, t, out=v["scale_bl_x"])
+        np.subtract(pxk, t, out=v["scale_br_x"])
+        np.multiply(np.multiply(tyk, wk, out=t), 0.3, out=t)
+        np.add(pyk, t, out=v["scale_bl_y"])
+        np.subtract(pyk, t, out=v["scale_br_y"])
+
+    def _compute_python(self, liz):
+        pts = liz.pts
+        W = self.widths
+        nx, ny, tx, ty = self.nx, self.ny, self.tx, self.ty
+        lx, ly, rx, ry = self.lx, self.ly, self.rx, self.ry
+        n = len(W)
+
+        for i in range(n):
+            j = 2 * i
+            if i < n - 1:
+                dx = pts[j + 2] - pts[j]
+                dy = pts[j + 3] - pts[j + 1]
+            else:
+                dx = pts[j] - pts[j - 2]
+                dy = pts[j + 1] - pts[j - 1]
+            length = math.hypot(dx, dy)
+            if length:
+                nx[i] = -dy / length
+                ny[i] = dx / length
+                tx[i] = dx / length
+                ty[i] = dy / length
+            else:
+                nx[i] = ny[i] = ty[i] = 0.0
+                tx[i] = 1.0
+            x = pts[j]
+            y = pts[j + 1]
+            w = W[i]
+            lx[i] = x + nx[i] * w
+            ly[i] = y + ny[i] * w
+            rx[i] = x - nx[i] * w
+            ry[i] = y - ny[i] * w
+
+        for m, k in enumerate(self.scale_idx):
+            x = pts[2 * k]
+            y = pts[2 * k + 1]
+            self.scale_tip_x[m] = x + ty[k] * W[k] * 0.8
+            self.scale_tip_y[m] = y - tx[k] * W[k] * 0.8
+            self.scale_bl_x[m] = x + tx[k] * W[k] * 0.3
+            self.scale_bl_y[m] = y + ty[k] * W[k] * 0.3
+            self.scale_br_x[m] = x - tx[k] * W[k] * 0.3
+            self.scale_br_y[m] = y - ty[k] * W[k] * 0.3
+
+    def _compute_hips(self, liz):
+        """Leg hips — 4 hi hain, dono paths mein plain loop"""
+        pts = liz.pts
+        W = self.widths
+        nx, ny, tx, ty = self.nx, self.ny, self.tx, self.ty
+        side = liz.leg_side
+        for j, si in enumerate(liz.leg_seg):
+            ws = W[si] * side[j]
+            self.hip_x[j] = pts[2 * si] + nx[si] * ws
+            self.hip_y[j] = pts[2 * si + 1] + ny[si] * ws
+            self.hip_ang[j] = math.atan2(ty[si], tx[si])
+
+# ─────────────────────────────────────────
+#  SPLINE TESSELLATION (Tk smooth=True ki jagah)
+# ─────────────────────────────────────────
+
+def span_steps(bend, scale=1.0, tol=None):
+    """
+    Curve span ke kitne line segments — `bend` = control polygon ka
+    second difference (logical units). Quadratic/cubic span ko n hisson
+    mein todne ki max error ~ bend / (4 n²), isliye n = √(bend·scale / 4·tol).
+    """
+    tol = config.SPLINE_TOL_PX if tol is None else tol
+    n = math.ceil(math.sqrt(abs(bend) * scale / (4 * tol))) if bend else 1
+    return max(1, min(config.SPLINE_MAX_STEPS, n))
+
+def bspline_flatten(coords, closed, steps=None, scale=1.0):
+    """
+    Tk ke smooth=True wala quadratic B-spline, flattened: curve har edge
+    ke midpoint se guzarti hai, vertices control points; open line
+    pehle/aakhri point pe shuru/khatam. steps=None = har span ke liye
+    on-screen size se (scale = device px per logical unit).
+    """
+    pts = list(zip(coords[0::2], coords[1::2]))
+    n = len(pts)
+    if n < 3:
+        return list(coords)
+    if closed:
+        mids = [((pts[i][0] + pts[(i+1) % n][0]) / 2, (pts[i][1] + pts[(i+1) % n][1]) / 2)
+                for i in range(n)]
+        spans = [(mids[i-1], pts[i], mids[i]) for i in range(n)]
+    else:
+        mids = [((pts[i][0] + pts[i+1][0]) / 2, (pts[i][1] + pts[i+1][1]) / 2)
+                for i in range(n - 1)]
+        mids[0] = pts[0]
+        mids[-1] = pts[-1]
+        spans = [(mids[i-1], pts[i], mids[i]) for i in range(1, n - 1)]
+
+    out = [spans[0][0][0], spans[0][0][1]]
+    for (ax, ay), (bx, by), (cx, cy) in spans:
+        k = steps or span_steps(math.hypot(ax - 2 * bx + cx, ay - 2 * by + cy), scale)
+        for j in range(1, k + 1):
+            t = j / k
+            u = 1 - t
+            out.append(u * u * ax + 2 * u * t * bx + t * t * cx)
+            out.append(u * u * ay + 2 * u * t * by + t * t * cy)
+    return out
+
+def bspline_closed_batch(P, scale=1.0):
+    """
+    Ek jaise closed control polygons ka batch — NumPy (m, n, 2) →
+    (m, n·steps + 1, 2), bspline_flatten(closed=True) jaisa hi. Sab
+    spans ke liye ek steps count (sabse zyada mude span se).
+    """
+    M = (P + np.roll(P, -1, axis=1)) / 2          # edge midpoints
+    A = np.roll(M, 1, axis=1)                      # span i: (M[i-1], P[i], M[i])
+    bend = np.hypot(*np.moveaxis(A - 2 * P + M, -1, 0)).max()
+    steps = span_steps(bend, scale)
+    t = np.arange(1, steps + 1) / steps
+    u = 1 - t
+    w = np.stack((u * u, 2 * u * t, t * t))[:, None, None, :, None]    # (3, 1, 1, k, 1)
+    out = w[0] * A[:, :, None] + w[1] * P[:, :, None] + w[2] * M[:, :, None]
+    m, n = P.shape[:2]
+    return np.concatenate((A[:, :1], out.reshape(m, n * steps, 2)), axis=1)
+
+_CR_BASIS = {}
+_CR_BASIS_NP = {}
+
+def catmull_rom_basis(steps):
+    """Uniform Catmull-Rom weights (steps, 4) — t = 0, 1/steps, ... (cached)"""
+    rows = _CR_BASIS.get(steps)
+    if rows is None:
+        rows = []
+        for j in range(steps):
+            t = j / steps
+            t2, t3 = t * t, t * t * t
+            rows.append((0.5 * (-t + 2 * t2 - t3), 0.5 * (2 - 5 * t2 + 3 * t3),
+                         0.5 * (t + 4 * t2 - 3 * t3), 0.5 * (t3 - t2)))
+        _CR_BASIS[steps] = rows
+    return rows
+
+def fit(buf, n):
+    """array('d') ko n length pe laao (in-place grow / shrink)"""
+    if len(buf) < n:
+        buf.frombytes(bytes(8 * (n - len(buf))))
+    elif len(buf) > n:
+        del buf[n:]
+    return buf
+
+def curve_out(out, work, size):
+    """
+    Curve ka output buffer, `size` length pe. `out` nahi aur `work` dict
+    diya ho to har size ka apna array — steps badalne pe resize (realloc) nahi.
+    """
+    if out is None and work is not None:
+        out = work.get(("out", size))
+        if out is None:
+            out = work[("out", size)] = array("d", bytes(8 * size))
+        return out
+    return fit(array("d") if out is None else out, size)
+
+def catmull_rom(coords, scale=1.0, use_numpy=None, out=None, lo=0, hi=None, work=None):
+    """
+    Flat (x0, y0, x1, ...) points se guzarne wali Catmull-Rom curve,
+    flattened — `out` array('d') mein (diya ho to wahi reuse). Poori curve
+    ke liye ek steps count — sabse zyada mudi jagah ke on-screen bend se.
+    lo / hi = points ki range (coords ka slice copy nahi banta). `work`
+    dict diya ho to NumPy scratch aur output buffers wahin reuse hote hain.
+    NumPy ho to saare spans ek matrix multiply mein.
+    """
+    use_numpy = HAS_NUMPY if use_numpy is None else (use_numpy and HAS_NUMPY)
+    hi = len(coords) // 2 if hi is None else hi
+    n = hi - lo
+    if n < 3:
+        out = curve_out(out, work, 2 * n)
+        for j in range(2 * n):
+            out[j] = coords[2 * lo + j]
+        return out
+    if use_numpy:
+        P = np.frombuffer(coords, dtype=float, count=2 * n, offset=16 * lo).reshape(n, 2)
+        scratch = None if work is None else work.get(("np", n))
+        if scratch is None:
+            Q = np.empty((n + 2, 2))
+            D = np.empty((n - 2, 2))
+            # (spans, 4, 2) control windows — Q pe strided view, copy nahi
+            W = np.lib.stride_tricks.as_strided(Q, (n - 1, 4, 2), (Q.strides[0],) + Q.strides)
+            scratch = (Q, D, D.reshape(-1), W)
+            if work is not None:
+                work[("np", n)] = scratch
+        Q, D, d, W = scratch
+        np.subtract(P[:-2], P[1:-1], out=D)            # second difference, in-place
+        D -= P[1:-1]
+        D += P[2:]
+        np.abs(D, out=D)
+        bend = d[d.argmax()]                           # .max() reduction ~1 KiB temp leta hai
+        steps = span_steps(bend, scale)
+        out = curve_out(out, work, 2 * ((n - 1) * steps + 1))
+        O = np.frombuffer(out).reshape(-1, 2)
+        if steps == 1:
+            O[:] = P
+            return out
+        Q[1:-1] = P                                    # end points repeat
+        Q[0] = P[0]
+        Q[-1] = P[-1]
+        B = _CR_BASIS_NP.get(steps)                    # (steps, 4)
+        if B is None:
+            B = _CR_BASIS_NP[steps] = np.array(catmull_rom_basis(steps))
+        # (spans, 4, 2) windows → (spans, steps, 2)
+        np.matmul(B, W, out=O[:-1].reshape(n - 1, steps, 2))
+        O[-1] = P[-1]
+        return out
+
+    first = 2 * lo
+    last = 2 * (hi - 1)
+    bend = max(max(abs(coords[j - 2] - 2 * coords[j] + coords[j + 2]),
+                   abs(coords[j - 1] - 2 * coords[j + 1] + coords[j + 3]))
+               for j in range(first + 2, last, 2))
+    steps = span_steps(bend, scale)
+    out = curve_out(out, work, 2 * ((n - 1) * steps + 1))
+    if steps == 1:
+        for j in range(2 * n):
+            out[j] = coords[first + j]
+        return out
+    basis = catmull_rom_basis(steps)
+    o = 0
+    for b in range(first, last, 2):
+        a = max(b - 2, first)
+        c = b + 2
+        d = min(b + 4, last)
+        x0, y0, x1, y1 = coords[a], coords[a + 1], coords[b], coords[b + 1]
+        x2, y2, x3, y3 = coords[c], coords[c + 1], coords[d], coords[d + 1]
+        for w0, w1, w2, w3 in basis:
+            out[o] = w0 * x0 + w1 * x1 + w2 * x2 + w3 * x3
+            out[o + 1] = w0 * y0 + w1 * y1 + w2 * y2 + w3 * y3
+            o += 2
+    out[o] = coords[last]
+    out[o + 1] = coords[last + 1]
+    return out
+
+# ─────────────────────────────────────────
+#  HEAD MESH (local space, ek transform)
+# ─────────────────────────────────────────
+
+# Local space: origin = head (spine[0]), +x = snout ki taraf
+HEAD_PARTS = (
+    ("outline",  ((32, 0), (20, -14), (-8, -14), (-20, -10), (-20, 10), (-8, 14), (20, 14))),
+    ("shade",    ((28, 0), (18, -11), (-5, -11), (-15, -7), (-5, -2), (15, -2))),
+    ("ridge",    ((32, 0), (20, -4), (5, -5), (-3, -5))),
+    ("nostrils", ((24, -5), (24, 5))),
+    ("mouth",    ((32, 0), (18, -3), (0, -3), (-10, -3))),
+    ("eye",      ((8, -12),)),
+    ("shine",    ((10, -14),)),
+    ("ear",      ((-2, -11),)),
+    ("dewlap",   ((-5, 5), (-10, 18), (-18, 16), (-16, 6))),
+    ("tongue",   ((30, 0), (30, 0), (30, 0), (30, 0))),     # base, tip, fork_l, fork_r
+)
+# Smooth parts (Tk smooth=True jaise) — local space mein hi tessellate: closed?
+HEAD_CURVES = {"outline": True, "shade": True, "dewlap": True, "ridge": False, "mouth": False}
+# tongue_out = 1 pe tongue vertices kitna aage (tip 28, fork 9 aur ±0.6 * 9)
+TONGUE_EXTEND = ((0, 0), (28, 0), (37, -5.4), (37, 5.4))
+
+class HeadMesh:
+    """
+    Head ke saare parts ek local-space vertex buffer mein (part → range).
+    Har frame poora buffer ek hi rotation + translation se world mein
+    jaata hai; tongue extension ek direction buffer pe scalar hai.
+    Curved parts (HEAD_CURVES) buffer mein pehle se flattened hain —
+    head rigid hai, isliye tessellation sirf scale badalne pe (cached).
+    """
+
+    def __init__(self, use_numpy=None):
+        self.use_numpy = HAS_NUMPY if use_numpy is None else (use_numpy and HAS_NUMPY)
+        self.scale = None
+        self.builds = {}         # scale → (local, extend, ranges, np_local, np_extend)
+        self.set_scale(1.0)
+
+    def set_scale(self, scale):
+        """Device px per logical unit — curves is detail pe (pehli baar hi banta hai)"""
+        if scale == self.scale:
+            return
+        self.scale = scale
+        built = self.builds.get(scale)
+        if built is None:
+            built = self.builds[scale] = self.build(scale)
+        self.local, self.extend, self.ranges, self.np_local, self.np_extend = built
+        self.world = array("d", self.local)
+        if self.use_numpy:
+            self.np_world = np.frombuffer(self.world).reshape(-1, 2)
+            self.np_tmp = np.empty_like(self.np_world)
+            self.np_rot = np.empty((2, 2))      # rotation scratch (har frame naya array nahi)
+            # Column views — (x, y) broadcast add ~2 KiB ufunc buffer leta hai, scalar add nahi
+            self.np_wx = self.np_world[:, 0]
+            self.np_wy = self.np_world[:, 1]
+
+    def build(self, scale):
+        ranges = {}
+        local = []
+        extend = []
+        for name, pts in HEAD_PARTS:
+            a = len(local)
+            flat = [float(v) for p in pts for v in p]
+            if name in HEAD_CURVES:
+                flat = bspline_flatten(flat, HEAD_CURVES[name], scale=scale)
+            local += flat
+            ranges[name] = (a, len(local))
+            ext = TONGUE_EXTEND if name == "tongue" else ((0, 0),) * (len(flat) // 2)
+            for x, y in ext:
+                extend += (float(x), float(y))
+        np_local = np_extend = None
+        if self.use_numpy:
+            np_local = np.array(local).reshape(-1, 2)
+            np_extend = np.array(extend).reshape(-1, 2)
+        return local, extend, ranges, np_local, np_extend
+
+    def transform(self, x, y, angle, tongue=0.0):
+        """Local → world: ek cos/sin, poore buffer pe"""
+        c = math.cos(angle)
+        s = math.sin(angle)
+        if self.use_numpy:
+            P = self.np_local
+            if tongue:
+                P = np.add(P, np.multiply(tongue, self.np_extend, out=self.np_tmp), out=self.np_tmp)
+            R = self.np_rot
+            R[0, 0] = R[1, 1] = c
+            R[0, 1] = s
+            R[1, 0] = -s
+            np.dot(P, R, out=self.np_world)
+            self.np_wx += x
+            self.np_wy += y
+            return
+        loc = self.local
+        ext = self.extend
+        out = self.world
+        for i in range(0, len(loc), 2):
+            lx = loc[i] + tongue * ext[i]
+            ly = loc[i + 1] + tongue * ext[i + 1]
+            out[i] = x + lx * c - ly * s
+            out[i + 1] = y + lx * s + ly * c
+
+    def part(self, name):
+        """Part ke world coords (flat x, y — array('d') slice)"""
+        a, b = self.ranges[name]
+        return self.world[a:b]
@@ -0,0 +1,60 @@
+"""Headless modules ka import-time budget (`python -X importtime` se naapa)."""
+
+import re
+import subprocess
+import sys
+
+from . import config
+
+# ─────────────────────────────────────────
+#  IMPORT-TIME BUDGET
+# ─────────────────────────────────────────
+
+# Ye modules bina display ke import hone chahiye (workers, bench, CLI tools)
+HEADLESS_MODULES = ("config", "util", "palette", "sim", "geometry", "threads",
+                    "scene", "render", "metrics", "backends", "raster", "atlas", "export",
+                    "bench", "cli")
+
+# Third-party imports alag gine jaate hain — budget sirf hamare code ka hai
+EXTERNAL = ("numpy",)
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def measure_import(module):
+    """Fresh interpreter mein `import pylizard.<module>` → {ms, external_ms, own_ms, tkinter}."""
+    name = "pylizard." + module
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + name],
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} import fail: {proc.stderr.strip().splitlines()[-1]}")
+    total = external = 0
+    tk_loaded = False
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if not m:
+            continue
+        cumulative, pkg = int(m.group(2)), m.group(4)
+        if pkg == name:
+            total = cumulative
+        elif pkg in EXTERNAL:
+            external += cumulative          # top-level package ka cumulative, ek hi baar aata hai
+        elif pkg.split(".")[0] in ("tkinter", "_tkinter"):
+            tk_loaded = True
+    return {
+        "ms": round(total / 1000.0, 2),
+        "external_ms": round(external / 1000.0, 2),
+        "own_ms": round(max(0, total - external) / 1000.0, 2),
+        "tkinter": tk_loaded,
+    }
+
+def check_import_budget(budget_ms=None, modules=HEADLESS_MODULES):
+    """Har headless module naapo; budget ya tkinter leak pe `ok` False."""
+    budget_ms = config.IMPORT_BUDGET_MS if budget_ms is None else budget_ms
+    results = {m: measure_import(m) for m in modules}
+    failures = [m for m, r in results.items() if r["own_ms"] > budget_ms or r["tkinter"]]
+    return {
+        "budget_ms": budget_ms,
+        "modules": results,
+        "failures": failures,
+        "ok": not failures,
+    }
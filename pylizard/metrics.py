@@ -0,0 +1,256 @@
+"""Runtime metrics — frame time percentiles, per-stage item churn, allocations, GC."""
+
+import csv
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from array import array
+
+from . import config
+from .util import percentile
+
+# ─────────────────────────────────────────
+#  METRICS REGISTRY
+# ─────────────────────────────────────────
+
+STAGE_FIELDS = ("items", "created", "updated", "deleted")
+
+class MetricsRegistry:
+    """
+    Loop aur renderer yahan report karte hain:
+      - frame cost / frame interval (ms) — rolling window, percentiles
+      - har renderer stage ke display-list ops: emitted, created (naya key),
+        updated (changed), deleted (pichhle frame mein tha, ab nahi)
+      - allocations: har `alloc_every` frame pe ek frame tracemalloc se
+      - GC: har generation ke collections + pause time (gc.callbacks)
+    `active` False ho to sirf frame times (sasta) — stage counting aur
+    allocation sampling tabhi jab overlay dikh raha ho ya dump chal raha ho.
+    """
+
+    def __init__(self, window=None, alloc_every=None):
+        window = window or config.METRICS_WINDOW
+        self.alloc_every = alloc_every or config.METRICS_ALLOC_EVERY
+        self.frame_ms = array("d", bytes(8 * window))     # ring buffers
+        self.interval_ms = array("d", bytes(8 * window))
+        self.head = 0
+        self.filled = 0
+        self.frames = 0
+        self.active = False
+        self.start_t = time.perf_counter()
+
+        # Stage spans — (naam, op start, op end) current / pichhle frame ke
+        self.spans = []
+        self.prev_spans = []
+        self.last = {}           # stage → [items, created, updated, deleted] (last frame)
+        self.totals = {}         # stage → same, shuru se cumulative
+        self.counted = 0         # kitne frames ke stage counts totals mein hain
+
+        # Allocation sampling
+        self.sampling = False
+        self.own_trace = False
+        self.alloc_b0 = 0
+        self.alloc_cur0 = 0
+        self.alloc_kib = 0.0
+        self.alloc_blocks = 0
+        self.alloc_samples = 0
+
+        # GC pauses
+        self.gc_counts = [0, 0, 0]
+        self.gc_pause_ms = 0.0
+        self.gc_max_ms = 0.0
+        self.gc_t0 = None
+        gc.callbacks.append(self.on_gc)
+
+    def close(self):
+        if self.on_gc in gc.callbacks:
+            gc.callbacks.remove(self.on_gc)
+        if self.own_trace:
+            tracemalloc.stop()
+            self.own_trace = False
+
+    def on_gc(self, phase, info):
+        if phase == "start":
+            self.gc_t0 = time.perf_counter()
+        elif self.gc_t0 is not None:
+            ms = (time.perf_counter() - self.gc_t0) * 1000
+            self.gc_t0 = None
+            self.gc_counts[info["generation"]] += 1
+            self.gc_pause_ms += ms
+            self.gc_max_ms = max(self.gc_max_ms, ms)
+
+    # ── Frame ────────────────────────────────
+    def begin_frame(self):
+        """Frame ka kaam shuru — sampling frame ho to tracemalloc chalu"""
+        self.spans = []
+        if self.sampling:
+            return               # pichhla sampling frame abhi poora nahi hua (sim wait)
+        self.sampling = self.active and self.frames % self.alloc_every == 0
+        if self.sampling:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.own_trace = True
+            tracemalloc.reset_peak()
+            self.alloc_cur0 = tracemalloc.get_traced_memory()[0]
+            self.alloc_b0 = sys.getallocatedblocks()
+
+    def end_frame(self, cost_ms, interval_ms):
+        """Frame khatam — cost = loop ka kaam, interval = pichhle frame se wall time"""
+        if self.sampling:
+            peak = tracemalloc.get_traced_memory()[1]
+            self.alloc_blocks = sys.getallocatedblocks() - self.alloc_b0
+            self.alloc_kib = (peak - self.alloc_cur0) / 1024
+            self.alloc_samples += 1
+            if self.own_trace:
+                tracemalloc.stop()
+                self.own_trace = False
+            self.sampling = False
+        i = self.head
+        self.frame_ms[i] = cost_ms
+        self.interval_ms[i] = interval_ms
+        self.head = (i + 1) % len(self.frame_ms)
+        self.filled = min(self.filled + 1, len(self.frame_ms))
+        self.frames += 1
+
+    def span(self, name, start, end):
+        """Renderer stage ne display list mein ops [start, end) emit kiye"""
+        self.spans.append((name, start, end))
+
+    def count_ops(self, dl):
+        """
+        dl.end() ke baad — spans ke hisaab se har stage ka churn. Deleted
+        pichhle frame ke spans se attribute hote hain (key ab nahi aaya).
+        """
+        spans, prev_spans = self.spans, self.prev_spans
+        self.prev_spans = spans
+        self.spans = []
+        if not self.active:
+            return
+        cur, prev = dl.cur, dl.prev
+        last = {}
+        for name, a, b in spans:
+            st = last.setdefault(name, [0, 0, 0, 0])
+            st[0] += b - a
+            for i in range(a, b):
+                if prev.slot[cur.kid[i]] < 0:
+                    st[1] += 1
+                elif cur.changed[i]:
+                    st[2] += 1
+        for name, a, b in prev_spans:
+            st = last.setdefault(name, [0, 0, 0, 0])
+            for i in range(a, b):
+                if cur.slot[prev.kid[i]] < 0:
+                    st[3] += 1
+        self.last = last
+        for name, st in last.items():
+            tot = self.totals.setdefault(name, [0, 0, 0, 0])
+            for k in range(4):
+                tot[k] += st[k]
+        self.counted += 1
+
+    # ── Read out ─────────────────────────────
+    def window(self, buf):
+        return sorted(buf[:self.filled])
+
+    def fps(self):
+        """Median frame interval se FPS (ek dt se nahi — kam noisy)"""
+        p50 = percentile(self.window(self.interval_ms), 50)
+        return 1000.0 / p50 if p50 > 0 else 0.0
+
+    def snapshot(self):
+        """JSON-serializable haal — overlay aur dump dono yahi padhte hain"""
+        cost = self.window(self.frame_ms)
+        interval = self.window(self.interval_ms)
+        p50_interval = percentile(interval, 50)
+        return {
+            "t": round(time.perf_counter() - self.start_t, 3),
+            "frames": self.frames,
+            "fps": round(self.fps(), 1),
+            "frame_ms": {
+                "p50": round(percentile(cost, 50), 3),
+                "p95": round(percentile(cost, 95), 3),
+                "p99": round(percentile(cost, 99), 3),
+                "max": round(cost[-1], 3) if cost else 0.0,
+            },
+            "interval_ms": {
+                "p50": round(p50_interval, 3),
+                "p95": round(percentile(interval, 95), 3),
+            },
+            "stages": {name: dict(zip(STAGE_FIELDS, st)) for name, st in self.last.items()},
+            "alloc": {"kib": round(self.alloc_kib, 2), "blocks": self.alloc_blocks,
+                      "samples": self.alloc_samples},
+            "gc": {"collections": list(self.gc_counts),
+                   "pause_ms": round(self.gc_pause_ms, 3),
+                   "max_pause_ms": round(self.gc_max_ms, 3)},
+        }
+
+    def lines(self):
+        """Overlay ke liye chhoti text lines"""
+        s = self.snapshot()
+        f = s["frame_ms"]
+        g = s["gc"]
+        out = [
+            f"FRAME p50/p95/p99: {f['p50']:.1f}/{f['p95']:.1f}/{f['p99']:.1f} ms  FPS: {s['fps']:.0f}",
+            f"ALLOC: {s['alloc']['kib']:.1f} KiB  {s['alloc']['blocks']:+d} blk",
+            f"GC: {g['collections'][0]}/{g['collections'][1]}/{g['collections'][2]}"
+            f"  pause {g['pause_ms']:.1f} ms (max {g['max_pause_ms']:.2f})",
+            "STAGE      ops   +    ~    -",
+        ]
+        for name, st in s["stages"].items():
+            out.append(f"{name:<9}{st['items']:>5}{st['created']:>4}{st['updated']:>5}{st['deleted']:>5}")
+        return out
+
+class MetricsDump:
+    """
+    Soak runs ke liye periodic dump — `.csv` (ek row per dump) ya
+    JSON lines (baaki extensions). Stage columns mein pichhle dump se
+    ab tak ka per-frame average.
+    """
+
+    def __init__(self, registry, path, every_s=None):
+        self.reg = registry
+        self.path = path
+        self.every = config.METRICS_DUMP_S if every_s is None else every_s
+        self.csv = path.lower().endswith(".csv")
+        self.fields = None
+        self.next_t = time.perf_counter() + self.every
+        self.prev_totals = {}
+        self.prev_counted = 0
+        registry.active = True
+        open(path, "w").close()          # naya run = nayi file
+
+    def poll(self, now):
+        if now >= self.next_t:
+            self.next_t = now + self.every
+            self.write()
+
+    def row(self):
+        s = self.reg.snapshot()
+        frames = max(1, self.reg.counted - self.prev_counted)
+        row = {
+            "t": s["t"], "frames": s["frames"], "fps": s["fps"],
+            "frame_p50_ms": s["frame_ms"]["p50"], "frame_p95_ms": s["frame_ms"]["p95"],
+            "frame_p99_ms": s["frame_ms"]["p99"], "frame_max_ms": s["frame_ms"]["max"],
+            "alloc_kib": s["alloc"]["kib"], "alloc_blocks": s["alloc"]["blocks"],
+            "gc0": s["gc"]["collections"][0], "gc1": s["gc"]["collections"][1],
+            "gc2": s["gc"]["collections"][2], "gc_pause_ms": s["gc"]["pause_ms"],
+        }
+        for name, tot in self.reg.totals.items():
+            prev = self.prev_totals.get(name, (0, 0, 0, 0))
+            for field, a, b in zip(STAGE_FIELDS, tot, prev):
+                row[f"{name}_{field}"] = round((a - b) / frames, 2)
+        self.prev_totals = {name: list(tot) for name, tot in self.reg.totals.items()}
+        self.prev_counted = self.reg.counted
+        return row
+
+    def write(self):
+        row = self.row()
+        with open(self.path, "a", newline="") as f:
+            if not self.csv:
+                f.write(json.dumps(row) + "\n")
+                return
+            if self.fields is None:
+                self.fields = list(row)      # pehli row ke columns fixed
+                csv.writer(f).writerow(self.fields)
+            csv.DictWriter(f, self.fields, extrasaction="ignore").writerow(row)
@@ -0,0 +1,74 @@
+"""Skin color profile aur per-segment palette tables."""
+
+import sys
+
+from . import config
+from .util import blend_color, darken, lighten
+
+# ─────────────────────────────────────────
+#  SKIN COLOR PROFILE
+# ─────────────────────────────────────────
+
+SKIN_COLORS = [
+    (0,   "#5a7a3a"),   # head - medium green
+    (0.1, "#4a6e30"),   # neck - darker
+    (0.3, "#6b8c45"),   # torso - bright
+    (0.5, "#527838"),   # mid body
+    (0.7, "#3d5e28"),   # hips
+    (1.0, "#243518"),   # tail tip - very dark
+]
+
+def get_skin_color(i):
+    """Segment index se skin color"""
+    t = i / config.SEGS
+    for idx in range(len(SKIN_COLORS) - 1):
+        t0, c0 = SKIN_COLORS[idx]
+        t1, c1 = SKIN_COLORS[idx + 1]
+        if t0 <= t <= t1:
+            local_t = (t - t0) / (t1 - t0)
+            return blend_color(c0, c1, local_t)
+    return SKIN_COLORS[-1][1]
+
+# ─────────────────────────────────────────
+#  PALETTE TABLES (per-segment, precomputed)
+# ─────────────────────────────────────────
+
+class Palette:
+    """
+    Har segment ke colors startup pe ek baar nikaal ke rakhta hai —
+    renderer har frame sirf list index karta hai, hex parse nahi.
+    SKIN_COLORS ya SEGS runtime pe badle to invalidate() call karo
+    (ya ensure() khud detect kar lega).
+    """
+
+    def __init__(self):
+        self.key = None
+        self.rebuild()
+
+    def invalidate(self):
+        """Agle ensure() pe tables dobara banao"""
+        self.key = None
+
+    def ensure(self):
+        """Tables stale hain to rebuild (frame ke start pe call hota hai)"""
+        if self.key != (config.SEGS, tuple(SKIN_COLORS)):
+            self.rebuild()
+
+    def rebuild(self):
+        intern = sys.intern
+        base = [intern(get_skin_color(i)) for i in range(config.SEGS)]
+        dorsal = [intern(darken(c, 0.35)) for c in base]
+
+        self.base = base
+        self.outline = [intern(darken(c, 0.4)) for c in base]
+        self.dorsal = dorsal
+        self.dorsal_outline = [intern(darken(c, 0.3)) for c in dorsal]
+        self.spot_dark = [intern(darken(c, 0.15)) for c in base]
+        self.spot_light = [intern(lighten(c, 0.2)) for c in base]
+        self.key = (config.SEGS, tuple(SKIN_COLORS))
+
+PALETTE = Palette()
+
+def invalidate_palette():
+    """SKIN_COLORS / SEGS change hone ke baad call karo"""
+    PALETTE.invalidate()
@@ -0,0 +1,240 @@
+"""Perf regression check — items per stage, update cost, allocations vs baseline."""
+
+import gc
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from . import config
+from .app import App
+from .backends import RecordingCanvas
+from .bench import bench_mouse, run_benchmark
+from .compat import HAS_NUMPY
+from .config import SIM_DT
+from .palette import invalidate_palette
+from .sim import Lizard
+
+# ─────────────────────────────────────────
+#  PERF BUDGETS
+# ─────────────────────────────────────────
+
+UPDATE_SEGS = (60, 120, 240)       # Lizard.update cost in spine lengths pe
+
+# Relative tolerance ke upar absolute slack — chhote / noisy numbers ke liye
+# (0 items pe 25% = 0, par 1 allocated block ka farak regression nahi hai).
+# alloc_kib tight — update/render ~zero-allocation hain, ek list wapas aaye to pakdo
+SLACK = {"items": 0.0, "update_rel": 0.0, "alloc_kib": 0.5, "alloc_blocks": 2.0}
+
+# ─────────────────────────────────────────
+#  UPDATE COST (CPU-normalized)
+# ─────────────────────────────────────────
+
+def reference_loop(n=2000):
+    """
+    Fixed pure-Python float workload (spine follow jaisa). Update cost
+    isse divide karke naapte hain — CPU speed / noisy VM ka asar cancel.
+    """
+    x = y = 0.0
+    pts = [[0.0, 0.0] for _ in range(64)]
+    for i in range(n):
+        p = pts[i & 63]
+        dx, dy = x - p[0], y - p[1]
+        d = math.hypot(dx, dy) + 1.0
+        p[0] += dx / d
+        p[1] += dy / d
+        x = math.cos(i * 0.01) * 100
+        y = math.sin(i * 0.01) * 100
+
+def update_cost(segs, steps=200, repeats=7, chunk=10):
+    """
+    Lizard.update ka cost `segs` spine pe → (µs, rel). `steps` updates
+    `chunk` ke tukdon mein, har tukde se pehle utna hi chhota reference_loop
+    — dono thread CPU time se. Har tukde ka repeats mein minimum: jo tukda
+    preempt hua (cache thanda) woh gina nahi jaata. rel = update / reference
+    — budget isi pe lagta hai, µs sirf report ke liye.
+    """
+    old = config.SEGS
+    config.SEGS = segs
+    try:
+        liz = Lizard(960, 540, rng=random.Random(0))
+        for f in range(60):                        # warmup — spine settle ho
+            liz.update(*bench_mouse(f), SIM_DT)
+        targets = [bench_mouse(60 + f) for f in range(steps)]
+        chunks = [targets[i:i + chunk] for i in range(0, steps, chunk)]
+        ref_n = 2000 * chunk // steps
+        clock = time.thread_time
+        refs = [math.inf] * len(chunks)
+        pers = [math.inf] * len(chunks)
+        for _ in range(repeats):
+            for c, part in enumerate(chunks):      # interleaved — dono pe same load
+                t0 = clock()
+                reference_loop(ref_n)
+                t1 = clock()
+                for mx, my in part:
+                    liz.update(mx, my, SIM_DT)
+                t2 = clock()
+                refs[c] = min(refs[c], t1 - t0)
+                pers[c] = min(pers[c], t2 - t1)
+        per = sum(pers) / steps
+        return round(per * 1e6, 2), round(per / sum(refs), 4)   # sum(refs) ≈ reference_loop() ek baar
+    finally:
+        config.SEGS = old
+        invalidate_palette()
+
+# ─────────────────────────────────────────
+#  ALLOCATIONS (tracemalloc)
+# ─────────────────────────────────────────
+
+def frame_allocations(frames=120, warmup=60, seed=0):
+    """
+    Steady-state allocations (LOD 0, recording canvas), tracemalloc se.
+    alloc_kib = ek step ke andar peak transient heap (kitna bana aur chhoda):
+      update = Lizard.update (sim step), render = renderer → display list,
+      frame  = poora step + draw_frame (Scene / canvas apply bhi).
+    alloc_blocks.frame = frames ke baad bache naye blocks per frame —
+    dono taraf gc.collect() (freelists bhi khaali), isliye sirf asli growth
+    (leak / cache badhna) gini jaati hai; zero-allocation loop pe ~0.
+    """
+    with App(canvas=RecordingCanvas(), seed=seed) as app:
+        app.lod.set_level(0)
+        renderer = app.renderer
+        render = renderer.render
+        peaks = {"update": 0, "render": 0, "frame": 0}
+
+        def peak_of(name, fn):
+            tracemalloc.reset_peak()
+            cur0 = tracemalloc.get_traced_memory()[0]
+            fn()
+            peaks[name] += tracemalloc.get_traced_memory()[1] - cur0
+
+        def frame(f):
+            app.mouse = bench_mouse(f)
+            app.step_simulation(SIM_DT)
+            renderer.liz = app.lizard
+            app.draw_frame()
+
+        for f in range(warmup):
+            frame(f)
+        was_enabled = gc.isenabled()
+        gc.disable()                    # GC pause numbers ko na bigaade
+        gc.collect()
+        b0 = sys.getallocatedblocks()
+        for f in range(warmup, warmup + frames):
+            frame(f)
+        gc.collect()
+        blocks = sys.getallocatedblocks() - b0
+
+        tracemalloc.start()
+        try:
+            # Whole frame
+            for f in range(warmup + frames, warmup + 2 * frames):
+                peak_of("frame", lambda: frame(f))
+            # Update + render alag (render wrapper sirf is pass mein)
+            renderer.render = lambda: peak_of("render", render)
+            for f in range(warmup + 2 * frames, warmup + 3 * frames):
+                app.mouse = bench_mouse(f)
+                peak_of("update", lambda: app.step_simulation(SIM_DT))
+                renderer.liz = app.lizard
+                app.draw_frame()
+        finally:
+            del renderer.render
+            tracemalloc.stop()
+            if was_enabled:
+                gc.enable()
+    out = {f"alloc_kib.{name}": round(total / frames / 1024, 2) for name, total in peaks.items()}
+    out["alloc_blocks.frame"] = round(blocks / frames, 2)
+    return out
+
+# ─────────────────────────────────────────
+#  BASELINE CHECK
+# ─────────────────────────────────────────
+
+def render_path():
+    """
+    Baseline ka key. Item counts aur allocations NumPy / stamps path pe
+    depend karte hain — har path ki apni baseline.
+    """
+    if not HAS_NUMPY:
+        return "pure"               # stamps bhi NumPy ke bina band
+    return "numpy+stamps" if config.STAMPS else "numpy"
+
+def load_baseline(path):
+    """{path key: metrics} — file nahi hai to {}"""
+    try:
+        with open(path) as f:
+            return json.load(f).get("paths", {})
+    except FileNotFoundError:
+        return {}
+
+def collect(frames=240, warmup=60, timing=True):
+    """
+    Budget metrics (flat dict, `kind.name` keys) + info (raw µs, budget
+    nahi — machine pe depend karta hai). timing=False: sirf deterministic
+    metrics (items, allocations) — update_rel CPU load pe hilta hai.
+    """
+    report = run_benchmark(frames, warmup, seed=0, lod=0)
+    metrics, info = {}, {}
+    for name, st in report["stages"].items():
+        metrics["items." + name] = st["items"]
+    for segs in UPDATE_SEGS if timing else ():
+        us, rel = update_cost(segs)
+        metrics[f"update_rel.segs{segs}"] = rel
+        info[f"update_us.segs{segs}"] = us
+    metrics.update(frame_allocations())
+    return metrics, info
+
+def compare(metrics, baseline, tolerance):
+    """Budget se upar gaye metrics → [{metric, value, baseline, limit}]"""
+    failures = []
+    for key, base in sorted(baseline.items()):
+        if key not in metrics:
+            continue                # naya / hata hua stage — baseline update karo
+        kind = key.split(".", 1)[0]
+        limit = base * (1 + tolerance) + SLACK.get(kind, 0.0)
+        if metrics[key] > limit:
+            failures.append({"metric": key, "value": metrics[key],
+                             "baseline": base, "limit": round(limit, 3)})
+    return failures
+
+def perf_check(path=None, tolerance=None, update=False):
+    """
+    Metrics naapo aur current path (render_path) ki baseline se compare karo.
+    update=True (ya us path ki entry nahi hai) to baseline likh do. Return: JSON report, `ok` False = regression.
+    """
+    if not path:                    # default: repo root (package ke bagal)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        path = os.path.join(root, config.PERF_BASELINE)
+    tolerance = config.PERF_TOLERANCE if tolerance is None else tolerance
+    key = render_path()
+    metrics, info = collect()
+    paths = load_baseline(path)
+    baseline = paths.get(key)
+
+    if update or baseline is None:  # sirf is path ki entry likho, baaki rehne do
+        paths[key] = metrics
+        with open(path, "w") as f:
+            json.dump({
+                "version": 2,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "paths": paths,
+            }, f, indent=2, sort_keys=True)
+            f.write("\n")
+        return {"baseline": path, "path": key, "written": True,
+                "metrics": metrics, "info": info, "ok": True}
+
+    failures = compare(metrics, baseline, tolerance)
+    return {
+        "baseline": path,
+        "path": key,
+        "tolerance": tolerance,
+        "metrics": metrics,
+        "info": info,
+        "failures": failures,
+        "ok": not failures,
+    }
@@ -0,0 +1,522 @@
+"""NumPy software rasterizer (RasterCanvas) aur PhotoImage raster backend."""
+
+import math
+import struct
+import zlib
+
+from .compat import HAS_NUMPY, np
+from .config import BG_COLOR, HEIGHT, WIDTH
+from .geometry import bspline_flatten
+from .render import Background
+from .scene import item_bbox
+from .util import hex_to_rgb
+
+# ─────────────────────────────────────────
+#  RASTER CANVAS (NumPy framebuffer)
+# ─────────────────────────────────────────
+
+_RGB_CACHE = {}
+
+def color_rgb(hex_color):
+    """'#rrggbb' → (r, g, b), cached (raster ke liye)"""
+    rgb = _RGB_CACHE.get(hex_color)
+    if rgb is None:
+        rgb = _RGB_CACHE[hex_color] = hex_to_rgb(hex_color)
+    return rgb
+
+# Tk stipple patterns ka raster mein asli alpha
+STIPPLE_ALPHA = {"gray12": 0.125, "gray25": 0.25, "gray50": 0.5, "gray75": 0.75}
+
+class RasterCanvas:
+    """
+    tk.Canvas jaisa item store (Scene / Background ke liye) jo items ko
+    NumPy RGB framebuffer mein rasterize karta hai — Tk ki zarurat nahi.
+    Polygons (even-odd), lines (butt/round caps), ovals, rectangles —
+    anti-aliased (signed-distance coverage) aur asli alpha ke saath
+    (`alpha=` option, ya Tk ka `stipple`).
+    Text items store hote hain par draw nahi (font rendering nahi hai).
+    Image items `stamps` (naam → Stamp, StampAtlas bharta hai) se blend.
+    `scale` logical coords ko device pixels mein badalta hai.
+    """
+
+    supports_alpha = True        # drawers `alpha=` option de sakte hain
+
+    def __init__(self, width, height, scale=1.0, bg=BG_COLOR, antialias=True):
+        if not HAS_NUMPY:
+            raise RuntimeError("RasterCanvas ke liye NumPy chahiye")
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self.bg = bg
+        self.antialias = antialias
+        self.next_id = 0
+        self.items = {}          # id → [kind, coords, opts, tags]
+        self.order = []          # z-order (neeche se upar)
+        self.buf = None
+        self.blits = []
+        self.clip = (0, 0, width, height)
+        self.stamps = {}
+
+    # ── tk.Canvas subset ─────────────────
+    def _create(self, kind):
+        def create(*coords, **opts):
+            self.next_id += 1
+            tags = opts.pop("tags", ())
+            if isinstance(tags, str):
+                tags = (tags,)
+            self.items[self.next_id] = [kind, coords, opts, tags]
+            self.order.append(self.next_id)
+            return self.next_id
+        return create
+
+    def __getattr__(self, name):
+        if name.startswith("create_"):
+            return self._create(name[7:])
+        raise AttributeError(name)
+
+    def _ids(self, tag_or_id):
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        return [i for i in self.order if tag_or_id in self.items[i][3]]
+
+    def coords(self, item, *coords):
+        self.items[item][1] = coords
+
+    def itemconfigure(self, item, **opts):
+        self.items[item][2].update(opts)
+
+    def tag_raise(self, item, above=None):
+        ids = self._ids(item)
+        rest = [i for i in self.order if i not in ids]
+        if above is None:
+            self.order = rest + ids
+        else:
+            pos = rest.index(self._ids(above)[-1]) + 1
+            self.order = rest[:pos] + ids + rest[pos:]
+
+    def tag_lower(self, item, below=None):
+        ids = self._ids(item)
+        rest = [i for i in self.order if i not in ids]
+        self.order = ids + rest
+
+    def delete(self, tag_or_id):
+        for i in self._ids(tag_or_id):
+            del self.items[i]
+        self.order = [i for i in self.order if i in self.items]
+
+    def bind(self, *args):
+        pass
+
+    # ── Rasterization ─────────────────────
+    def render(self, base=None, region=None):
+        """
+        Visible items draw karke (H, W, 3) uint8 framebuffer.
+        region (logical rects, e.g. Scene.dirty.rects()) diya aur pichhla
+        buffer maujood hai to sirf woh rects repaint hote hain —
+        `self.blits` mein device-pixel rects jo badle.
+        """
+        if region is not None and self.buf is not None:
+            k = self.scale
+            blits = []
+            visible = self._visible()                  # bbox ek baar, har rect pe nahi
+            for x0, y0, x1, y1 in region:
+                self.clip = (0, 0, self.width, self.height)
+                box = self._box(x0 * k, y0 * k, x1 * k - 1, y1 * k - 1)
+                if box is None:
+                    continue
+                ix0, iy0, ix1, iy1 = box
+                if base is None:
+                    self.buf[iy0:iy1, ix0:ix1] = color_rgb(self.bg)
+                else:
+                    self.buf[iy0:iy1, ix0:ix1] = base[iy0:iy1, ix0:ix1]
+                self.clip = box
+                self._draw_items((x0, y0, x1, y1), visible)
+                blits.append(box)
+            self.clip = (0, 0, self.width, self.height)
+            self.blits = blits
+            return self.buf
+
+        if base is None:
+            buf = np.empty((self.height, self.width, 3), dtype=np.uint8)
+            buf[:] = color_rgb(self.bg)
+        else:
+            buf = base.copy()
+        self.buf = buf
+        self._draw_items()
+        self.blits = [(0, 0, self.width, self.height)]
+        return buf
+
+    def _visible(self):
+        """Z-order mein visible items → [(item, bbox)] (text ka bbox None)"""
+        out = []
+        for item in self.order:
+            kind, coords, opts, tags = self.items[item]
+            if opts.get("state") == "hidden":
+                continue
+            out.append((item, None if kind == "text" else item_bbox(kind, coords, opts)))
+        return out
+
+    def _draw_items(self, region=None, visible=None):
+        """Z-order mein saare visible items (region diya to sirf overlap wale)"""
+        k = self.scale
+        if visible is None:
+            visible = self._visible()
+        for item, bbox in visible:
+            kind, coords, opts, tags = self.items[item]
+            if region is not None and bbox is not None:
+                bx0, by0, bx1, by1 = bbox
+                if bx0 > region[2] or bx1 < region[0] or by0 > region[3] or by1 < region[1]:
+                    continue
+            pts = [v * k for v in coords]
+            width = opts.get("width", 1) * k
+            alpha = opts.get("alpha", STIPPLE_ALPHA.get(opts.get("stipple"), 1.0))
+            if kind == "polygon":
+                if opts.get("smooth"):
+                    pts = bspline_flatten(pts, closed=True, steps=6)
+                fill = opts.get("fill", "#000000")
+                if fill:
+                    self.fill_polygon(pts, fill, alpha)
+                outline = opts.get("outline", "")
+                if outline:
+                    self.stroke(pts + pts[:2], outline, width, True, alpha)
+            elif kind == "line":
+                if opts.get("smooth"):
+                    pts = bspline_flatten(pts, closed=False, steps=6)
+                fill = opts.get("fill", "#000000")
+                if fill:
+                    self.stroke(pts, fill, width, opts.get("capstyle") == "round", alpha)
+            elif kind == "oval":
+                self.draw_oval(pts, opts.get("fill", ""), opts.get("outline", "#000000"), width, alpha)
+            elif kind == "rectangle":
+                self.draw_rect(pts, opts.get("fill", ""), opts.get("outline", "#000000"), width, alpha)
+            elif kind == "image":
+                stamp = self.stamps.get(opts.get("image"))
+                if stamp is not None:
+                    self.draw_stamp(pts[0], pts[1], stamp)
+
+    def _box(self, x0, y0, x1, y1):
+        """Float bbox → clip rect mein int pixel range (ya None)"""
+        cx0, cy0, cx1, cy1 = self.clip
+        ix0 = max(cx0, int(math.floor(x0)))
+        iy0 = max(cy0, int(math.floor(y0)))
+        ix1 = min(cx1, int(math.ceil(x1)) + 1)
+        iy1 = min(cy1, int(math.ceil(y1)) + 1)
+        if ix0 >= ix1 or iy0 >= iy1:
+            return None
+        return ix0, iy0, ix1, iy1
+
+    def _grid(self, box):
+        ix0, iy0, ix1, iy1 = box
+        X = np.arange(ix0, ix1, dtype=float)[None, :] + 0.5
+        Y = np.arange(iy0, iy1, dtype=float)[:, None] + 0.5
+        return X, Y
+
+    def _paint(self, box, cov, color, alpha=1.0):
+        """
+        Coverage (bool mask ya 0..1 float) ke hisaab se color blend.
+        Opaque bool mask seedha assign hota hai (fast path).
+        """
+        ix0, iy0, ix1, iy1 = box
+        dst = self.buf[iy0:iy1, ix0:ix1]
+        rgb = color_rgb(color)
+        if cov.dtype == bool and alpha >= 1.0:
+            dst[cov] = rgb
+            return
+        a = cov.astype(np.float32)
+        if alpha < 1.0:
+            a *= alpha
+        a = a[..., None]
+        d = dst.astype(np.float32)
+        d += (np.array(rgb, dtype=np.float32) - d) * a
+        dst[:] = (d + 0.5).astype(np.uint8)
+
+    def _coverage(self, sd):
+        """Signed distance (px, bahar positive) → coverage"""
+        if self.antialias:
+            return np.clip(0.5 - sd, 0.0, 1.0)
+        return sd <= 0.0
+
+    def fill_polygon(self, pts, color, alpha=1.0):
+        """
+        Even-odd fill, scanline se: har edge apni rows mein ek prefix
+        toggle karta hai, phir cumsum parity = inside. AA ke liye sirf
+        edges ke paas (1px band) distance nikalti hai.
+        """
+        xs = pts[0::2]
+        ys = pts[1::2]
+        if len(xs) < 3:
+            return
+        pad = 1.0 if self.antialias else 0.0
+        box = self._box(min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad)
+        if box is None:
+            return
+        ix0, iy0, ix1, iy1 = box
+        w = ix1 - ix0
+        rows = np.arange(iy0, iy1, dtype=float) + 0.5
+        toggles = np.zeros((iy1 - iy0, w + 1), dtype=np.int16)
+        dmin = np.ones((iy1 - iy0, w)) if self.antialias else None
+        n = len(xs)
+        for i in range(n):
+            xi, yi = xs[i], ys[i]
+            xj, yj = xs[i-1], ys[i-1]
+            if dmin is not None:
+                # Edge tak distance (AA ke liye), edge ke apne chhote box mein
+                ebox = self._box(min(xi, xj) - 1, min(yi, yj) - 1, max(xi, xj) + 1, max(yi, yj) + 1)
+                ex, ey = xj - xi, yj - yi
+                l2 = ex * ex + ey * ey
+                if ebox is not None and l2 > 0:
+                    X, Y = self._grid(ebox)
+                    t = np.clip(((X - xi) * ex + (Y - yi) * ey) / l2, 0.0, 1.0)
+                    d2 = (X - xi - t * ex) ** 2 + (Y - yi - t * ey) ** 2
+                    sub = dmin[ebox[1] - iy0:ebox[3] - iy0, ebox[0] - ix0:ebox[2] - ix0]
+                    np.minimum(sub, d2, out=sub)
+            if yi == yj:
+                continue
+            r = np.nonzero((yi > rows) != (yj > rows))[0]
+            if not len(r):
+                continue
+            x_at = xi + (rows[r] - yi) * ((xj - xi) / (yj - yi))
+            # Pixel center x < x_at wale columns toggle
+            end = np.clip(np.ceil(x_at - 0.5).astype(int) - ix0, 0, w)
+            toggles[r, 0] += 1
+            np.subtract.at(toggles, (r, end), 1)
+        inside = (np.cumsum(toggles[:, :w], axis=1) & 1).astype(bool)
+        if dmin is None:
+            cov = inside
+        else:
+            d = np.sqrt(dmin)
+            cov = self._coverage(np.where(inside, -d, d))
+        self._paint(box, cov, color, alpha)
+
+    def stroke(self, pts, color, width, round_caps=False, alpha=1.0):
+        """
+        Polyline — har segment ek thick capsule/band. Coverage poori
+        polyline ke liye max se jodi jaati hai, phir ek hi blend
+        (joints pe double-blend nahi).
+        """
+        if len(pts) < 4:
+            return
+        r = max(width, 1.0 if self.antialias else 1.2) / 2
+        pad = r + (1.0 if self.antialias else 0.0)
+        xs = pts[0::2]
+        ys = pts[1::2]
+        full = self._box(min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad)
+        if full is None:
+            return
+        fx0, fy0, fx1, fy1 = full
+        acc = np.zeros((fy1 - fy0, fx1 - fx0), dtype=np.float32 if self.antialias else bool)
+
+        for i in range(0, len(pts) - 2, 2):
+            x0, y0, x1, y1 = pts[i], pts[i+1], pts[i+2], pts[i+3]
+            box = self._box(min(x0, x1) - pad, min(y0, y1) - pad, max(x0, x1) + pad, max(y0, y1) + pad)
+            if box is None:
+                continue
+            X, Y = self._grid(box)
+            dx = x1 - x0
+            dy = y1 - y0
+            l2 = dx * dx + dy * dy
+            if l2 == 0:
+                if not round_caps:
+                    continue
+                sd = np.sqrt((X - x0) ** 2 + (Y - y0) ** 2) - r
+            else:
+                t = ((X - x0) * dx + (Y - y0) * dy) / l2
+                tc = np.clip(t, 0.0, 1.0)
+                sd = np.sqrt((X - (x0 + tc * dx)) ** 2 + (Y - (y0 + tc * dy)) ** 2) - r
+                if not round_caps:
+                    # Butt cap: segment ke aage/peeche kaat do
+                    length = math.sqrt(l2)
+                    sd = np.maximum(sd, np.maximum(-t, t - 1.0) * length)
+            ix0, iy0, ix1, iy1 = box
+            sub = acc[iy0 - fy0:iy1 - fy0, ix0 - fx0:ix1 - fx0]
+            cov = self._coverage(sd)
+            if self.antialias:
+                np.maximum(sub, cov, out=sub)
+            else:
+                sub |= cov
+        self._paint(full, acc, color, alpha)
+
+    def draw_oval(self, pts, fill, outline, width, alpha=1.0):
+        x0, y0, x1, y1 = pts[:4]
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        rx, ry = abs(x1 - x0) / 2, abs(y1 - y0) / 2
+        if rx <= 0 or ry <= 0:
+            return
+        half = width / 2 if outline else 0
+        pad = half + (1.0 if self.antialias else 0.0)
+        box = self._box(cx - rx - pad, cy - ry - pad, cx + rx + pad, cy + ry + pad)
+        if box is None:
+            return
+        X, Y = self._grid(box)
+        u = (X - cx) / rx
+        v = (Y - cy) / ry
+        f = np.sqrt(u * u + v * v)
+        # Ellipse ka approx signed distance: (f - 1) / |grad f|
+        grad = np.sqrt((u / rx) ** 2 + (v / ry) ** 2) / np.maximum(f, 1e-6)
+        sd = (f - 1.0) / np.maximum(grad, 1e-6)
+        if fill:
+            self._paint(box, self._coverage(sd), fill, alpha)
+        if outline:
+            self._paint(box, self._coverage(np.abs(sd) - max(half, 0.5)), outline, alpha)
+
+    def draw_rect(self, pts, fill, outline, width, alpha=1.0):
+        x0, y0, x1, y1 = pts[:4]
+        x0, x1 = min(x0, x1), max(x0, x1)
+        y0, y1 = min(y0, y1), max(y0, y1)
+
+        def band(ax, ay, bx, by, color):
+            box = self._box(ax, ay, bx - 1, by - 1)
+            if box is None:
+                return
+            ix0, iy0, ix1, iy1 = box
+            if alpha >= 1.0:
+                self.buf[iy0:iy1, ix0:ix1] = color_rgb(color)
+            else:
+                self._paint(box, np.ones((iy1 - iy0, ix1 - ix0), dtype=bool), color, alpha)
+
+        if fill:
+            band(x0, y0, x1, y1, fill)
+        if outline:
+            h = width / 2
+            # Corners do baar blend na hon — top/bottom poore, sides beech mein
+            band(x0 - h, y0 - h, x1 + h, y0 + h, outline)
+            band(x0 - h, y1 - h, x1 + h, y1 + h, outline)
+            band(x0 - h, y0 + h, x0 + h, y1 - h, outline)
+            band(x1 - h, y0 + h, x1 + h, y1 - h, outline)
+
+    def draw_stamp(self, cx, cy, stamp):
+        """Pre-rendered stamp, center (cx, cy) pe — stamp ka center pixel us pixel pe jisme center hai"""
+        h, w = stamp.alpha.shape[:2]
+        x0 = int(math.floor(cx)) - w // 2
+        y0 = int(math.floor(cy)) - h // 2
+        cx0, cy0, cx1, cy1 = self.clip
+        ix0, iy0 = max(cx0, x0), max(cy0, y0)
+        ix1, iy1 = min(cx1, x0 + w), min(cy1, y0 + h)
+        if ix0 >= ix1 or iy0 >= iy1:
+            return
+        sy = slice(iy0 - y0, iy1 - y0)
+        sx = slice(ix0 - x0, ix1 - x0)
+        dst = self.buf[iy0:iy1, ix0:ix1]
+        a = stamp.alpha[sy, sx]
+        # Premultiplied: out = src + dst * (1 - a)
+        dst[:] = (stamp.premul[sy, sx] + dst * (1.0 - a) + 0.5).astype(np.uint8)
+
+def encode_png(rgb):
+    """(H, W, 3) RGB ya (H, W, 4) RGBA uint8 → PNG bytes (stdlib zlib, deterministic)"""
+    h, w, c = rgb.shape
+    raw = np.empty((h, w * c + 1), dtype=np.uint8)
+    raw[:, 0] = 0                       # filter: none
+    raw[:, 1:] = rgb.reshape(h, w * c)
+
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xffffffff)
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 6 if c == 4 else 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6))
+        + chunk(b"IEND", b"")
+    )
+
+# ─────────────────────────────────────────
+#  RASTER BACKEND (live window)
+# ─────────────────────────────────────────
+
+class RasterBackend:
+    """
+    Canvas items ki jagah software rasterizer: Scene ke items RasterCanvas
+    mein jaate hain, background ek alag cached base buffer hai, aur har
+    frame ka badla hua area ek hi PhotoImage update se screen pe aata hai.
+    display: tk.Canvas (window) ya None (headless benchmark).
+    width/height logical hain; scale = device pixels per logical unit
+    (e.g. 2.0 = 4K). render_scale < 1 pe internal buffer chhota banta
+    hai aur present pe nearest-neighbour upscale hota hai.
+    """
+
+    def __init__(self, display, width=WIDTH, height=HEIGHT, scale=1.0, render_scale=1.0):
+        self.display = display
+        self.width = width
+        self.height = height
+        self.raster = RasterCanvas(width, height)
+        self.bg = RasterCanvas(width, height)
+        self.background = Background(self.bg)
+        self.base = None
+        self.photo = None
+        self.image_item = None
+        self.blit_bytes = 0      # pichhle frame ka upload size
+        self.repainted = 0.0     # pichhle frame mein sach mein repaint hua hissa (0..1)
+        self.render_scale = render_scale
+        self.set_view(scale)
+
+    def set_view(self, scale, offset=(0, 0), render_scale=None):
+        """Device scale / window offset / internal resolution badlo — agla frame full repaint"""
+        if render_scale is not None:
+            self.render_scale = render_scale
+        self.scale = scale
+        self.offset = offset
+        k = scale * self.render_scale
+        w, h = max(1, round(self.width * k)), max(1, round(self.height * k))
+        for c in (self.raster, self.bg):
+            c.scale = k
+            c.width, c.height = w, h
+            c.clip = (0, 0, w, h)
+            c.buf = None
+        self.device = (max(1, round(self.width * scale)), max(1, round(self.height * scale)))
+        self.rows = self.cols = None
+        if self.render_scale != 1.0:
+            # Device pixel → internal pixel (nearest), ek baar
+            dw, dh = self.device
+            self.cols = np.minimum(((np.arange(dw) + 0.5) * self.render_scale).astype(np.intp), w - 1)
+            self.rows = np.minimum(((np.arange(dh) + 0.5) * self.render_scale).astype(np.intp), h - 1)
+        self.base = None
+        self.photo = None
+        if self.image_item is not None:
+            self.display.coords(self.image_item, *offset)
+
+    def build(self, width, height):
+        """Background base buffer (cached) — rebuild hua to True"""
+        if not self.background.build(width, height) and self.base is not None:
+            return False
+        self.base = self.bg.render()
+        self.raster.buf = None
+        return True
+
+    def present(self, region):
+        """
+        region (Scene.dirty.rects(), tile rects) repaint karo — har rect alag,
+        beech ka saaf area nahi. Sirf blit ek hai: badle rects ka bounding box
+        (device pixels mein) ek PPM mein PhotoImage pe.
+        """
+        rgb = self.raster.render(self.base, region)
+        boxes = self.raster.blits
+        r = self.raster
+        self.repainted = sum((b[2] - b[0]) * (b[3] - b[1]) for b in boxes) / float(r.width * r.height)
+        if not boxes:
+            self.blit_bytes = 0
+            return
+        x0 = min(b[0] for b in boxes)
+        y0 = min(b[1] for b in boxes)
+        x1 = max(b[2] for b in boxes)
+        y1 = max(b[3] for b in boxes)
+        if self.rows is None:
+            pixels = rgb[y0:y1, x0:x1]
+        else:
+            up = 1.0 / self.render_scale
+            dw, dh = self.device
+            x0, y0 = int(x0 * up), int(y0 * up)
+            x1, y1 = min(dw, math.ceil(x1 * up)), min(dh, math.ceil(y1 * up))
+            pixels = rgb[self.rows[y0:y1, None], self.cols[None, x0:x1]]
+        data = b"P6 %d %d 255\n" % (x1 - x0, y1 - y0) + pixels.tobytes()
+        self.blit_bytes = len(data)
+        if self.display is None:
+            return
+        if self.photo is None:
+            import tkinter as tk
+            self.photo = tk.PhotoImage(master=self.display, width=self.device[0], height=self.device[1])
+            if self.image_item is None:
+                self.image_item = self.display.create_image(*self.offset, image=self.photo, anchor="nw")
+                self.display.tag_lower(self.image_item)
+            else:
+                self.display.itemconfigure(self.image_item, image=self.photo)
+        self.photo.put(data, to=(x0, y0))
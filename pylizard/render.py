@@ -0,0 +1,668 @@
+"""LizardRenderer, cached background aur level-of-detail controller."""
+
+import math
+import random
+
+from . import config
+from .compat import np
+from .config import BG_SEED, BODY_BANDS, FPS
+from .geometry import (
+    HeadMesh,
+    SpineGeometry,
+    bspline_closed_batch,
+    bspline_flatten,
+    catmull_rom,
+)
+from .palette import PALETTE
+from .util import clamp, polar_to_xy, seg_at
+
+# ─────────────────────────────────────────
+#  STAMPABLE SHAPES (vector path + StampAtlas)
+# ─────────────────────────────────────────
+# Chhote, baar-baar aane wale elements. Vector path inhe seedha display
+# list mein emit karta hai; StampAtlas inhi se ek baar image render karta
+# hai. `*_RADIUS` = center se sabse door pixel (logical units).
+
+FOOT_RADIUS = 17
+EYE_RADIUS = 10
+
+def foot_items(s, key, x, y, ang, toes, claws):
+    """Foot pad + toes (+ claws), (x, y) pe, `ang` direction mein"""
+    # Foot pad
+    s.oval(("foot", key), x - 4, y - 4, x + 4, y + 4, fill="#1a2010", outline="")
+
+    # 5 Toes (real lizard jaisi!) — low LOD pe ek merged toe
+    toe_nums = range(-2, 3) if toes == 5 else (0,)
+    toe_w = 2 if toes == 5 else 5
+    for toe_num in toe_nums:
+        toe_ang = ang + toe_num * 0.25
+        # Outer toes shorter, middle longest
+        toe_len = 10 - abs(toe_num) * 1.5
+        toe_ex, toe_ey = polar_to_xy(x, y, toe_ang, toe_len)
+
+        s.line(
+            ("toe", key, toe_num),
+            x, y, toe_ex, toe_ey,
+            fill="#121808", width=toe_w, capstyle="round"
+        )
+        if not claws:
+            continue
+        # Claw tip
+        claw_ex, claw_ey = polar_to_xy(toe_ex, toe_ey, toe_ang, 3)
+        s.line(
+            ("claw", key, toe_num),
+            toe_ex, toe_ey, claw_ex, claw_ey,
+            fill="#0a1005", width=1, capstyle="round"
+        )
+
+def eye_items(s, key, x, y):
+    """Eye socket + concentric iris (pupil/shine/lid alag — blink ke saath badalte hain)"""
+    # ── Eye socket ──
+    s.oval("eye", x-9, y-8, x+9, y+8, fill="#1e3010", outline="#0a1808", width=1)
+
+    # ── Iris ──
+    s.oval("iris", x-7, y-7, x+7, y+7, fill="#8B4513", outline="")
+
+    # ── Iris pattern (concentric) ──
+    s.oval("iris_mid", x-5, y-5, x+5, y+5, fill="#c8820a", outline="")
+    s.oval("iris_in", x-3, y-3, x+3, y+3, fill="#a06010", outline="")
+
+def spot_items(s, key, x, y, r, dark, light):
+    """Dark outer ring + bright center"""
+    s.oval(("spot", key), x - r, y - r * 0.7, x + r, y + r * 0.7, fill=dark, outline="")
+    s.oval(
+        ("spot_hi", key),
+        x - r * 0.5, y - r * 0.35,
+        x + r * 0.5, y + r * 0.35,
+        fill=light, outline=""
+    )
+
+def shadow_item(s, key, x, y, w, **extra):
+    """Soft ellipse shadow — (x, y) ellipse ka center"""
+    s.oval(
+        ("shadow", key),
+        x - w * 1.8, y - w * 0.5,
+        x + w * 1.8, y + w * 0.5,
+        fill="#060400", outline="", **extra
+    )
+
+# Body spots — spine positions SEGS_REF scale pe (seg_at se current SEGS)
+SPOT_POS = (12, 16, 20, 25, 30, 18)
+
+# ─────────────────────────────────────────
+#  RENDERER CLASS
+# ─────────────────────────────────────────
+
+class LizardRenderer:
+    def __init__(self, dl, lizard, geometry=None, ns=None):
+        self.dl = dl             # DisplayList — ops yahan emit hote hain
+        self.liz = lizard
+        self.geo = geometry or SpineGeometry()
+        self.head = HeadMesh(self.geo.use_numpy)
+        self.compute_geometry = True   # False = geo pehle se bhara hai (sim thread)
+        self.metrics = None      # MetricsRegistry — har stage ka op span report hota hai
+        self.ns = ns             # swarm mein har lizard ke keys alag
+        self.lod = LOD_LEVELS[0]
+        self.body_mode = config.BODY_MODE
+        self.belly_work = {}     # belly curve ke reused buffers (catmull_rom `work`)
+        self.sil_cache = {}      # (SEGS, stride, bands) → silhouette sample indices / band ranges
+        self.stamp_keys = {}     # (stage, SEGS, step) → per item (index, stamp naam, op key)
+
+    def render(self):
+        """Ek frame draw karna"""
+        self.prepare()
+        metrics = self.metrics
+        for name, draw in self.stages():
+            if metrics is None:
+                draw()
+                continue
+            start = self.dl.cur.n
+            draw()
+            metrics.span(name, start, self.dl.cur.n)
+        self.finish()
+
+    def prepare(self):
+        """Frame ki shared cheezein — palette check + geometry pass"""
+        PALETTE.ensure()
+        if self.compute_geometry:
+            self.geo.compute(self.liz)
+        self.dl.ns = self.ns
+
+    def finish(self):
+        self.dl.ns = None
+
+    def stages(self):
+        """(naam, draw function) — draw order mein (benchmark bhi yahi use karta hai)"""
+        return (
+            ("shadow", self.draw_shadow),
+            ("body", self.draw_body),
+            ("belly", self.draw_belly_stripe),
+            ("scales", self.draw_dorsal_scales),
+            ("legs", self.draw_legs),
+            ("head", self.draw_head),
+            ("spots", self.draw_spots),
+        )
+
+    # ── Shadow ────────────────────────────────
+    def draw_shadow(self):
+        liz = self.liz
+        # Soft ellipse shadows under body
+        step = self.lod["shadows"]
+        if not step:
+            return
+        atlas = self.dl.atlas
+        # Raster backend pe soft (semi-transparent) shadow — stamp mein alpha baked hai
+        soft = atlas is not None or getattr(self.dl, "supports_alpha", False)
+        extra = {"alpha": 0.7} if soft else {}
+        widths = self.geo.widths
+        pts = liz.pts
+        for i, stamp, key in self.shadow_keys(step):
+            sx = pts[2 * i]
+            sy = pts[2 * i + 1]
+            w = widths[i]
+            # Shadow ellipse (body se thoda neeche-right)
+            if atlas is not None:
+                name = atlas.get(stamp, w * 1.8 + 1, shadow_item, w, **extra)
+                self.dl.image(key, sx + 5, sy + 12, image=name)
+            else:
+                shadow_item(self.dl, i, sx + 5, sy + 12, w, **extra)
+
+    def shadow_keys(self, step):
+        """Shadow segments + stamp naam / op keys — har frame f-string na bane"""
+        ck = ("shadow", config.SEGS, step)
+        keys = self.stamp_keys.get(ck)
+        if keys is None:
+            keys = self.stamp_keys[ck] = tuple(
+                (i, f"shadow{i}", ("shadow_stamp", i))
+                for i in range(seg_at(5), config.SEGS - seg_at(10), max(1, seg_at(4 * step)))
+            )
+        return keys
+
+    # ── Main Body ─────────────────────────────
+    def draw_body(self):
+        if self.body_mode == "quads":
+            self.draw_body_quads()
+        else:
+            self.draw_body_silhouette()
+
+    def draw_body_silhouette(self):
+        """
+        Poora body ek silhouette: BODY_BANDS color strips (har ek ek
+        polygon) + ek closed outline polygon. ~177 items ki jagah ~10.
+        """
+        idx, bands = self.silhouette_plan(self.lod["stride"])
+
+        # Color bands — tail se head (painter's algorithm), ek segment overlap
+        for key, seg, mid in bands:
+            self.emit_outline("polygon", key, seg, {"fill": PALETTE.base[mid], "outline": ""})
+
+        # Outline (dark edge) — left edge aage, right edge wapas
+        if not self.lod["outlines"]:
+            return
+        self.emit_outline("polygon", "silhouette", idx,
+                          {"fill": "", "outline": PALETTE.outline[config.SEGS // 3], "width": 1})
+
+    def silhouette_plan(self, stride):
+        """Spine samples (LOD stride, tail tip hamesha) + bands [(key, seg, mid)] — cached"""
+        plan_key = (config.SEGS, stride, BODY_BANDS)
+        plan = self.sil_cache.get(plan_key)
+        if plan is not None:
+            return plan
+        idx = list(range(0, config.SEGS, stride))
+        if idx[-1] != config.SEGS - 1:
+            idx.append(config.SEGS - 1)
+        n = min(BODY_BANDS, len(idx) - 1)
+        bands = []
+        for b in range(n - 1, -1, -1):
+            k0 = b * (len(idx) - 1) // n
+            k1 = min((b + 1) * (len(idx) - 1) // n + 1, len(idx) - 1)
+            seg = idx[k0:k1 + 1]
+            bands.append((("band", b), seg, seg[len(seg) // 2]))
+        plan = self.sil_cache[plan_key] = (idx, bands)
+        return plan
+
+    def emit_outline(self, kind, key, seg, opts):
+        """seg pe left edge aage, right edge wapas — seedha display list ke buffer mein"""
+        s = self.dl
+        g = self.geo
+        lx, ly, rx, ry = g.lx, g.ly, g.rx, g.ry
+        n = 4 * len(seg)
+        buf, o = s.reserve(n)
+        for i in seg:
+            buf[o] = lx[i]
+            buf[o + 1] = ly[i]
+            o += 2
+        for i in reversed(seg):
+            buf[o] = rx[i]
+            buf[o + 1] = ry[i]
+            o += 2
+        s.emit(kind, key, n, opts)
+
+    def draw_body_quads(self):
+        """Purana path: har segment ek smoothed quad + 2 outline lines"""
+        s = self.dl
+
+        # Edge points geometry kernel se (ek pass mein)
+        g = self.geo
+        lx, ly, rx, ry = g.lx, g.ly, g.rx, g.ry
+
+        stride = self.lod["stride"]
+        outlines = self.lod["outlines"]
+
+        # Draw from tail to head (painter's algorithm)
+        idx = list(range((config.SEGS - 2) // stride * stride, -1, -stride))
+        jdx = [min(i + stride, config.SEGS - 1) for i in idx]
+
+        # Smoothed quads (pehle Tk smooth=True) — NumPy ho to saare ek batch mein
+        px = s.px_scale
+        if g.use_numpy:
+            L = np.array((lx, ly)).T
+            R = np.array((rx, ry)).T
+            quads = np.stack((L[idx], L[jdx], R[jdx], R[idx]), axis=1)
+            shapes = bspline_closed_batch(quads, px).reshape(len(idx), -1).tolist()
+        else:
+            shapes = [bspline_flatten((lx[i], ly[i], lx[j], ly[j], rx[j], ry[j], rx[i], ry[i]),
+                                      True, scale=px)
+                      for i, j in zip(idx, jdx)]
+
+        for i, j, shape in zip(idx, jdx, shapes):
+            # Main quad — skin color for this segment
+            s.polygon(("body", i), *shape, fill=PALETTE.base[i], outline="")
+
+            # Outline (dark edge)
+            if not outlines:
+                continue
+            outline_c = PALETTE.outline[i]
+            s.line(("body_l", i), lx[i], ly[i], lx[j], ly[j], fill=outline_c, width=1)
+            s.line(("body_r", i), rx[i], ry[i], rx[j], ry[j], fill=outline_c, width=1)
+
+    # ── Belly Stripe ──────────────────────────
+    def draw_belly_stripe(self):
+        s = self.dl
+        # Spine points se guzarti Catmull-Rom curve (pehle se flattened)
+        lo = seg_at(5)
+        pts = catmull_rom(self.liz.pts, s.px_scale, self.geo.use_numpy, None,
+                          lo, config.SEGS - lo, self.belly_work)
+        if len(pts) >= 4:
+            s.line("belly", pts, fill="#c8d898", width=3)
+            s.line("belly_hi", pts, fill="#e0eaaa", width=1)
+
+    # ── Dorsal Scales (ridge bumps) ───────────
+    def draw_dorsal_scales(self):
+        s = self.dl
+        step = self.lod["scales"]
+        if not step:
+            return
+        g = self.geo
+        for k in range(0, len(g.scale_idx), step):
+            i = g.scale_idx[k]
+            base_l_x, base_l_y = g.scale_bl_x[k], g.scale_bl_y[k]
+            tip_x, tip_y = g.scale_tip_x[k], g.scale_tip_y[k]
+            base_r_x, base_r_y = g.scale_br_x[k], g.scale_br_y[k]
+
+            dark = PALETTE.dorsal[i]
+            s.polygon(
+                ("scale", i),
+                base_l_x, base_l_y,
+                tip_x, tip_y,
+                base_r_x, base_r_y,
+                fill=dark, outline=PALETTE.dorsal_outline[i]
+            )
+
+    # ── Legs ──────────────────────────────────
+    def draw_legs(self):
+        liz = self.liz
+        s = self.dl
+
+        g = self.geo
+        walk_speed = clamp(liz.speed * 0.04, 0, 1)
+        atlas = s.atlas
+        toes, claws = self.lod["toes"], self.lod["claws"]
+
+        leg_side, leg_phase = liz.leg_side, liz.leg_phase
+        for li in range(len(leg_side)):
+            side = leg_side[li]
+            phase = leg_phase[li]
+
+            # Hip position + body angle geometry kernel se
+            hip_x = g.hip_x[li]
+            hip_y = g.hip_y[li]
+            body_ang = g.hip_ang[li]
+
+            # Leg spreads outward
+            leg_ang = body_ang + side * (math.pi / 2.3)
+
+            # Walk cycle
+            lift_cycle = math.sin(liz.t * 0.1 + phase)
+            fwd = math.cos(liz.t * 0.1 + phase) * 0.4
+
+            thigh_len = 28
+            shin_len = 26
+
+            # Knee
+            knee_ang = leg_ang + fwd
+            knee_x = hip_x + math.cos(knee_ang) * thigh_len
+            knee_y = hip_y + math.sin(knee_ang) * thigh_len
+
+            # Foot (with lift during walk)
+            foot_ang = knee_ang + fwd * 0.8
+            lift_amount = max(0, lift_cycle) * 14 * walk_speed
+            foot_x = knee_x + math.cos(foot_ang) * shin_len
+            foot_y = knee_y + math.sin(foot_ang) * shin_len - lift_amount
+
+            # Thigh
+            s.line(
+                ("thigh", li),
+                hip_x, hip_y, knee_x, knee_y,
+                fill="#2e4418", width=7, capstyle="round"
+            )
+            s.line(
+                ("thigh_hi", li),
+                hip_x, hip_y, knee_x, knee_y,
+                fill="#3d5820", width=4, capstyle="round"
+            )
+
+            # Shin
+            s.line(
+                ("shin", li),
+                knee_x, knee_y, foot_x, foot_y,
+                fill="#243010", width=5, capstyle="round"
+            )
+            s.line(
+                ("shin_hi", li),
+                knee_x, knee_y, foot_x, foot_y,
+                fill="#304018", width=3, capstyle="round"
+            )
+
+            # Foot — atlas ho to ek pre-rendered stamp
+            if atlas is not None:
+                name = atlas.foot(foot_ang, toes, claws)
+                s.image(("foot_stamp", li), foot_x, foot_y, image=name)
+            else:
+                foot_items(s, li, foot_x, foot_y, foot_ang, toes, claws)
+
+    # ── Head ──────────────────────────────────
+    def draw_head(self):
+        liz = self.liz
+        s = self.dl
+
+        spine = liz.pts
+        hx, hy = spine[0], spine[1]
+        j = 2 * seg_at(3)
+        h2x, h2y = spine[j], spine[j + 1]
+        head = self.head
+        head.set_scale(s.px_scale)
+        head.transform(hx, hy, math.atan2(h2y - hy, h2x - hx), liz.tongue_out)
+        part = head.part
+
+        # ── Head base polygon ──
+        s.polygon("head", part("outline"), fill="#5a7a3a", outline="#1e3010", width=1)
+
+        # Head shading (top slightly lighter)
+        s.polygon("head_shade", part("shade"), fill="#6b8c45", outline="")
+
+        # ── Snout ridge ──
+        s.line("ridge", part("ridge"), fill="#7a9c55", width=2)
+
+        # ── Nostrils ──
+        nose_l_x, nose_l_y, nose_r_x, nose_r_y = part("nostrils")
+        s.oval("nostril_l", nose_l_x-3, nose_l_y-2, nose_l_x+3, nose_l_y+2, fill="#1a2a08", outline="")
+        s.oval("nostril_r", nose_r_x-3, nose_r_y-2, nose_r_x+3, nose_r_y+2, fill="#1a2a08", outline="")
+
+        # ── Mouth line ──
+        s.line("mouth", part("mouth"), fill="#1a2a08", width=2)
+
+        # ── Eye socket + iris ──
+        eye_x, eye_y = part("eye")
+        if s.atlas is not None:
+            s.image("eye_stamp", eye_x, eye_y, image=s.atlas.get("eye", EYE_RADIUS, eye_items))
+        else:
+            eye_items(s, None, eye_x, eye_y)
+
+        # ── Pupil (vertical slit!) ──
+        blink_scale = 1.0 - liz.blink * 0.95
+        pupil_h = 6 * blink_scale
+        s.oval(
+            "pupil",
+            eye_x - 2, eye_y - pupil_h,
+            eye_x + 2, eye_y + pupil_h,
+            fill="#050200", outline=""
+        )
+
+        # ── Eye shine ──
+        if blink_scale > 0.3:
+            shine_x, shine_y = part("shine")
+            s.oval("shine", shine_x, shine_y, shine_x+3, shine_y+2, fill="#ffffff", outline="")
+
+        # ── Eyelid (blink) ──
+        if liz.blink > 0.05:
+            lid_h = int(8 * liz.blink)
+            s.rectangle(
+                "eyelid",
+                eye_x - 9, eye_y - 8,
+                eye_x + 9, eye_y - 8 + lid_h,
+                fill="#5a7a3a", outline=""
+            )
+
+        # ── Ear hole ──
+        ear_x, ear_y = part("ear")
+        s.oval("ear", ear_x-4, ear_y-4, ear_x+4, ear_y+4, fill="#1a2a08", outline="#0a1808")
+
+        # ── Dewlap (throat) ──
+        s.polygon("dewlap", part("dewlap"), fill="#c86432", outline="")
+
+        # ── Tongue ──
+        if liz.tongue_out > 0.05:
+            t_len = liz.tongue_out * 28
+            (tongue_base_x, tongue_base_y, tongue_tip_x, tongue_tip_y,
+             fl1x, fl1y, fr1x, fr1y) = part("tongue")
+
+            # Tongue body
+            s.line(
+                "tongue",
+                tongue_base_x, tongue_base_y,
+                tongue_tip_x, tongue_tip_y,
+                fill="#cc2222", width=3,
+                capstyle="round"
+            )
+
+            # Forked tips
+            if t_len > 10:
+                s.line(
+                    "fork_l",
+                    tongue_tip_x, tongue_tip_y, fl1x, fl1y,
+                    fill="#dd1111", width=2, capstyle="round"
+                )
+                s.line(
+                    "fork_r",
+                    tongue_tip_x, tongue_tip_y, fr1x, fr1y,
+                    fill="#dd1111", width=2, capstyle="round"
+                )
+
+    # ── Spots / Pattern ───────────────────────
+    def draw_spots(self):
+        liz = self.liz
+        s = self.dl
+
+        g = self.geo
+        atlas = s.atlas
+        for i, si, stamp, key in self.spot_keys():
+            ax = liz.pts[2 * si]
+            ay = liz.pts[2 * si + 1]
+            nx, ny = g.nx[si], g.ny[si]
+            w = g.widths[si]
+            offset = (i % 3 - 1) * w * 0.5
+
+            sx = ax + nx * offset
+            sy = ay + ny * offset
+
+            spot_r = w * 1.1
+
+            dark, light = PALETTE.spot_dark[si], PALETTE.spot_light[si]
+            if atlas is not None:
+                name = atlas.get(stamp, spot_r + 1, spot_items, spot_r, dark, light)
+                s.image(key, sx, sy, image=name)
+            else:
+                spot_items(s, i, sx, sy, spot_r, dark, light)
+
+    def spot_keys(self):
+        """(index, spine segment, stamp naam, op key) — SEGS pe cached"""
+        ck = ("spots", config.SEGS)
+        keys = self.stamp_keys.get(ck)
+        if keys is None:
+            keys = self.stamp_keys[ck] = tuple(
+                (i, seg_at(u), f"spot{i}", ("spot_stamp", i)) for i, u in enumerate(SPOT_POS)
+            )
+        return keys
+
+# ─────────────────────────────────────────
+#  BACKGROUND LAYER (static, cached)
+# ─────────────────────────────────────────
+
+class Background:
+    """
+    Beautiful dark ground texture — ek baar banta hai.
+    Tile shades seeded RNG se aate hain, isliye har run mein same floor.
+    Items "bg" tag ke saath sabse neeche rehte hain; har frame kuch nahi
+    hota, sirf resize ya seed/config change pe rebuild.
+    """
+
+    def __init__(self, canvas, seed=BG_SEED):
+        self.canvas = canvas
+        self.seed = seed
+        self.size = None          # (width, height) jis pe last build hua
+        self.view = (1.0, 0.0, 0.0)   # logical → device (k, ox, oy)
+
+    def set_view(self, view):
+        if view != self.view:
+            self.view = view
+            self.invalidate()
+
+    def invalidate(self):
+        """Config change ke baad agle frame pe rebuild karwao"""
+        self.size = None
+
+    def set_seed(self, seed):
+        self.seed = seed
+        self.invalidate()
+
+    def build(self, width, height):
+        """Zarurat ho to layer banao — True agar rebuild hua"""
+        if self.size == (width, height):
+            return False
+
+        c = self.canvas
+        c.delete("bg")
+        rng = random.Random(self.seed)
+        # Logical → device (resized window) — Tk `scale` line widths nahi badalta
+        k, ox, oy = self.view
+        shades = config.BG_TILE_SHADES     # build ke waqt padho (preset / config change)
+
+        # Base background
+        c.create_rectangle(0, 0, width, height, fill=config.BG_COLOR, outline="", tags="bg")
+
+        # Grid pattern (rock surface feel)
+        for row in range(0, height, 60):
+            for col in range(0, width, 80):
+                offset_x = (row // 60 % 2) * 40
+                shade = rng.choice(shades)
+                c.create_rectangle(
+                    col + offset_x, row,
+                    col + offset_x + 78, row + 58,
+                    fill=shade, outline="#0d0c06", width=k, tags="bg"
+                )
+
+        # Vignette (edges dark) — alpha sirf raster backend pe lagta hai
+        has_alpha = getattr(c, "supports_alpha", False)
+        for i in range(8):
+            alpha = 0.08 * (8 - i) / 8
+            extra = {"alpha": alpha * 4} if has_alpha else {}
+            c.create_rectangle(
+                i * 10, i * 10,
+                width - i * 10, height - i * 10,
+                fill="", outline="#050400",
+                width=12 * k, tags="bg", **extra
+            )
+
+        if (k, ox, oy) != (1.0, 0.0, 0.0):
+            c.scale("bg", 0, 0, k, k)
+            c.move("bg", ox, oy)
+
+        # Hamesha sabse neeche
+        c.tag_lower("bg")
+        self.size = (width, height)
+        return True
+
+# ─────────────────────────────────────────
+#  LEVEL OF DETAIL (frame-time budget)
+# ─────────────────────────────────────────
+
+# Level 0 = full detail; har agla level sasta
+#   stride   : body quads kitne segments pe ek (fewer spine samples)
+#   outlines : body edge lines
+#   toes     : 5 = alag toes, 1 = ek merged toe
+#   claws    : toe ke claw tips
+#   scales   : dorsal scales (har N-th; 0 = none)
+#   shadows  : shadow ellipses (har N-th; 0 = none)
+LOD_LEVELS = [
+    {"stride": 1, "outlines": True,  "toes": 5, "claws": True,  "scales": 1, "shadows": 1},
+    {"stride": 1, "outlines": False, "toes": 5, "claws": False, "scales": 1, "shadows": 2},
+    {"stride": 2, "outlines": False, "toes": 1, "claws": False, "scales": 2, "shadows": 2},
+    {"stride": 3, "outlines": False, "toes": 1, "claws": False, "scales": 0, "shadows": 0},
+]
+
+class LODController:
+    """
+    Measured frame cost ko budget se compare karke detail level chunta hai.
+    Hysteresis: budget ke upar jaane pe jaldi neeche (kam detail),
+    wapas upar tabhi jab kaafi der tak kaafi headroom ho.
+    """
+
+    def __init__(self, budget_ms=None, down_frames=10, up_frames=90,
+                 headroom=0.6, smoothing=0.1):
+        self.budget_ms = budget_ms if budget_ms is not None else 1000.0 / FPS * 0.8
+        self.down_frames = down_frames
+        self.up_frames = up_frames
+        self.headroom = headroom
+        self.smoothing = smoothing
+        self.level = 0
+        self.avg_ms = None
+        self.over = 0
+        self.under = 0
+        self.changes = 0
+
+    @property
+    def settings(self):
+        return LOD_LEVELS[self.level]
+
+    def observe(self, frame_ms):
+        """Ek frame ka cost do — current level return karta hai"""
+        if self.avg_ms is None:
+            self.avg_ms = frame_ms
+        else:
+            self.avg_ms += (frame_ms - self.avg_ms) * self.smoothing
+
+        if self.avg_ms > self.budget_ms:
+            self.over += 1
+            self.under = 0
+        elif self.avg_ms < self.budget_ms * self.headroom:
+            self.under += 1
+            self.over = 0
+        else:
+            self.over = self.under = 0
+
+        if self.over >= self.down_frames and self.level < len(LOD_LEVELS) - 1:
+            self.set_level(self.level + 1)
+        elif self.under >= self.up_frames and self.level > 0:
+            self.set_level(self.level - 1)
+        return self.level
+
+    def set_level(self, level):
+        level = clamp(level, 0, len(LOD_LEVELS) - 1)
+        if level == self.level:
+            return               # koi change nahi — hysteresis / flapping stats na badhein
+        self.level = level
+        self.over = self.under = 0
+        # Naya level naye cost pe judge ho
+        self.avg_ms = None
+        self.changes += 1
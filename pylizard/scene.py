@@ -0,0 +1,478 @@
+"""Retained scene (stable canvas items, dirty tracking) aur display list IR."""
+
+from array import array
+
+# ─────────────────────────────────────────
+#  RETAINED SCENE (stable canvas items)
+# ─────────────────────────────────────────
+
+IMAGE_EXTENT = {}                  # image (stamp) naam → logical (half-w, half-h) — atlas bharta hai
+
+def item_bbox(kind, coords, opts):
+    """Canvas item ka approx bounding box (x0, y0, x1, y1)"""
+    if kind == "image":
+        # Stamp center pe anchored (Tk ka default anchor)
+        rx, ry = IMAGE_EXTENT.get(opts.get("image"), (0.0, 0.0))
+        x, y = coords[0], coords[1]
+        return x - rx, y - ry, x + rx, y + ry
+    if kind == "text":
+        # Font metrics nahi hain — size se andaaza
+        font = opts.get("font") or ("Courier", 12)
+        size = font[1] if len(font) > 1 else 12
+        w = len(str(opts.get("text", ""))) * size * 0.62
+        h = size * 1.4
+        x, y = coords[0], coords[1]
+        if opts.get("anchor") == "nw":
+            return x, y, x + w, y + h
+        return x - w / 2, y - h / 2, x + w / 2, y + h / 2
+    xs = coords[0::2]
+    ys = coords[1::2]
+    pad = opts.get("width", 1) / 2 + 1
+    return min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad
+
+def union_box(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+def box_area(b):
+    return max(0.0, b[2] - b[0]) * max(0.0, b[3] - b[1])
+
+DIRTY_TILE = 32                    # dirty tracking grid (px)
+
+class DirtyRegion:
+    """
+    Frame ka repaint area — DIRTY_TILE ke tiles ka bitmap (har row ek int).
+    Ek bada union box lizard + UI text milke aadha screen ban jaata;
+    tiles se lambi diagonal lizard bhi sirf apna area gine.
+    """
+
+    def __init__(self, tile=DIRTY_TILE):
+        self.tile = tile
+        self.rows = {}           # tile row → column bitmask
+
+    def clear(self):
+        self.rows = {}
+
+    def add(self, box):
+        if box is None:
+            return
+        t = self.tile
+        tx0 = max(0, int(box[0] // t))
+        ty0 = max(0, int(box[1] // t))
+        tx1 = int(box[2] // t)
+        ty1 = int(box[3] // t)
+        if tx1 < tx0 or ty1 < ty0:
+            return
+        mask = ((1 << (tx1 - tx0 + 1)) - 1) << tx0
+        rows = self.rows
+        for ty in range(ty0, ty1 + 1):
+            rows[ty] = rows.get(ty, 0) | mask
+
+    def rects(self):
+        """Dirty tiles → rectangles (row runs, vertically merged)"""
+        t = self.tile
+        out = []
+        open_runs = {}           # (x0, x1) → rect index (pichhli row mein)
+        prev_ty = None
+        for ty in sorted(self.rows):
+            if prev_ty is not None and ty != prev_ty + 1:
+                open_runs = {}
+            bits = self.rows[ty]
+            runs = {}
+            tx = 0
+            while bits:
+                if bits & 1:
+                    start = tx
+                    while bits & 1:
+                        bits >>= 1
+                        tx += 1
+                    run = (start, tx)
+                    k = open_runs.get(run)
+                    if k is None:
+                        out.append([start * t, ty * t, tx * t, (ty + 1) * t])
+                        k = len(out) - 1
+                    else:
+                        out[k][3] = (ty + 1) * t
+                    runs[run] = k
+                else:
+                    bits >>= 1
+                    tx += 1
+            open_runs = runs
+            prev_ty = ty
+        return [tuple(r) for r in out]
+
+    @property
+    def bounds(self):
+        """Sab dirty tiles ka ek union box (ya None)"""
+        if not self.rows:
+            return None
+        t = self.tile
+        lo = min((b & -b).bit_length() - 1 for b in self.rows.values())
+        hi = max(b.bit_length() for b in self.rows.values())
+        return lo * t, min(self.rows) * t, hi * t, (max(self.rows) + 1) * t
+
+    def area(self, width, height):
+        t = self.tile
+        cols = (width + t - 1) // t
+        limit = (1 << cols) - 1
+        tiles = 0
+        for ty, bits in self.rows.items():
+            if ty * t < height:
+                tiles += (bits & limit).bit_count()
+        return tiles * t * t
+
+class Scene:
+    """
+    Retained-mode canvas layer.
+    Har visual element ka ek stable key hota hai — item sirf pehli baar
+    create hota hai, baad mein sirf coords/itemconfigure (woh bhi jab
+    value sach mein badli ho). Jo key is frame mein touch nahi hui
+    woh hide ho jaati hai, delete nahi.
+    Jo bhi badla uska purana + naya bbox `dirty` (DirtyRegion) mein jud
+    jaata hai — yahi frame ka repaint region hai.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.items = {}          # key → [item_id, coords, opts, visible, kind]
+        self.touched = set()
+        self.last_item = None
+        self.first_frame = True
+        self.ns = None           # key namespace (swarm mein lizard index)
+        self.view = None         # (k, ox, oy) logical → device; None = identity
+
+        # Per-frame counters
+        self.drawn = 0
+        self.created = 0
+        self.updated = 0
+        self.hidden = 0
+        self.dirty = DirtyRegion()   # is frame mein badla area
+
+    def begin(self):
+        """Naya frame shuru"""
+        self.touched = set()
+        self.last_item = None
+        self.drawn = 0
+        self.created = 0
+        self.updated = 0
+        self.hidden = 0
+        self.dirty.clear()
+
+    def mark_dirty(self, box):
+        self.dirty.add(box)
+
+    def set_view(self, k, ox=0.0, oy=0.0):
+        """Logical → device mapping (window resize) — saare items dobara bhejo"""
+        self.view = None if (k, ox, oy) == (1.0, 0.0, 0.0) else (k, ox, oy)
+        c = self.canvas
+        for entry in self.items.values():
+            item, coords, opts = entry[:3]
+            c.coords(item, *self.to_device(coords))
+            if "width" in opts:
+                c.itemconfigure(item, width=self.device_opts(opts)["width"])
+
+    def to_device(self, coords):
+        """Logical coords → canvas coords (scene mein logical hi store hote hain)"""
+        if self.view is None:
+            return coords
+        k, ox, oy = self.view
+        out = list(coords)
+        out[0::2] = [x * k + ox for x in coords[0::2]]
+        out[1::2] = [y * k + oy for y in coords[1::2]]
+        return out
+
+    def device_opts(self, opts):
+        if self.view is None or "width" not in opts:
+            return opts
+        opts = dict(opts)
+        opts["width"] = opts["width"] * self.view[0]
+        return opts
+
+    def dirty_fraction(self, width, height):
+        """Screen ka kitna hissa (0..1) is frame mein repaint hua"""
+        return min(1.0, self.dirty.area(width, height) / float(width * height))
+
+    def end(self):
+        """Frame khatam — untouched items hide karo"""
+        c = self.canvas
+        for key, entry in self.items.items():
+            if entry[3] and key not in self.touched:
+                c.itemconfigure(entry[0], state="hidden")
+                entry[3] = False
+                self.hidden += 1
+                self.mark_dirty(item_bbox(entry[4], entry[1], entry[2]))
+        self.first_frame = False
+
+    def draw(self, kind, key, coords, opts):
+        """Item create karo (pehli baar) ya sirf changed values update karo"""
+        c = self.canvas
+        if len(coords) == 1:
+            coords = coords[0]   # Tk jaisa: ek flat sequence bhi chalega
+        coords = tuple(coords)
+        if self.ns is not None:
+            key = (self.ns, key)
+        self.touched.add(key)
+        self.drawn += 1
+        entry = self.items.get(key)
+
+        if entry is None:
+            item = getattr(c, "create_" + kind)(*self.to_device(coords), **self.device_opts(opts))
+            # Beech mein naya item aaya to z-order sahi jagah rakho
+            if not self.first_frame and self.last_item is not None:
+                c.tag_raise(item, self.last_item)
+            self.items[key] = [item, coords, dict(opts), True, kind]
+            self.created += 1
+            self.mark_dirty(item_bbox(kind, coords, opts))
+            self.last_item = item
+            return item
+
+        item, old_coords, old_opts, visible, kind = entry
+        old_box = item_bbox(kind, old_coords, old_opts) if visible else None
+        changed = False
+        if coords != old_coords:
+            c.coords(item, *self.to_device(coords))
+            entry[1] = coords
+            changed = True
+
+        diff = {k: v for k, v in opts.items() if old_opts.get(k) != v}
+        if not visible:
+            diff["state"] = "normal"
+            entry[3] = True
+        if diff:
+            c.itemconfigure(item, **self.device_opts(diff))
+            old_opts.update(diff)
+            old_opts.pop("state", None)
+            changed = True
+
+        if changed:
+            self.updated += 1
+            self.mark_dirty(union_box(old_box, item_bbox(kind, coords, old_opts)))
+        self.last_item = item
+        return item
+
+    def apply(self, dl):
+        """
+        DisplayList ke ops canvas pe. Jo op pichhle frame jaisa hi hai
+        uska item sirf touch hota hai (coords/opts compare bhi nahi).
+        """
+        f = dl.cur
+        items = self.items
+        touched = self.touched
+        for i in range(f.n):
+            key = dl.keys[f.kid[i]]
+            entry = items.get(key)
+            if entry is not None and entry[3] and not f.changed[i]:
+                touched.add(key)
+                self.drawn += 1
+                self.last_item = entry[0]
+                continue
+            kind, key, coords, opts = dl.op(i)
+            self.draw(kind, key, coords, opts)
+
+    def oval(self, key, *coords, **opts):
+        return self.draw("oval", key, coords, opts)
+
+    def rectangle(self, key, *coords, **opts):
+        return self.draw("rectangle", key, coords, opts)
+
+    def polygon(self, key, *coords, **opts):
+        return self.draw("polygon", key, coords, opts)
+
+    def line(self, key, *coords, **opts):
+        return self.draw("line", key, coords, opts)
+
+    def text(self, key, *coords, **opts):
+        return self.draw("text", key, coords, opts)
+
+    def image(self, key, *coords, **opts):
+        return self.draw("image", key, coords, opts)
+
+# ─────────────────────────────────────────
+#  DISPLAY LIST (renderer → backends)
+# ─────────────────────────────────────────
+
+OP_KINDS = ("polygon", "line", "oval", "rectangle", "text", "image")
+OP_CODE = {kind: i for i, kind in enumerate(OP_KINDS)}
+
+class StyleTable:
+    """Draw options interned — op sirf style index rakhta hai"""
+
+    def __init__(self):
+        self.index = {}
+        self.styles = []         # index → opts dict (read-only maana jaata hai)
+
+    def intern(self, opts):
+        key = tuple(opts.items())
+        i = self.index.get(key)
+        if i is None:
+            i = len(self.styles)
+            self.index[key] = i
+            self.styles.append(dict(opts))
+        return i
+
+class DisplayFrame:
+    """Ek frame ke ops — flat arrays, frames ke beech reuse hote hain"""
+
+    __slots__ = ("n", "nc", "op", "kid", "style", "start", "count",
+                 "changed", "coords", "slot")
+
+    def __init__(self):
+        self.n = 0               # ops
+        self.nc = 0              # coords used
+        self.op = array("B")
+        self.kid = array("I")    # key id
+        self.style = array("I")
+        self.start = array("I")  # coords offset
+        self.count = array("I")
+        self.changed = array("B")
+        self.coords = array("d")
+        self.slot = array("i")   # key id → op index (-1 = is frame mein nahi)
+
+    def reset(self):
+        slot = self.slot
+        kid = self.kid
+        for i in range(self.n):
+            slot[kid[i]] = -1
+        self.n = 0
+        self.nc = 0
+
+class DisplayList:
+    """
+    Renderer ka output: har frame draw ops ki compact list (op code,
+    coords, interned style) stable keys ke saath. Do frames (cur/prev)
+    ke buffers baari baari reuse hote hain; end() pichhle frame se diff
+    karke `changed` flags set karta hai — backends sirf wahi apply karein.
+    Emit API Scene jaisa hi hai (oval/line/polygon/..., ns).
+    """
+
+    def __init__(self, styles=None):
+        self.styles = styles or StyleTable()
+        self.key_ids = {}
+        self.keys = []           # key id → key
+        self.ns = None
+        self.supports_alpha = False  # backend alpha samajhta hai to True
+        self.px_scale = 1.0          # device px per logical unit — curve tessellation detail
+        self.atlas = None            # StampAtlas — backend images samajhta hai to set hota hai
+        self.cur = DisplayFrame()
+        self.prev = DisplayFrame()
+        self.drawn = 0
+        self.changed = 0
+
+    def begin(self):
+        self.prev, self.cur = self.cur, self.prev
+        self.cur.reset()
+        self.drawn = 0
+
+    def draw(self, kind, key, coords, opts):
+        if len(coords) == 1:
+            coords = coords[0]   # Tk jaisa: ek flat sequence bhi chalega
+        k = len(coords)
+        buf, nc = self.reserve(k)
+        # C-level copy (lambi curves ke liye); array('d') seedha
+        buf[nc:nc + k] = coords if type(coords) is array else array("d", coords)
+        self.emit(kind, key, k, opts)
+
+    def reserve(self, k):
+        """
+        Agle op ke k coords ki jagah → (buffer, offset). Renderer seedha
+        wahan likhe aur phir emit() — frame buffers reuse hote hain, beech
+        mein koi list / tuple nahi banta.
+        """
+        f = self.cur
+        nc = f.nc
+        buf = f.coords
+        if nc + k > len(buf):
+            buf.frombytes(bytes(8 * (nc + k - len(buf))))
+        return buf, nc
+
+    def emit(self, kind, key, k, opts):
+        """reserve() wale buffer mein likhe k coords ka op"""
+        if self.ns is not None:
+            key = (self.ns, key)
+        kid = self.key_ids.get(key)
+        if kid is None:
+            kid = len(self.keys)
+            self.key_ids[key] = kid
+            self.keys.append(key)
+            self.cur.slot.append(-1)
+            self.prev.slot.append(-1)
+        f = self.cur
+        i = f.n
+        nc = f.nc
+        style = self.styles.intern(opts)
+        if i < len(f.op):
+            f.op[i] = OP_CODE[kind]
+            f.kid[i] = kid
+            f.style[i] = style
+            f.start[i] = nc
+            f.count[i] = k
+            f.changed[i] = 1
+        else:
+            f.op.append(OP_CODE[kind])
+            f.kid.append(kid)
+            f.style.append(style)
+            f.start.append(nc)
+            f.count.append(k)
+            f.changed.append(1)
+        f.slot[kid] = i
+        f.n = i + 1
+        f.nc = nc + k
+        self.drawn += 1
+
+    def end(self):
+        """Pichhle frame se diff — same key ka op, style, coords sab same = unchanged"""
+        cur, prev = self.cur, self.prev
+        pslot = prev.slot
+        # memoryview slices — compare bina coords copy kiye (views yahin khatam)
+        cc, pc = memoryview(cur.coords), memoryview(prev.coords)
+        changed = 0
+        for i in range(cur.n):
+            j = pslot[cur.kid[i]]
+            k = cur.count[i]
+            same = (j >= 0 and cur.op[i] == prev.op[j] and cur.style[i] == prev.style[j]
+                    and k == prev.count[j])
+            if same:
+                a = cur.start[i]
+                b = prev.start[j]
+                same = cc[a:a + k] == pc[b:b + k]
+            cur.changed[i] = not same
+            changed += not same
+        cc.release()
+        pc.release()
+        self.changed = changed
+
+    def removed(self):
+        """Pichhle frame ke keys jo is frame mein nahi aaye"""
+        cur, prev = self.cur, self.prev
+        for i in range(prev.n):
+            kid = prev.kid[i]
+            if cur.slot[kid] < 0:
+                yield self.keys[kid]
+
+    def op(self, i):
+        """Op i → (kind, key, coords, opts)"""
+        f = self.cur
+        a = f.start[i]
+        return (OP_KINDS[f.op[i]], self.keys[f.kid[i]],
+                tuple(f.coords[a:a + f.count[i]]), self.styles.styles[f.style[i]])
+
+    def oval(self, key, *coords, **opts):
+        self.draw("oval", key, coords, opts)
+
+    def rectangle(self, key, *coords, **opts):
+        self.draw("rectangle", key, coords, opts)
+
+    def polygon(self, key, *coords, **opts):
+        self.draw("polygon", key, coords, opts)
+
+    def line(self, key, *coords, **opts):
+        self.draw("line", key, coords, opts)
+
+    def text(self, key, *coords, **opts):
+        self.draw("text", key, coords, opts)
+
+    def image(self, key, *coords, **opts):
+        self.draw("image", key, coords, opts)
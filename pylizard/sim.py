@@ -0,0 +1,773 @@
+"""Simulation — Lizard physics, swarm, frame scheduler, input trace, latency."""
+
+import math
+import random
+import struct
+from array import array
+
+from . import config
+from .compat import HAS_NUMPY, np
+from .config import FPS, HEIGHT, MAX_CATCHUP, SIM_HZ, WIDTH
+from .util import clamp, dist, follow_factor, link_scale, ref_pos, seg_at, wave_gain
+
+# ─────────────────────────────────────────
+#  LIZARD CLASS
+# ─────────────────────────────────────────
+
+# Leg positions (pre-computed) — parallel arrays: spine segment (SEGS_REF scale pe), side, walk phase
+LEG_SEG = (10, 10, 22, 22)                     # front-left, front-right, back-left, back-right
+LEG_SIDE = (-1.0, 1.0, -1.0, 1.0)
+LEG_PHASE = (0.0, math.pi, math.pi, 0.0)
+
+class Lizard:
+    """
+    Physics state. Spine ek flat array('d') mein (x0, y0, x1, y1, ...) —
+    update in-place chalta hai, har step naye lists/tuples nahi banate.
+    """
+
+    __slots__ = ("rng", "pts", "prev_pts", "tongue_out", "tongue_dir", "tongue_speed",
+                 "t", "speed", "leg_seg", "leg_side", "leg_phase", "blink", "blink_timer",
+                 "follow", "follow_k", "wave_gain", "wave_pos", "wave_y", "snap")
+
+    def __init__(self, start_x, start_y, rng=None):
+        # Apna RNG (seeded ho to run reproducible)
+        self.rng = rng if rng is not None else random.Random()
+        rng = self.rng
+
+        # Spine: SEGS points, flat (x, y)
+        self.pts = array("d", (start_x, start_y) * config.SEGS)
+
+        # Tongue state
+        self.tongue_out = 0.0
+        self.tongue_dir = 1
+        self.tongue_speed = rng.uniform(0.03, 0.07)
+
+        # Time counter
+        self.t = 0.0
+
+        # Speed tracker (for walk cycle)
+        self.speed = 0.0
+
+        # Legs
+        self.leg_seg = array("i", (seg_at(u) for u in LEG_SEG))
+        self.leg_side = array("d", LEG_SIDE)
+        self.leg_phase = array("d", LEG_PHASE)
+
+        # Blink
+        self.blink = 0.0
+        self.blink_timer = rng.uniform(2, 5)
+
+        # Per-segment follow factors — dt (k) badle tabhi dobara
+        self.follow = array("d", bytes(8 * config.SEGS))
+        self.follow_k = None
+        self.wave_gain = array("d", (wave_gain(i) for i in range(config.SEGS)))
+        self.wave_pos = array("d", (ref_pos(i) for i in range(config.SEGS)))   # wave phase (SEGS-independent)
+        self.wave_y = 0.3 * link_scale()
+
+        # Pichhle sim step ki spine (render interpolation ke liye)
+        self.prev_pts = array("d", self.pts)
+        self.snap = None         # interpolated() ka reused snapshot
+
+    def update(self, mouse_x, mouse_y, dt):
+        """
+        Physics update — mouse ke peeche aata hai.
+        Constants SIM_DT step ke liye tuned hain; doosre dt pe
+        k = dt / SIM_DT se scale hote hain (lerps exponentially).
+        """
+        pts = self.pts
+        self.prev_pts[:] = pts
+        self.t += dt * 50
+        t = self.t
+        k = dt * SIM_HZ
+
+        # Head smoothly follows mouse
+        head_f = 1 - (1 - 0.12) ** k
+        pts[0] += (mouse_x - pts[0]) * head_f
+        pts[1] += (mouse_y - pts[1]) * head_f
+
+        # Speed calculate karo
+        self.speed = dist(pts[0], pts[1], mouse_x, mouse_y)
+        wave_amp = clamp(self.speed * 0.04, 0.2, 3.5) * k
+
+        follow = self.follow
+        if k != self.follow_k:
+            self.follow_k = k
+            for i in range(len(follow)):
+                follow[i] = 1 - (1 - follow_factor(i)) ** k
+
+        # Chain follow with wave
+        gain = self.wave_gain
+        pos = self.wave_pos
+        gain_y = self.wave_y
+        sin = math.sin
+        cos = math.cos
+        for i in range(1, len(follow)):
+            j = 2 * i
+            u = pos[i]
+            wave_x = sin(t * 0.12 - u * 0.22) * wave_amp * gain[i]
+            wave_y = cos(t * 0.10 - u * 0.18) * wave_amp * gain_y
+            f = follow[i]
+            pts[j] += (pts[j - 2] - pts[j]) * f + wave_x
+            pts[j + 1] += (pts[j - 1] - pts[j + 1]) * f + wave_y
+
+        # Tongue update
+        self.tongue_out += self.tongue_dir * self.tongue_speed * k
+        if self.tongue_out >= 1.0:
+            self.tongue_out = 1.0
+            self.tongue_dir = -1
+        elif self.tongue_out <= 0.0:
+            self.tongue_out = 0.0
+            # Random pause before next flick
+            self.tongue_dir = 1 if self.rng.random() > 0.3 else 0
+            self.tongue_speed = self.rng.uniform(0.03, 0.08)
+
+        # Blink timer
+        self.blink_timer -= dt
+        if self.blink_timer <= 0:
+            self.blink = 1.0
+            self.blink_timer = self.rng.uniform(3, 7)
+        if self.blink > 0:
+            self.blink -= dt * 8
+            self.blink = max(0, self.blink)
+
+    def get_normals(self, i):
+        """Segment i ke normal vector (perpendicular)"""
+        pts = self.pts
+        j = 2 * i
+        if j + 2 < len(pts):
+            dx = pts[j + 2] - pts[j]
+            dy = pts[j + 3] - pts[j + 1]
+        else:
+            dx = pts[j] - pts[j - 2]
+            dy = pts[j + 1] - pts[j - 1]
+        length = math.hypot(dx, dy) or 1
+        return -dy / length, dx / length  # nx, ny
+
+    def interpolated(self, alpha):
+        """
+        Pichhle aur current sim step ke beech ki state (alpha: 0..1).
+        Ek hi snapshot object har frame reuse hota hai — agle call tak
+        valid; alag rakhna ho (export) to snapshot() lo.
+        """
+        snap = self.snap
+        if snap is None or len(snap.pts) != len(self.pts):
+            snap = self.snap = LizardSnapshot(self)
+        snap.fill(self, alpha)
+        return snap
+
+    def snapshot(self):
+        """Current state ki apni copy (worker process / trace ke liye)"""
+        snap = LizardSnapshot(self)
+        snap.fill(self, 1.0)
+        return snap
+
+class LizardSnapshot:
+    """Render ke liye ek frame ki lizard state (Lizard jaisa interface)"""
+    __slots__ = ("pts", "t", "speed", "tongue_out", "blink", "leg_seg", "leg_side", "leg_phase")
+
+    def __init__(self, liz):
+        self.pts = array("d", liz.pts)
+        self.leg_seg = liz.leg_seg
+        self.leg_side = liz.leg_side
+        self.leg_phase = liz.leg_phase
+
+    def fill(self, liz, alpha=1.0):
+        """Lizard ki state is buffer mein copy (alpha < 1 = pichhle step se lerp)"""
+        pts = self.pts
+        if alpha >= 1.0:
+            pts[:] = liz.pts
+        else:
+            cur, prev = liz.pts, liz.prev_pts
+            for j in range(len(pts)):
+                p = prev[j]
+                pts[j] = p + (cur[j] - p) * alpha
+        self.t = liz.t
+        self.speed = liz.speed
+        self.tongue_out = liz.tongue_out
+        self.blink = liz.blink
+
+# ─────────────────────────────────────────
+#  FRAME SCHEDULER (fixed timestep)
+# ─────────────────────────────────────────
+
+class FrameScheduler:
+    """
+    Fixed-timestep simulation + adaptive frame pacing.
+    advance() batata hai kitne SIM_DT steps chalane hain (catch-up capped)
+    aur render interpolation ka alpha; next_delay() measured frame cost
+    dekh ke agla `after` delay nikalta hai taaki real FPS target pe rahe.
+    """
+
+    def __init__(self, sim_hz=SIM_HZ, target_fps=FPS, max_steps=MAX_CATCHUP):
+        self.step = 1.0 / sim_hz
+        self.frame_time = 1.0 / target_fps
+        self.max_steps = max_steps
+        self.acc = 0.0
+        self.last = None
+        self.deadline = None
+        self.dropped = 0.0        # load ki wajah se chhoda gaya sim time
+
+    def advance(self, now):
+        """(steps, alpha) — is frame mein kitne sim steps aur interpolation"""
+        if self.last is None:
+            self.last = now
+            self.deadline = now
+            return 1, 1.0
+        elapsed = now - self.last
+        self.last = now
+
+        self.acc += elapsed
+        steps = int(self.acc / self.step)
+        if steps > self.max_steps:
+            # Spiral of death se bacho — baaki time chhod do
+            self.dropped += (steps - self.max_steps) * self.step
+            self.acc -= (steps - self.max_steps) * self.step
+            steps = self.max_steps
+        self.acc -= steps * self.step
+        return steps, self.acc / self.step
+
+    def set_rate(self, fps, now):
+        """Target FPS badlo (idle throttle) — deadline abhi se, purana backlog nahi"""
+        self.frame_time = 1.0 / fps
+        self.deadline = now
+
+    def next_delay(self, now):
+        """Frame render hone ke baad — agle frame tak kitne ms (min 1)"""
+        self.deadline += self.frame_time
+        if now - self.deadline > self.frame_time:
+            # Bahut peeche hain — schedule reset (graceful degrade)
+            self.deadline = now
+        return max(1, int(round((self.deadline - now) * 1000)))
+
+class IdleDetector:
+    """
+    Settled state: pointer `still_s` se nahi hila aur spine ka koi point
+    pichhle frame se `move_px` se zyada nahi khiska — bas idle wave,
+    tongue aur blink bache hain. Tab App kam FPS pe chalta hai; pointer
+    hilte hi (Motion event ya replay mein position badli) wapas full rate.
+    """
+
+    def __init__(self, still_s=None, move_px=None):
+        self.still_s = config.IDLE_AFTER_S if still_s is None else still_s
+        self.move_px = config.IDLE_MOVE_PX if move_px is None else move_px
+        self.prev = array("d")       # pichhle frame ki spine (x0, y0, x1, ...)
+        self.fresh = False           # prev is run ka hai (pointer hilne ke baad bhara)
+        self.px = self.py = None
+        self.still_since = None
+        self.idle = False
+        self.idles = 0               # kitni baar idle mein gaye
+
+    def wake(self, now):
+        """Pointer hila — True agar idle se nikle (App turant frame maange)"""
+        self.still_since = now
+        self.fresh = False
+        was = self.idle
+        self.idle = False
+        return was
+
+    def settled(self, pts):
+        """Har point ka per-frame displacement threshold se kam? (pts flat x, y; prev in-place)"""
+        prev = self.prev
+        if len(prev) != len(pts):
+            self.prev = prev = array("d", bytes(8 * len(pts)))
+            self.fresh = False
+        still = self.fresh
+        limit = self.move_px
+        for j in range(len(pts)):
+            v = pts[j]
+            if still and abs(v - prev[j]) > limit:
+                still = False
+            prev[j] = v
+        self.fresh = True
+        return still
+
+    def observe(self, mouse_x, mouse_y, pts, now):
+        """Har frame ke baad — idle hai ya nahi"""
+        if mouse_x != self.px or mouse_y != self.py or self.still_since is None:
+            self.px, self.py = mouse_x, mouse_y
+            self.wake(now)
+            return False
+        if self.idle or now - self.still_since < self.still_s:
+            return self.idle
+        if self.settled(pts):
+            self.idle = True
+            self.idles += 1
+        return self.idle
+
+# ─────────────────────────────────────────
+#  SWARM ENGINE (bahut saari lizards)
+# ─────────────────────────────────────────
+
+AVOID_RADIUS = 60                  # itne paas aaye to ek doosre ko dhakka
+AVOID_STRENGTH = 2.5
+
+class SpatialHash:
+    """
+    Uniform grid — har cell mein un heads ke indices jo usme hain.
+    Neighbour search sirf 3x3 cells mein, isliye cost ~linear rehti hai.
+    """
+
+    def __init__(self, cell):
+        self.cell = cell
+        self.cells = {}
+
+    def rebuild(self, xs, ys):
+        cell = self.cell
+        cells = {}
+        for k in range(len(xs)):
+            key = (int(xs[k] // cell), int(ys[k] // cell))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [k]
+            else:
+                bucket.append(k)
+        self.cells = cells
+
+    def pairs(self):
+        """Har candidate pair (a, b) sirf ek baar — half neighbourhood"""
+        cells = self.cells
+        for (cx, cy), bucket in cells.items():
+            n = len(bucket)
+            for a in range(n):
+                for b in range(a + 1, n):
+                    yield bucket[a], bucket[b]
+            for ox, oy in ((1, -1), (1, 0), (1, 1), (0, 1)):
+                other = cells.get((cx + ox, cy + oy))
+                if other:
+                    for a in bucket:
+                        for b in other:
+                            yield a, b
+
+def avoidance(xs, ys, grid, radius=AVOID_RADIUS, strength=AVOID_STRENGTH):
+    """Heads ke beech repulsion — (push_x, push_y) lists"""
+    n = len(xs)
+    push_x = [0.0] * n
+    push_y = [0.0] * n
+    grid.rebuild(xs, ys)
+    for a, b in grid.pairs():
+        dx = xs[a] - xs[b]
+        dy = ys[a] - ys[b]
+        d = math.hypot(dx, dy)
+        if d >= radius:
+            continue
+        if d == 0:
+            # Bilkul upar — index se fixed direction (deterministic)
+            dx, dy, d = (1.0 if a < b else -1.0), 0.0, 1.0
+        f = (radius - d) / radius * strength / d
+        push_x[a] += dx * f
+        push_y[a] += dy * f
+        push_x[b] -= dx * f
+        push_y[b] -= dy * f
+    return push_x, push_y
+
+class SwarmView:
+    """Swarm ki ek lizard — LizardRenderer ke liye Lizard jaisa interface"""
+
+    __slots__ = ("pts", "t", "speed", "tongue_out", "blink", "leg_seg", "leg_side", "leg_phase")
+
+    def __init__(self, swarm, k):
+        self.pts = swarm.pts_of(k)
+        self.t = swarm.t[k]
+        self.speed = swarm.speed[k]
+        self.tongue_out = swarm.tongue_out[k]
+        self.blink = swarm.blink[k]
+        self.leg_seg = swarm.leg_seg
+        self.leg_side = swarm.leg_side
+        self.leg_phase = swarm.leg_phase
+
+class LizardSwarm:
+    """
+    Hazaaron lizards ek saath — structure-of-arrays.
+    Saari spines ek contiguous array('d') mein (count * segs * 2),
+    baaki state (tongue, blink, speed, t) per-lizard arrays mein.
+    NumPy ho to zero-copy views pe batched step, warna plain loops.
+    Physics Lizard.update jaisi hi hai, plus neighbour avoidance.
+    """
+
+    def __init__(self, count, start_x, start_y, seed=None, segs=None, spread=200, use_numpy=None):
+        self.count = count
+        self.segs = config.SEGS if segs is None else segs
+        self.use_numpy = HAS_NUMPY if use_numpy is None else (use_numpy and HAS_NUMPY)
+        self.rng = random.Random(seed)
+        self.grid = SpatialHash(AVOID_RADIUS)
+        rng = self.rng
+
+        # Spines: [k][i][x, y] flat
+        self.spines = array('d', bytes(8 * count * self.segs * 2))
+        for k in range(count):
+            x = start_x + rng.uniform(-spread, spread)
+            y = start_y + rng.uniform(-spread, spread)
+            base = k * self.segs * 2
+            for i in range(self.segs):
+                self.spines[base + 2 * i] = x
+                self.spines[base + 2 * i + 1] = y
+
+        def col(fn):
+            return array('d', [fn() for _ in range(count)])
+
+        self.tongue_out = col(lambda: 0.0)
+        self.tongue_dir = col(lambda: 1.0)
+        self.tongue_speed = col(lambda: rng.uniform(0.03, 0.07))
+        self.t = col(lambda: rng.uniform(0, 100))   # wave phase alag alag
+        self.speed = col(lambda: 0.0)
+        self.blink = col(lambda: 0.0)
+        self.blink_timer = col(lambda: rng.uniform(2, 5))
+
+        self.leg_seg = array("i", (seg_at(u, self.segs) for u in LEG_SEG))
+        self.leg_side = array("d", LEG_SIDE)
+        self.leg_phase = array("d", LEG_PHASE)
+
+        # Per-segment constants — follow factors dt (k) badle tabhi dobara
+        self.follow = [follow_factor(i, self.segs) for i in range(self.segs)]
+        self.follow_k = 1.0
+        self.wave_gain = [wave_gain(i, self.segs) for i in range(self.segs)]
+        self.wave_pos = [ref_pos(i, self.segs) for i in range(self.segs)]
+        self.wave_y = 0.3 * link_scale(self.segs)
+
+        if self.use_numpy:
+            self._bind_numpy()
+
+    def _bind_numpy(self):
+        """array('d') buffers pe zero-copy NumPy views"""
+        n, segs = self.count, self.segs
+        self.P = np.frombuffer(self.spines, dtype=float).reshape(n, segs, 2)
+        for name in ("tongue_out", "tongue_dir", "tongue_speed", "t",
+                     "speed", "blink", "blink_timer"):
+            setattr(self, "np_" + name, np.frombuffer(getattr(self, name), dtype=float))
+        pos = np.array(self.wave_pos)
+        self.np_wave_gain = np.array(self.wave_gain)
+        self.np_wave_x_off = pos * 0.22
+        self.np_wave_y_off = pos * 0.18
+
+    # ── Accessors ─────────────────────────
+    def heads(self):
+        """Saare heads — (xs, ys) lists"""
+        stride = self.segs * 2
+        return list(self.spines[0::stride]), list(self.spines[1::stride])
+
+    def pts_of(self, k):
+        """Lizard k ki spine (flat x, y) — shared buffer ka zero-copy memoryview"""
+        stride = self.segs * 2
+        return memoryview(self.spines)[k * stride:(k + 1) * stride]
+
+    def view(self, k):
+        return SwarmView(self, k)
+
+    def visible(self, x0, y0, x1, y1, margin=80):
+        """Screen rect se overlap karne wali lizards ke indices"""
+        x0 -= margin
+        y0 -= margin
+        x1 += margin
+        y1 += margin
+        if self.use_numpy:
+            P = self.P
+            lo = P.min(axis=1)
+            hi = P.max(axis=1)
+            mask = (hi[:, 0] >= x0) & (lo[:, 0] <= x1) & (hi[:, 1] >= y0) & (lo[:, 1] <= y1)
+            return np.nonzero(mask)[0].tolist()
+        out = []
+        stride = self.segs * 2
+        sp = self.spines
+        for k in range(self.count):
+            xs = sp[k * stride:(k + 1) * stride:2]
+            ys = sp[k * stride + 1:(k + 1) * stride:2]
+            if max(xs) >= x0 and min(xs) <= x1 and max(ys) >= y0 and min(ys) <= y1:
+                out.append(k)
+        return out
+
+    # ── Physics ───────────────────────────
+    def step(self, targets_x, targets_y, dt):
+        """
+        Poori population ek batched step mein aage badhao. Constants
+        Lizard.update ki tarah SIM_DT ke liye tuned hain, k = dt / SIM_DT
+        se scale (tick rate badalne pe motion same).
+        """
+        k = dt * SIM_HZ
+        if k != self.follow_k:
+            self.follow_k = k
+            self.follow = [1 - (1 - follow_factor(i, self.segs)) ** k for i in range(self.segs)]
+        hx, hy = self.heads()
+        push_x, push_y = avoidance(hx, hy, self.grid)
+        if self.use_numpy:
+            self._step_numpy(targets_x, targets_y, push_x, push_y, dt, k)
+        else:
+            self._step_python(targets_x, targets_y, push_x, push_y, dt, k)
+        self._step_timers(dt)
+
+    def _step_numpy(self, targets_x, targets_y, push_x, push_y, dt, k):
+        P = self.P
+        t = self.np_t
+        t += dt * 50
+
+        tx = np.asarray(targets_x, dtype=float)
+        ty = np.asarray(targets_y, dtype=float)
+        head = P[:, 0]
+        head_f = 1 - (1 - 0.12) ** k
+        head[:, 0] += (tx - head[:, 0]) * head_f + np.asarray(push_x) * k
+        head[:, 1] += (ty - head[:, 1]) * head_f + np.asarray(push_y) * k
+
+        speed = self.np_speed
+        speed[:] = np.hypot(tx - head[:, 0], ty - head[:, 1])
+        amp = np.clip(speed * 0.04, 0.2, 3.5) * k
+
+        # Wave terms: (count, segs) ek saath
+        wave_x = np.sin(t[:, None] * 0.12 - self.np_wave_x_off) * amp[:, None] * self.np_wave_gain
+        wave_y = np.cos(t[:, None] * 0.10 - self.np_wave_y_off) * amp[:, None] * self.wave_y
+
+        # Chain follow — segment order sequential, lizards parallel
+        follow = self.follow
+        for i in range(1, self.segs):
+            prev = P[:, i - 1]
+            cur = P[:, i]
+            f = follow[i]
+            cur[:, 0] += (prev[:, 0] - cur[:, 0]) * f + wave_x[:, i]
+            cur[:, 1] += (prev[:, 1] - cur[:, 1]) * f + wave_y[:, i]
+
+        # Tongue
+        out = self.np_tongue_out
+        out += self.np_tongue_dir * self.np_tongue_speed * k
+        full = out >= 1.0
+        out[full] = 1.0
+        self.np_tongue_dir[full] = -1.0
+
+    def _step_python(self, targets_x, targets_y, push_x, push_y, dt, k):
+        sp = self.spines
+        segs = self.segs
+        stride = segs * 2
+        follow = self.follow
+        gain = self.wave_gain
+        pos = self.wave_pos
+        gain_y = self.wave_y
+        head_f = 1 - (1 - 0.12) ** k
+        for n in range(self.count):
+            t = self.t[n] + dt * 50
+            self.t[n] = t
+            base = n * stride
+            tx = targets_x[n]
+            ty = targets_y[n]
+
+            sp[base] += (tx - sp[base]) * head_f + push_x[n] * k
+            sp[base + 1] += (ty - sp[base + 1]) * head_f + push_y[n] * k
+            speed = math.hypot(tx - sp[base], ty - sp[base + 1])
+            self.speed[n] = speed
+            amp = clamp(speed * 0.04, 0.2, 3.5) * k
+
+            for i in range(1, segs):
+                j = base + 2 * i
+                u = pos[i]
+                wave_x = math.sin(t * 0.12 - u * 0.22) * amp * gain[i]
+                wave_y = math.cos(t * 0.10 - u * 0.18) * amp * gain_y
+                sp[j] += (sp[j - 2] - sp[j]) * follow[i] + wave_x
+                sp[j + 1] += (sp[j - 1] - sp[j + 1]) * follow[i] + wave_y
+
+            out = self.tongue_out[n] + self.tongue_dir[n] * self.tongue_speed[n] * k
+            if out >= 1.0:
+                out = 1.0
+                self.tongue_dir[n] = -1.0
+            self.tongue_out[n] = out
+
+    def _step_timers(self, dt):
+        """Random events (tongue pause, blink) — RNG sirf fire hui lizards pe"""
+        rng = self.rng
+        if self.use_numpy:
+            out = self.np_tongue_out
+            empty = np.nonzero(out <= 0.0)[0]
+            out[empty] = 0.0
+            timer = self.np_blink_timer
+            timer -= dt
+            fired = np.nonzero(timer <= 0)[0]
+            self.np_blink[fired] = 1.0
+            blink = self.np_blink
+            np.maximum(blink - dt * 8, 0.0, out=blink)
+            empty = empty.tolist()
+            fired = fired.tolist()
+        else:
+            out = self.tongue_out
+            timer = self.blink_timer
+            blink = self.blink
+            empty = []
+            fired = []
+            for k in range(self.count):
+                if out[k] <= 0.0:
+                    out[k] = 0.0
+                    empty.append(k)
+                timer[k] -= dt
+                if timer[k] <= 0:
+                    blink[k] = 1.0
+                    fired.append(k)
+                if blink[k] > 0:
+                    blink[k] = max(0.0, blink[k] - dt * 8)
+
+        # Random pause before next flick
+        for k in empty:
+            self.tongue_dir[k] = 1.0 if rng.random() > 0.3 else 0.0
+            self.tongue_speed[k] = rng.uniform(0.03, 0.08)
+        for k in fired:
+            self.blink_timer[k] = rng.uniform(3, 7)
+
+# ─────────────────────────────────────────
+#  INPUT TRACE (record / replay)
+# ─────────────────────────────────────────
+
+TRACE_MAGIC = b"LZTR"
+TRACE_VERSION = 2
+TRACE_HEADER = struct.Struct("<4sHq")     # magic, version, seed
+TRACE_SAMPLE = struct.Struct("<dIdd")     # wall time, sim step, x, y (logical, fractional)
+TRACE_SAMPLES = {1: struct.Struct("<dIff"), TRACE_VERSION: TRACE_SAMPLE}   # v1: float32 x, y
+
+class InputTrace:
+    """
+    Mouse samples + RNG seed — compact binary trace.
+    Har sample ke saath wall-clock time aur woh sim step jisse pehle
+    woh aaya tha, taaki replay bilkul same steps pe same input de.
+    """
+
+    def __init__(self, seed):
+        self.seed = seed
+        self.samples = []         # (t, step, x, y)
+
+    def add(self, t, step, x, y):
+        self.samples.append((t, step, x, y))
+
+    @property
+    def steps(self):
+        """Trace kitne sim steps tak chalta hai"""
+        return self.samples[-1][1] + 1 if self.samples else 0
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, self.seed))
+            for sample in self.samples:
+                f.write(TRACE_SAMPLE.pack(*sample))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed = TRACE_HEADER.unpack_from(data, 0)
+        if magic != TRACE_MAGIC or version not in TRACE_SAMPLES:
+            raise ValueError(f"{path}: lizard input trace nahi hai")
+        trace = cls(seed)
+        trace.samples = list(TRACE_SAMPLES[version].iter_unpack(data[TRACE_HEADER.size:]))
+        return trace
+
+    def mouse_path(self, steps=None):
+        """Har sim step ka mouse position — [(x, y), ...]"""
+        player = TracePlayer(self)
+        return [player.at(step) for step in range(steps or self.steps)]
+
+class TracePlayer:
+    """Trace ko step-by-step padhna — at(step) us step ka mouse deta hai"""
+
+    def __init__(self, trace):
+        self.samples = trace.samples
+        self.i = 0
+        self.x, self.y = (self.samples[0][2:] if self.samples else (WIDTH // 2, HEIGHT // 2))
+
+    @property
+    def done(self):
+        return self.i >= len(self.samples)
+
+    def at(self, step):
+        samples = self.samples
+        while self.i < len(samples) and samples[self.i][1] <= step:
+            self.x, self.y = samples[self.i][2:]
+            self.i += 1
+        return self.x, self.y
+
+# ─────────────────────────────────────────
+#  LATENCY + POINTER PREDICTION
+# ─────────────────────────────────────────
+
+class LatencyHistogram:
+    """
+    Input → present latency (ms), fixed-width bins. Har input sample
+    sirf pehli baar gina jaata hai jab koi frame use dikhata hai —
+    mouse ruka ho to latency badhti nahi rehti.
+    """
+
+    def __init__(self, bin_ms=2.0, bins=50):
+        self.bin_ms = bin_ms
+        self.counts = array("I", bytes(4 * bins))   # aakhri bin = overflow
+        self.samples = 0
+        self.total = 0.0
+        self.last_input = None
+
+    def frame(self, input_t, present_t):
+        """Frame present hua — input_t: us frame mein use hua newest input"""
+        if input_t is None or input_t == self.last_input:
+            return
+        self.last_input = input_t
+        ms = (present_t - input_t) * 1000
+        self.counts[min(int(ms / self.bin_ms), len(self.counts) - 1)] += 1
+        self.samples += 1
+        self.total += ms
+
+    def percentile(self, p):
+        """Bin ka upper edge jahan tak p% samples aa gaye"""
+        if not self.samples:
+            return 0.0
+        need = self.samples * p / 100
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= need:
+                return (i + 1) * self.bin_ms
+        return len(self.counts) * self.bin_ms
+
+    def summary(self):
+        last = max((i for i, c in enumerate(self.counts) if c), default=-1)
+        return {
+            "samples": self.samples,
+            "mean_ms": round(self.total / self.samples, 3) if self.samples else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "bin_ms": self.bin_ms,
+            "counts": list(self.counts[:last + 1]),
+        }
+
+class PointerPredictor:
+    """
+    Pointer kahan hoga — last few samples ki velocity (least squares)
+    se horizon_ms aage extrapolate. Time sim clock ka hai (replay /
+    benchmark deterministic). Purane (stale) samples pe last position.
+    """
+
+    def __init__(self, horizon_ms=0, window=4, stale_ms=100, max_speed=5000):
+        self.horizon = horizon_ms / 1000
+        self.window = window
+        self.stale = stale_ms / 1000
+        self.max_speed = max_speed   # px/s — jitter se bahut door na jaaye
+        self.samples = []            # (t, x, y)
+
+    def add(self, t, x, y):
+        """Naya sample (same position dobara aaye to ignore)"""
+        samples = self.samples
+        if samples and samples[-1][1] == x and samples[-1][2] == y:
+            return
+        samples.append((t, x, y))
+        if len(samples) > self.window:
+            del samples[0]
+
+    def predict(self, t):
+        """t + horizon pe predicted (x, y)"""
+        samples = self.samples
+        lt, lx, ly = samples[-1]
+        if self.horizon <= 0 or len(samples) < 2 or t - lt > self.stale:
+            return lx, ly
+        n = len(samples)
+        mt = sum(s[0] for s in samples) / n
+        mx = sum(s[1] for s in samples) / n
+        my = sum(s[2] for s in samples) / n
+        var = sum((s[0] - mt) ** 2 for s in samples)
+        if var <= 0:
+            return lx, ly
+        vx = sum((s[0] - mt) * (s[1] - mx) for s in samples) / var
+        vy = sum((s[0] - mt) * (s[2] - my) for s in samples) / var
+        speed = math.hypot(vx, vy)
+        if speed > self.max_speed:
+            vx *= self.max_speed / speed
+            vy *= self.max_speed / speed
+        ahead = t - lt + self.horizon
+        return lx + vx * ahead, ly + vy * ahead
@@ -0,0 +1,119 @@
+"""Simulation worker thread aur lock-free triple buffer."""
+
+import threading
+import time
+
+from .config import IDLE_FPS, SIM_HZ
+from .geometry import SpineGeometry
+from .sim import LizardSnapshot
+
+# ─────────────────────────────────────────
+#  SIMULATION THREAD (Tk loop se alag)
+# ─────────────────────────────────────────
+
+class SimFrame:
+    """Ek published sim state: snapshot + uski precomputed geometry"""
+    __slots__ = ("snap", "geo", "step", "time", "input_t")
+
+    def __init__(self):
+        self.snap = None
+        self.geo = SpineGeometry()
+        self.step = 0
+        self.time = 0.0
+        self.input_t = None      # is state mein use hua newest input sample
+
+class TripleBuffer:
+    """
+    Lock-free triple buffer (single writer, single reader). Slot index
+    ka har read/write ek attribute assignment hai — GIL mein atomic.
+    Writer kabhi `latest` ya `reading` wala slot nahi likhta; reader
+    `reading` set karke dobara check karta hai ki woh abhi bhi latest hai.
+    """
+
+    def __init__(self, slots):
+        self.slots = slots
+        self.latest = -1         # sabse naya published slot
+        self.reading = -1        # reader jis slot ko use kar raha hai
+        self.back = 0            # writer ka slot
+        self.published = 0
+
+    def write_slot(self):
+        return self.slots[self.back]
+
+    def publish(self):
+        self.latest = self.back
+        self.published += 1
+        busy = (self.latest, self.reading)
+        self.back = next(i for i in range(len(self.slots)) if i not in busy)
+
+    def read(self):
+        """Latest published slot (ya None) — agle read tak valid"""
+        while True:
+            i = self.latest
+            if i < 0:
+                return None
+            self.reading = i
+            if self.latest == i:
+                return self.slots[i]
+
+class SimulationThread(threading.Thread):
+    """
+    Worker thread: app.step_simulation + geometry apne tick rate pe,
+    har tick ek SimFrame TripleBuffer mein publish. Tk thread sirf
+    latest frame padh ke draw karta hai.
+
+    App idle throttle mein ho (`app.throttled`) to worker bhi kam jaagta
+    hai — har wake pe kai SIM_DT steps, ek publish. app.wake() → wake().
+    """
+
+    def __init__(self, app, hz=SIM_HZ, record_ticks=False):
+        super().__init__(name="lizard-sim", daemon=True)
+        self.app = app
+        self.dt = 1.0 / hz
+        self.idle_steps = max(1, round(hz / IDLE_FPS))
+        self.buffer = TripleBuffer([SimFrame() for _ in range(3)])
+        self.stop_event = threading.Event()
+        self.wake_event = threading.Event()
+        self.tick_ms = [] if record_ticks else None   # har tick ka cost — sirf benchmark maange to
+
+    def run(self):
+        clock = time.perf_counter
+        app = self.app
+        next_t = clock()
+        while not self.stop_event.is_set():
+            t0 = clock()
+            steps = self.idle_steps if app.throttled else 1
+            for _ in range(steps):
+                app.step_simulation(self.dt)
+            liz = app.lizard
+            frame = self.buffer.write_slot()
+            # Spine copy (slot ka apna buffer) — worker agle tick mein lizard badal dega
+            if frame.snap is None or len(frame.snap.pts) != len(liz.pts):
+                frame.snap = LizardSnapshot(liz)
+            frame.snap.fill(liz)
+            frame.geo.compute(frame.snap)
+            frame.step = app.sim_step
+            frame.time = t0
+            frame.input_t = app.input_t
+            self.buffer.publish()
+            t1 = clock()
+            if self.tick_ms is not None:
+                self.tick_ms.append((t1 - t0) * 1000)
+
+            next_t += self.dt * steps
+            if next_t < t1:
+                next_t = t1      # peeche reh gaye — catch-up nahi, skip
+            elif self.wake_event.wait(next_t - t1):
+                self.wake_event.clear()
+                next_t = clock() # idle se jaage — agla tick abhi
+
+    def wake(self):
+        """Idle sleep se turant bahar (Tk thread se)"""
+        self.wake_event.set()
+
+    def stop(self, timeout=1.0):
+        """Thread band karke join (ESC / window close)"""
+        self.stop_event.set()
+        self.wake_event.set()
+        if self.is_alive():
+            self.join(timeout)
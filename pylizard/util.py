@@ -0,0 +1,142 @@
+"""Chhote math / color helpers aur body width profile."""
+
+import math
+
+from . import config
+
+# ─────────────────────────────────────────
+#  UTILITY FUNCTIONS
+# ─────────────────────────────────────────
+
+def lerp(a, b, t):
+    """Do numbers ke beech smooth interpolation"""
+    return a + (b - a) * t
+
+def clamp(v, mn, mx):
+    """Value ko range mein rakhna"""
+    return max(mn, min(mx, v))
+
+def dist(ax, ay, bx, by):
+    """Do points ke beech distance"""
+    return math.hypot(bx - ax, by - ay)
+
+def angle_between(ax, ay, bx, by):
+    """Do points ke beech angle"""
+    return math.atan2(by - ay, bx - ax)
+
+def polar_to_xy(cx, cy, angle, radius):
+    """Center se angle aur radius pe point nikalna"""
+    return cx + math.cos(angle) * radius, cy + math.sin(angle) * radius
+
+def rotate_point(px, py, cx, cy, angle):
+    """Point ko center ke around rotate karna"""
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    px -= cx
+    py -= cy
+    return cx + px * cos_a - py * sin_a, cy + px * sin_a + py * cos_a
+
+def hex_to_rgb(hex_color):
+    """#rrggbb → (r, g, b)"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+def rgb_to_hex(r, g, b):
+    """(r,g,b) → #rrggbb"""
+    r = int(clamp(r, 0, 255))
+    g = int(clamp(g, 0, 255))
+    b = int(clamp(b, 0, 255))
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+def blend_color(c1_hex, c2_hex, t):
+    """Do colors ke beech blend (0=c1, 1=c2)"""
+    r1, g1, b1 = hex_to_rgb(c1_hex)
+    r2, g2, b2 = hex_to_rgb(c2_hex)
+    return rgb_to_hex(
+        lerp(r1, r2, t),
+        lerp(g1, g2, t),
+        lerp(b1, b2, t)
+    )
+
+def darken(hex_color, amount=0.3):
+    """Color ko dark karna"""
+    r, g, b = hex_to_rgb(hex_color)
+    return rgb_to_hex(r * (1 - amount), g * (1 - amount), b * (1 - amount))
+
+def lighten(hex_color, amount=0.3):
+    """Color ko light karna"""
+    r, g, b = hex_to_rgb(hex_color)
+    return rgb_to_hex(
+        r + (255 - r) * amount,
+        g + (255 - g) * amount,
+        b + (255 - b) * amount
+    )
+
+def alpha_blend(bg_hex, fg_hex, alpha):
+    """Alpha blending (0=transparent, 1=opaque)"""
+    return blend_color(bg_hex, fg_hex, alpha)
+
+def percentile(sorted_vals, p):
+    """Linear-interpolated percentile (p: 0..100)"""
+    if not sorted_vals:
+        return 0.0
+    k = (len(sorted_vals) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_vals) - 1)
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (k - lo)
+
+# ─────────────────────────────────────────
+#  BODY PROFILE (SEGS-independent)
+# ─────────────────────────────────────────
+# Proportions SEGS_REF segments pe likhe hain; u = segment i ki us scale
+# pe position (head 0, tail tip SEGS_REF - 1 — t = i / (SEGS - 1) jaisa),
+# isliye low / ultra presets pe bhi wahi head → hips → tail.
+
+def ref_pos(i, segs=None):
+    """Segment i → reference (SEGS_REF) scale pe position"""
+    return i * (config.SEGS_REF - 1) / ((segs or config.SEGS) - 1)
+
+def seg_at(u, segs=None):
+    """Reference position u → current SEGS ka nearest segment"""
+    return round(u * ((segs or config.SEGS) - 1) / (config.SEGS_REF - 1))
+
+def link_scale(segs=None):
+    """Ek link reference link se kitna lamba (kam SEGS = lamba)"""
+    return (config.SEGS_REF - 1) / ((segs or config.SEGS) - 1)
+
+def body_width(i):
+    """
+    Har segment ki width define karta hai:
+    head → neck → belly → hips → tail
+    """
+    u = ref_pos(i)
+    if u < 3:
+        return lerp(8, 20, u / 3)          # Head build-up
+    elif u < 7:
+        return lerp(20, 13, (u-3) / 4)     # Neck taper
+    elif u < 15:
+        return lerp(13, 18, (u-7) / 8)     # Shoulder expand
+    elif u < 30:
+        return lerp(18, 20, (u-15) / 15)   # Belly (widest)
+    elif u < 40:
+        return lerp(20, 11, (u-30) / 10)   # Hip taper
+    elif u < 50:
+        return lerp(11, 5, (u-40) / 10)    # Tail start
+    else:
+        return lerp(5, 0.8, (u-50) / (config.SEGS_REF-50))  # Tail tip
+
+def follow_factor(i, segs=None):
+    """
+    Segment i apne aage wale ki taraf har SIM_DT step kitna khiskta hai.
+    Steady chal mein link gap ~ v(1-f)/f; kam SEGS pe gap link_scale
+    guna lamba taaki poori lizard ki lambai same rahe.
+    """
+    r = link_scale(segs)
+    f = max(0.07, 0.28 - ref_pos(i, segs) * 0.002)
+    if r == 1:
+        return f
+    return f / (f + r * (1 - f))
+
+def wave_gain(i, segs=None):
+    """Body wave ka per-link gain — head ke paas halka, link lambai ke hisaab se"""
+    return (0.2 if ref_pos(i, segs) < 8 else 1.0) * link_scale(segs)
@@ -0,0 +1,86 @@
+"""Steady state (warm-up ke baad) sim step + renderer — heap na badhe, transient ~0."""
+
+import gc
+import os
+import statistics
+import tracemalloc
+
+import pytest
+
+import pylizard
+from pylizard.app import App
+from pylizard.backends import RecordingCanvas
+from pylizard.bench import bench_mouse
+from pylizard.compat import HAS_NUMPY
+from pylizard.config import SIM_DT
+from pylizard.render import LOD_LEVELS
+
+WARMUP = 60
+FRAMES = 120
+
+# Ek call ke andar peak transient heap (bytes), frames ka median — cache
+# bharne wale ikka-dukka frames (naya curve steps count) nahi gine jaate.
+# NumPy view headers + metrics spans ~2 KiB hain (pure path ~1 KiB); per-frame
+# list / array / f-string copies waapas aaye to budget tootega.
+PEAK_BUDGET = {"update": 512, "render": 3072 if HAS_NUMPY else 1536}
+# N frames ke baad hot loop ke bache hue naye blocks — per-frame leak ho to
+# >= FRAMES. Bounded caches (naye foot angles ke styles, float attributes)
+# kuch blocks lete hain. Sirf woh allocations jinke stack mein sim / render hai
+# (RecordingCanvas apna op log rakhta hai, woh is budget mein nahi).
+GROWTH_BLOCKS = FRAMES // 2
+HOT_LOOP = [tracemalloc.Filter(True, os.path.join(os.path.dirname(pylizard.__file__), name),
+                               all_frames=True)
+            for name in ("sim.py", "render.py")]
+
+@pytest.fixture
+def app():
+    with App(canvas=RecordingCanvas(), seed=0) as app:
+        app.lod.set_level(0)
+        if app.atlas is not None:
+            app.atlas.prebuild(LOD_LEVELS[0])   # saare foot angles — stamp cache aage na bhare
+        for f in range(WARMUP):
+            frame(app, f)
+        yield app
+
+def frame(app, f):
+    app.mouse = bench_mouse(f)
+    app.step_simulation(SIM_DT)
+    app.draw_frame()
+
+def traced(peaks, name, fn):
+    """fn ko wrap karo — har call ka peak transient `peaks[name]` list mein"""
+    def wrapper(*args):
+        tracemalloc.reset_peak()
+        cur0 = tracemalloc.get_traced_memory()[0]
+        fn(*args)
+        peaks[name].append(tracemalloc.get_traced_memory()[1] - cur0)
+    return wrapper
+
+def test_hot_loop_transient_allocations(app):
+    peaks = {"update": [], "render": []}
+    app.step_simulation = traced(peaks, "update", app.step_simulation)
+    app.renderer.render = traced(peaks, "render", app.renderer.render)
+    tracemalloc.start()
+    try:
+        for f in range(WARMUP, WARMUP + FRAMES):
+            frame(app, f)
+    finally:
+        tracemalloc.stop()
+    medians = {name: statistics.median(values) for name, values in peaks.items()}
+    over = {name: v for name, v in medians.items() if v > PEAK_BUDGET[name]}
+    assert not over, (over, PEAK_BUDGET)
+
+def test_steady_state_frames_do_not_grow_heap(app):
+    tracemalloc.start(12)
+    try:
+        gc.collect()
+        before = tracemalloc.take_snapshot().filter_traces(HOT_LOOP)
+        for f in range(WARMUP, WARMUP + FRAMES):
+            frame(app, f)
+        gc.collect()
+        after = tracemalloc.take_snapshot().filter_traces(HOT_LOOP)
+    finally:
+        tracemalloc.stop()
+    growth = after.compare_to(before, "traceback")
+    blocks = sum(stat.count_diff for stat in growth)
+    assert blocks <= GROWTH_BLOCKS, ["\n".join(stat.traceback.format()[-4:]) for stat in growth[:3]]
@@ -0,0 +1,51 @@
+"""Offline export — har frame apni state, worker count se output same."""
+
+import pytest
+
+from pylizard.export import export_svg, export_video, simulate_path
+
+FRAMES = 6
+
+def read_frames(out_dir, ext):
+    return [p.read_bytes() for p in sorted(out_dir.glob(f"frame_*.{ext}"))]
+
+def test_simulate_path_frames_own_their_state():
+    frames = simulate_path(FRAMES)
+    first, last = frames[0], frames[-1]
+    assert first is not last
+    assert first.pts is not last.pts
+    assert list(first.pts) != list(last.pts)
+
+def test_svg_frames_differ(tmp_path):
+    export_svg(tmp_path, frames=FRAMES, width=192, height=108)
+    out = read_frames(tmp_path, "svg")
+    assert len(out) == FRAMES
+    assert out[0] != out[-1]
+
+def test_png_frames_differ_and_match_across_workers(tmp_path):
+    pytest.importorskip("numpy")
+    one, two = tmp_path / "one", tmp_path / "two"
+    export_video(one, frames=FRAMES, width=192, height=108, workers=1)
+    export_video(two, frames=FRAMES, width=192, height=108, workers=2)
+    a, b = read_frames(one, "png"), read_frames(two, "png")
+    assert len(a) == FRAMES
+    assert a[0] != a[-1]
+    assert a == b
+
+@pytest.fixture
+def low_preset():
+    from pylizard import config
+    saved = config.PRESET, config.BODY_MODE
+    config.apply_preset("low")
+    yield
+    config.apply_preset(saved[0])
+    config.BODY_MODE = saved[1]
+
+def test_spawn_workers_follow_the_preset(tmp_path, monkeypatch, low_preset):
+    pytest.importorskip("numpy")
+    import multiprocessing
+    one, two = tmp_path / "one", tmp_path / "two"
+    export_video(one, frames=4, width=192, height=108, workers=1)
+    monkeypatch.setattr(multiprocessing, "Pool", multiprocessing.get_context("spawn").Pool)
+    export_video(two, frames=4, width=192, height=108, workers=2)
+    assert read_frames(one, "png") == read_frames(two, "png")
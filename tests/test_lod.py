@@ -0,0 +1,14 @@
+"""LODController — sirf asli level change gine jaate hain."""
+
+from pylizard.render import LOD_LEVELS, LODController
+
+def test_same_level_is_not_a_change():
+    lod = LODController(budget_ms=10)
+    lod.set_level(0)
+    assert lod.changes == 0
+    lod.set_level(2)
+    lod.set_level(2)
+    assert (lod.level, lod.changes) == (2, 1)
+    lod.set_level(len(LOD_LEVELS) + 3)      # clamp → last level
+    lod.set_level(len(LOD_LEVELS) - 1)
+    assert lod.changes == 2
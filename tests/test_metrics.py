@@ -0,0 +1,23 @@
+"""MetricsRegistry — gc callback App ke saath hi jaaye (bench / perf runs mein jama na ho)."""
+
+import gc
+
+from pylizard.bench import run_benchmark
+from pylizard.metrics import MetricsRegistry
+from pylizard.perf import frame_allocations
+
+def test_close_detaches_gc_callback():
+    before = len(gc.callbacks)
+    reg = MetricsRegistry()
+    assert len(gc.callbacks) == before + 1
+    reg.close()
+    reg.close()
+    assert len(gc.callbacks) == before
+
+def test_headless_runs_do_not_leak_gc_callbacks():
+    before = len(gc.callbacks)
+    for _ in range(2):
+        run_benchmark(frames=10, warmup=2, lod=0)
+        run_benchmark(frames=10, warmup=2, threaded=True)
+        frame_allocations(frames=5, warmup=2)
+    assert len(gc.callbacks) == before
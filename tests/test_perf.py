@@ -0,0 +1,55 @@
+"""Perf budgets — perf_baseline.json se compare (wahi jo `--perf-check` karta hai)."""
+
+import compileall
+import json
+import os
+
+import pytest
+
+import pylizard
+from pylizard import config, perf
+from pylizard.importtime import check_import_budget
+
+BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        config.PERF_BASELINE)
+
+@pytest.fixture(scope="module")
+def baseline():
+    metrics = perf.load_baseline(BASELINE).get(perf.render_path())
+    if metrics is None:
+        pytest.skip(f"{perf.render_path()} ki perf baseline nahi hai — "
+                    "`python -m pylizard --perf-check --perf-update`")
+    return metrics
+
+@pytest.fixture(scope="module")
+def measured():
+    metrics, info = perf.collect(timing=False)    # items + allocations (deterministic)
+    return metrics
+
+def test_metrics_within_baseline(measured, baseline):
+    failures = perf.compare(measured, baseline, config.PERF_TOLERANCE)
+    assert not failures, json.dumps(failures, indent=2)
+
+def test_baseline_covers_measured_metrics(measured, baseline):
+    # Naya metric aaya to baseline refresh karo, warna woh kabhi check nahi hoga
+    expected = [key for key in baseline if not key.startswith("update_rel.")]
+    assert sorted(measured) == sorted(expected)
+    assert {f"update_rel.segs{segs}" for segs in perf.UPDATE_SEGS} <= set(baseline)
+
+@pytest.mark.timing
+def test_update_cost_within_baseline(baseline):
+    metrics = {f"update_rel.segs{segs}": perf.update_cost(segs)[1] for segs in perf.UPDATE_SEGS}
+    failures = perf.compare(metrics, baseline, config.PERF_TOLERANCE)
+    assert not failures, json.dumps(failures, indent=2)
+
+def test_compare_flags_regression(baseline):
+    worse = {key: value * 2 + 10 for key, value in baseline.items()}
+    flagged = {f["metric"] for f in perf.compare(worse, baseline, config.PERF_TOLERANCE)}
+    assert flagged == set(baseline)
+
+@pytest.mark.timing
+def test_headless_import_budget():
+    # Budget .pyc load ka hai, compile ka nahi (PYTHONDONTWRITEBYTECODE pe bhi)
+    compileall.compile_dir(os.path.dirname(pylizard.__file__), quiet=1)
+    result = check_import_budget()
+    assert result["ok"], json.dumps({m: result["modules"][m] for m in result["failures"]})
@@ -0,0 +1,27 @@
+"""Presets — SEGS badalne pe bhi body proportions (tail tip, legs, spots) same."""
+
+import random
+
+import pytest
+
+from pylizard import config
+from pylizard.config import PRESETS
+from pylizard.geometry import width_table
+from pylizard.sim import Lizard
+
+@pytest.fixture(params=sorted(PRESETS))
+def preset(request):
+    saved = config.PRESET
+    config.apply_preset(request.param)
+    yield request.param
+    config.apply_preset(saved)
+
+def test_tail_tapers_to_a_tip(preset):
+    widths = width_table()
+    assert widths[-1] < 1.5
+    assert max(widths) == pytest.approx(20, abs=0.5)
+
+def test_legs_sit_at_the_same_body_fraction(preset):
+    liz = Lizard(500, 500, rng=random.Random(0))
+    fractions = [s / config.SEGS for s in liz.leg_seg]
+    assert fractions == pytest.approx([10 / 60, 10 / 60, 22 / 60, 22 / 60], abs=0.02)
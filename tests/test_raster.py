@@ -0,0 +1,26 @@
+"""Raster backend — dirty tiles alag repaint hote hain, beech ka area nahi."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pylizard.raster import RasterBackend
+
+def test_separate_dirty_tiles_repaint_only_themselves():
+    backend = RasterBackend(None, 320, 180)
+    backend.build(320, 180)
+    c = backend.raster
+    left = c.create_oval(10, 10, 30, 30, fill="#ff0000", outline="")
+    right = c.create_oval(280, 140, 300, 160, fill="#00ff00", outline="")
+    backend.present(None)                          # pehla frame — poora
+
+    c.coords(left, 12, 10, 32, 30)
+    c.coords(right, 278, 140, 298, 160)
+    tiles = [(0, 0, 64, 64), (256, 128, 320, 180)]
+    backend.present(tiles)
+    assert c.blits == tiles
+    assert backend.repainted == pytest.approx((64 * 64 + 64 * 52) / (320 * 180))
+
+    partial = c.buf.copy()
+    c.render(backend.base)                         # full repaint se match
+    assert (partial == c.buf).all()
@@ -0,0 +1,50 @@
+"""SimulationThread — idle throttle mein kam wake-ups, tick log sirf maangne pe."""
+
+import random
+import time
+
+from pylizard.config import SIM_DT
+from pylizard.sim import Lizard
+from pylizard.threads import SimulationThread
+
+class FakeApp:
+    def __init__(self, throttled):
+        self.lizard = Lizard(500, 500, rng=random.Random(0))
+        self.throttled = throttled
+        self.sim_step = 0
+        self.input_t = None
+
+    def step_simulation(self, dt):
+        self.sim_step += 1
+        self.lizard.update(900, 600, dt)
+
+def run(app, seconds=0.4, **kw):
+    thread = SimulationThread(app, **kw)
+    thread.start()
+    time.sleep(seconds)
+    thread.stop()
+    return thread
+
+def test_tick_log_is_opt_in():
+    assert run(FakeApp(False), 0.05).tick_ms is None
+    assert run(FakeApp(False), 0.05, record_ticks=True).tick_ms
+
+def test_throttled_worker_batches_steps():
+    app = FakeApp(True)
+    thread = run(app)
+    published = thread.buffer.published
+    assert app.sim_step == published * thread.idle_steps
+    assert published < 0.4 / SIM_DT / 2
+
+def test_wake_breaks_idle_sleep():
+    app = FakeApp(True)
+    thread = SimulationThread(app)
+    thread.start()
+    time.sleep(0.05)
+    before = thread.buffer.published
+    app.throttled = False
+    thread.wake()
+    time.sleep(0.15)
+    thread.stop()
+    assert not thread.is_alive()
+    assert thread.buffer.published - before >= 5     # full rate pe ~9, idle pe ~2
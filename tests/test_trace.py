@@ -0,0 +1,75 @@
+"""Input trace — fractional (resized window) pointer bhi bit-exact replay ho."""
+
+import random
+
+from pylizard.config import SIM_DT
+from pylizard.sim import InputTrace, Lizard, TracePlayer
+
+STEPS = 120
+
+def pointer(step):
+    # Letterboxed / resized window: logical = (event.x - ox) / k, fractional
+    k, ox = 1.37, 11.0
+    return (400 + 3 * step - ox) / k, (300 + 2 * step) / k
+
+def run(seed, path):
+    liz = Lizard(500, 500, rng=random.Random(seed))
+    for x, y in path:
+        liz.update(x, y, SIM_DT)
+    return list(liz.pts)
+
+def test_fractional_pointer_replays_bit_exact(tmp_path):
+    trace = InputTrace(seed=5)
+    for step in range(STEPS):
+        trace.add(step * SIM_DT, step, *pointer(step))
+    trace.save(tmp_path / "run.trace")
+
+    loaded = InputTrace.load(tmp_path / "run.trace")
+    assert loaded.seed == 5
+    assert loaded.samples == trace.samples
+
+    player = TracePlayer(loaded)
+    replayed = [player.at(step) for step in range(STEPS)]
+    assert run(5, replayed) == run(5, [pointer(step) for step in range(STEPS)])
+
+class Motion:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+def racy_app(**kw):
+    """Har step ke beech (mouse padh liya, sim_step abhi nahi badha) ek Motion event"""
+    from pylizard.app import App
+
+    class RacyApp(App):
+        racing = False
+
+        @property
+        def mouse_t(self):
+            if self.racing:             # step_simulation input_t ke liye padhta hai
+                self.racing = False
+                self.on_mouse_move(Motion(*pointer(self.sim_step)))
+                self.racing = True
+            return self._mouse_t
+
+        @mouse_t.setter
+        def mouse_t(self, value):
+            self._mouse_t = value
+
+    return RacyApp(**kw)
+
+def test_record_keeps_input_the_step_used(tmp_path):
+    from pylizard.app import App
+    from pylizard.backends import RecordingCanvas
+
+    path = tmp_path / "live.trace"
+    with racy_app(canvas=RecordingCanvas(), seed=7, record=str(path)) as live:
+        live.racing = True
+        for _ in range(STEPS):
+            live.step_simulation(SIM_DT)
+        live.racing = False
+        expected = list(live.lizard.pts)
+
+    with App(canvas=RecordingCanvas(), replay=InputTrace.load(path)) as replay:
+        for _ in range(STEPS):
+            replay.step_simulation(SIM_DT)
+        assert list(replay.lizard.pts) == expected